@@ -0,0 +1,99 @@
+"""Measures the per request cost of a bare *GET* request through :func:`RestItApp.__call__`.
+
+The handler uses neither headers, query parameters nor the body, like most of the *GET* endpoints do. The environment
+carries the headers a browser would send.
+
+Run it from the repository root::
+
+    python -m benchmark.bare_get_benchmark
+
+With ``--baseline``, the timings are compared to a request that parses its headers, query parameters, forwarded
+information and body when it is created, like before they were parsed lazily. The application creates that eager
+request instead of :class:`Request` for the baseline.
+"""
+
+import argparse
+import timeit
+from io import BytesIO
+from unittest import mock
+
+from restit import Request, Resource, Response, RestItApp
+from restit.decorator import path
+
+NUMBER = 20000
+
+
+@path("/health")
+class HealthResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response("ok")
+
+
+class EagerRequest(Request):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # the properties cache what they parse, the handler does not pay for them again
+        _ = self.headers, self.query_parameters, self.forwarded, self.body
+
+
+def create_wsgi_environment() -> dict:
+    return {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/health",
+        "QUERY_STRING": "",
+        "CONTENT_LENGTH": "",
+        "CONTENT_TYPE": "",
+        "wsgi.input": BytesIO(b""),
+        "wsgi.url_scheme": "http",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "8080",
+        "HTTP_HOST": "localhost:8080",
+        "HTTP_USER_AGENT": "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/115.0",
+        "HTTP_ACCEPT": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "HTTP_ACCEPT_LANGUAGE": "en-US,en;q=0.5",
+        "HTTP_ACCEPT_ENCODING": "gzip, deflate, br",
+        "HTTP_CONNECTION": "keep-alive",
+        "HTTP_COOKIE": "session=3c1e5a0f6e0b4f2c9c4f0a1d; theme=dark",
+        "HTTP_UPGRADE_INSECURE_REQUESTS": "1",
+        "HTTP_CACHE_CONTROL": "max-age=0",
+    }
+
+
+def benchmark_request_construction(request_class: type = Request) -> float:
+    """Returns the mean time to construct a :class:`Request` in microseconds"""
+    wsgi_environments = [create_wsgi_environment() for _ in range(NUMBER)]
+    wsgi_environments_iterator = iter(wsgi_environments)
+    return timeit.timeit(lambda: request_class(next(wsgi_environments_iterator), {}), number=NUMBER) / NUMBER * 1e6
+
+
+def benchmark_bare_get(request_class: type = Request) -> float:
+    """Returns the mean time of a bare *GET* request through the application in microseconds"""
+    restit_app = RestItApp(resources=[HealthResource()])
+    wsgi_environments = [create_wsgi_environment() for _ in range(NUMBER)]
+    wsgi_environments_iterator = iter(wsgi_environments)
+
+    def call():
+        restit_app(next(wsgi_environments_iterator), lambda status, headers: None)
+
+    with mock.patch("restit.restit_app.Request", request_class):
+        return timeit.timeit(call, number=NUMBER) / NUMBER * 1e6
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    argument_parser.add_argument(
+        "--baseline", action="store_true", help="also parse every request eagerly for comparison"
+    )
+    arguments = argument_parser.parse_args()
+
+    print("mean time in µs")
+    print(f"{'':<20}{'lazy':>10}" + (f"{'eager':>10}" if arguments.baseline else ""))
+    for name, benchmark in [("Request(...)", benchmark_request_construction), ("bare GET", benchmark_bare_get)]:
+        line = f"{name:<20}{benchmark():>10.2f}"
+        if arguments.baseline:
+            line += f"{benchmark(EagerRequest):>10.2f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Measures the content negotiation of :class:`ResponseSerializerService` with and without the decision cache.
+
+The *Accept* headers are the ones browsers and API clients send, the response bodies are a dict and a str.
+
+Run it from the repository root::
+
+    python -m benchmark.content_negotiation_benchmark
+"""
+
+import timeit
+
+from restit.internal.http_accept import HttpAccept
+from restit.internal.response_serializer_service import ResponseSerializerService
+
+NUMBER = 50000
+
+ACCEPT_STRINGS = [
+    "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "application/json",
+    "application/json, text/plain, */*",
+    "*/*",
+]
+
+
+def benchmark_find_response_serializer() -> float:
+    """Returns the mean time to find the serializer of a response body in microseconds"""
+    http_accepts = [HttpAccept.from_accept_string(accept_string) for accept_string in ACCEPT_STRINGS]
+    arguments = [(http_accept, body_type) for http_accept in http_accepts for body_type in (dict, str)]
+
+    def find():
+        for http_accept, body_type in arguments:
+            ResponseSerializerService.find_response_serializer(http_accept, body_type)
+
+    return timeit.timeit(find, number=NUMBER) / (NUMBER * len(arguments)) * 1e6
+
+
+def main():
+    print("mean time in µs")
+    ResponseSerializerService.set_negotiation_cache_size(0)
+    print(f"{'without cache':<20}{benchmark_find_response_serializer():>10.2f}")
+    ResponseSerializerService.set_negotiation_cache_size(1024)
+    statistics = ResponseSerializerService.get_negotiation_cache_statistics()
+    hits, misses = statistics.hits, statistics.misses
+    print(f"{'with cache':<20}{benchmark_find_response_serializer():>10.2f}")
+    hits, misses = statistics.hits - hits, statistics.misses - misses
+    print(f"{'hit rate':<20}{hits / (hits + misses):>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
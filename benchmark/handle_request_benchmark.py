@@ -0,0 +1,97 @@
+"""Measures the overhead of :func:`Resource.handle_request` around a trivial resource method.
+
+Run it from the repository root::
+
+    python -m benchmark.handle_request_benchmark
+
+With ``--baseline``, the timings are compared to resolving the resource method and its decorator metadata for every
+request, like before the handler plans were built once in :func:`Resource.init`. The baseline builds the
+:class:`~restit.internal.handler_plan.HandlerPlan` per request and hands it to :func:`Resource.handle_request`.
+"""
+
+import argparse
+import timeit
+from io import BytesIO
+
+from marshmallow import fields
+
+from restit import Request, Resource, Response
+from restit.decorator import path, query_parameter, response, exception_mapping
+from restit.exception import BadRequest, NotFound
+from restit.internal.handler_plan import HandlerPlan
+
+NUMBER = 20000
+
+
+@path("/users/:id")
+@exception_mapping({KeyError: NotFound})
+class PlainResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response("")
+
+
+@path("/users/:id")
+@exception_mapping({KeyError: NotFound})
+class DecoratedResource(Resource):
+    @query_parameter("limit", "The page size", fields.Integer())
+    @exception_mapping({ValueError: BadRequest})
+    @response(200, {"text/plain": fields.String()}, "The user")
+    @response(404, {"application/json": fields.Dict()}, "Unknown user")
+    def get(self, request: Request) -> Response:
+        return Response("")
+
+
+def create_wsgi_environment() -> dict:
+    return {
+        "HTTP_ACCEPT": "text/plain",
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/users/1",
+        "CONTENT_LENGTH": 0,
+        "wsgi.input": BytesIO(b""),
+        "QUERY_STRING": "limit=10",
+        "CONTENT_TYPE": "text/plain",
+        "wsgi.url_scheme": "http",
+        "SERVER_PORT": "8080",
+        "SERVER_NAME": "localhost",
+    }
+
+
+def benchmark_handle_request(resource: Resource, baseline: bool = False) -> float:
+    """Returns the mean time of handle_request in microseconds"""
+    resource.init()
+    requests = [Request(create_wsgi_environment(), {"id": "1"}) for _ in range(NUMBER)]
+    requests_iterator = iter(requests)
+
+    if baseline:
+
+        def handle_request():
+            request = next(requests_iterator)
+            handler_plan = HandlerPlan(getattr(resource, request.request_method_name.lower()))
+            resource.handle_request(request, {"id": "1"}, handler_plan)
+
+    else:
+
+        def handle_request():
+            resource.handle_request(next(requests_iterator), {"id": "1"})
+
+    return timeit.timeit(handle_request, number=NUMBER) / NUMBER * 1e6
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    argument_parser.add_argument(
+        "--baseline", action="store_true", help="also resolve the handler plan per request for comparison"
+    )
+    arguments = argument_parser.parse_args()
+
+    print("mean handle_request time in µs")
+    print(f"{'':<20}{'plan at init':>14}" + (f"{'per request':>14}" if arguments.baseline else ""))
+    for resource_class in [PlainResource, DecoratedResource]:
+        line = f"{resource_class.__name__:<20}{benchmark_handle_request(resource_class()):>14.2f}"
+        if arguments.baseline:
+            line += f"{benchmark_handle_request(resource_class(), baseline=True):>14.2f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
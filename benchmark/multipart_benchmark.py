@@ -0,0 +1,77 @@
+"""Measures the throughput of parsing *multipart/form-data* uploads with :attr:`Request.files`.
+
+Each upload carries a field and a file of the given size. The body is generated while it is read, so the benchmark
+itself does not hold it in memory, and the file part is spooled to a temporary file.
+
+Run it from the repository root::
+
+    python -m benchmark.multipart_benchmark
+"""
+
+import time
+
+from restit import Request
+
+SIZES = [1024 * 1024, 16 * 1024 * 1024, 128 * 1024 * 1024, 1024 * 1024 * 1024]
+BOUNDARY = "----WebKitFormBoundary7MA4YWxkTrZu0gW"
+
+
+class GeneratedUploadInput:
+    """Reads a multipart body with a file of ``file_size`` bytes"""
+
+    _PATTERN = bytes(range(256)) * 256
+
+    def __init__(self, file_size: int):
+        self._head = (
+            f"--{BOUNDARY}\r\n"
+            'Content-Disposition: form-data; name="title"\r\n'
+            "\r\n"
+            "benchmark\r\n"
+            f"--{BOUNDARY}\r\n"
+            'Content-Disposition: form-data; name="upload"; filename="upload.bin"\r\n'
+            "Content-Type: application/octet-stream\r\n"
+            "\r\n"
+        ).encode()
+        self._tail = f"\r\n--{BOUNDARY}--\r\n".encode()
+        self._remaining_file_size = file_size
+        self.length = len(self._head) + file_size + len(self._tail)
+
+    def read(self, size: int = -1) -> bytes:
+        if self._head:
+            data, self._head = self._head[:size], self._head[size:]
+            return data
+        if self._remaining_file_size > 0:
+            data = self._PATTERN[: min(size, len(self._PATTERN), self._remaining_file_size)]
+            self._remaining_file_size -= len(data)
+            return data
+        data, self._tail = self._tail[:size], self._tail[size:]
+        return data
+
+
+def benchmark_upload(file_size: int) -> float:
+    """Returns the throughput of parsing an upload in MiB per second"""
+    upload_input = GeneratedUploadInput(file_size)
+    request = Request(
+        {
+            "CONTENT_TYPE": f"multipart/form-data; boundary={BOUNDARY}",
+            "CONTENT_LENGTH": str(upload_input.length),
+            "wsgi.input": upload_input,
+        },
+        {},
+    )
+    start = time.perf_counter()
+    try:
+        assert request.files["upload"].size == file_size
+    finally:
+        request.close()
+    return upload_input.length / (time.perf_counter() - start) / (1024 * 1024)
+
+
+def main():
+    print("throughput in MiB/s")
+    for size in SIZES:
+        print(f"{f'{size // (1024 * 1024)} MiB upload':<20}{benchmark_upload(size):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compares reading a plain request body with reading the same body *gzip* encoded through :func:`Request.iter_body`.
+
+The payload is a JSON array of objects, which compresses like typical API requests do.
+
+Run it from the repository root::
+
+    python -m benchmark.request_decompression_benchmark
+"""
+
+import gzip
+import json
+import time
+from io import BytesIO
+from random import Random
+from string import ascii_lowercase
+from typing import Union
+
+from restit import Request
+
+SIZES = [16 * 1024, 256 * 1024, 4 * 1024 * 1024, 64 * 1024 * 1024]
+
+
+def create_payload(size: int) -> bytes:
+    random = Random(42)
+    items = []
+    length = 0
+    while length < size:
+        name = "".join(random.choice(ascii_lowercase) for _ in range(random.randint(4, 12)))
+        item = json.dumps(
+            {
+                "id": random.randint(0, 2**32),
+                "name": name.title(),
+                "email": f"{name}@example.com",
+                "score": round(random.random() * 100, 3),
+                "active": random.random() > 0.5,
+            }
+        ).encode()
+        items.append(item)
+        length += len(item) + 1
+    return b"[" + b",".join(items) + b"]"
+
+
+def benchmark_ingest(
+    body: bytes, content_encoding: Union[str, None], number: int, max_decompressed_body_size: int
+) -> float:
+    """Returns the mean time to read the whole body in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(number):
+        wsgi_environment = {"CONTENT_LENGTH": str(len(body)), "wsgi.input": BytesIO(body)}
+        if content_encoding is not None:
+            wsgi_environment["HTTP_CONTENT_ENCODING"] = content_encoding
+        request = Request(wsgi_environment, {})
+        # the largest payload exceeds the default limit, the limit stays checked with the payload size
+        request.max_decompressed_body_size = max_decompressed_body_size
+        for _ in request.iter_body():
+            pass
+    return (time.perf_counter() - start) / number * 1e3
+
+
+def main():
+    print(f"{'payload':<12}{'plain ms':>12}{'gzip ms':>12}{'gzip bytes':>14}")
+    for size in SIZES:
+        payload = create_payload(size)
+        compressed_payload = gzip.compress(payload)
+        number = max(1, 64 * 1024 * 1024 // size)
+        plain = benchmark_ingest(payload, None, number, len(payload))
+        compressed = benchmark_ingest(compressed_payload, "gzip", number, len(payload))
+        print(f"{f'{size // 1024} KiB':<12}{plain:>12.3f}{compressed:>12.3f}{len(compressed_payload):>14}")
+
+
+if __name__ == "__main__":
+    main()
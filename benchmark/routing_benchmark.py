@@ -0,0 +1,69 @@
+"""Compares the lookup time of the routing backends for a growing number of routes.
+
+Run it from the repository root::
+
+    python -m benchmark.routing_benchmark
+"""
+import timeit
+from typing import List, Type
+
+from restit import Resource
+from restit.internal.combined_regex_router import CombinedRegexRouter
+from restit.internal.linear_router import LinearRouter
+from restit.internal.router import Router
+from restit.internal.segment_trie_router import SegmentTrieRouter
+
+ROUTE_COUNTS = [10, 100, 1000, 10000]
+ROUTER_CLASSES: List[Type[Router]] = [LinearRouter, SegmentTrieRouter, CombinedRegexRouter]
+
+_REQUEST_MAPPING_TEMPLATES = [
+    "/api/v1/entity{index}",
+    "/api/v1/entity{index}/:id<int>",
+    "/api/v1/entity{index}/:id<int>/items",
+    "/api/v1/entity{index}/:id/items/:item_id",
+]
+
+
+def create_resources(route_count: int) -> List[Resource]:
+    resources = []
+    for route_index in range(route_count):
+        resource = Resource()
+        template = _REQUEST_MAPPING_TEMPLATES[route_index % len(_REQUEST_MAPPING_TEMPLATES)]
+        resource.__request_mapping__ = template.format(index=route_index // len(_REQUEST_MAPPING_TEMPLATES))
+        resource.init()
+        resources.append(resource)
+
+    return Resource.sort_resources(resources)
+
+
+def create_urls(route_count: int) -> dict:
+    last_entity = (route_count - 1) // len(_REQUEST_MAPPING_TEMPLATES)
+    return {
+        "first static": "/api/v1/entity0",
+        "last static": f"/api/v1/entity{last_entity}",
+        "parameterized": f"/api/v1/entity{last_entity}/42/items",
+        "not found": "/api/v2/unknown/42",
+    }
+
+
+def benchmark_router(router: Router, url: str, number: int) -> float:
+    """Returns the mean lookup time in microseconds"""
+    return timeit.timeit(lambda: router.find_resource(url), number=number) / number * 1e6
+
+
+def main():
+    for route_count in ROUTE_COUNTS:
+        resources = create_resources(route_count)
+        urls = create_urls(route_count)
+        number = max(20, 200000 // route_count)
+        print(f"\n{route_count} routes (mean lookup time in µs)")
+        print(f"{'':<16}" + "".join(f"{router_class.__name__:>22}" for router_class in ROUTER_CLASSES))
+        routers = [router_class(resources) for router_class in ROUTER_CLASSES]
+        for url_name, url in urls.items():
+            assert len({router.find_resource(url)[0] for router in routers}) == 1, url
+            timings = [benchmark_router(router, url, number) for router in routers]
+            print(f"{url_name:<16}" + "".join(f"{timing:>22.2f}" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,12 @@ from .hyperlink import Hyperlink
 from .namespace import Namespace
 from .request import Request
 from .resource import Resource
+from .response_compression import ResponseCompression
 from .restit_app import RestItApp
 from .restit_test_app import RestItTestApp
 from .rfc7807_schema import RFC7807Schema
 from .static_directory_resource import StaticDirectoryResource
 from .static_file_response import StaticFileResponse
+from .streaming_response import StreamingResponse
 
 __version__ = "0.3.2"
@@ -1,9 +1,12 @@
 from http import HTTPStatus
 from json import loads
-from typing import Union, Any
+from typing import Union, Any, Iterable, Callable
 
 
 class Response:
+    # the full response a not modified response was created from
+    _full_response: Union["Response", None] = None
+
     def __init__(
         self,
         response_body: Any,
@@ -21,6 +24,10 @@ class Response:
         self._headers.setdefault("Content-Type", content_type)
         self._headers.setdefault("Content-Length", len(self.content))
 
+    # noinspection PyUnusedLocal
+    def _get_body_iterable(self, file_wrapper: Callable = None) -> Iterable[bytes]:
+        return [self.content]
+
     @property
     def status_code(self) -> int:
         return self._status.value
@@ -1,9 +1,9 @@
 import os
 import sys
-from copy import deepcopy
-from functools import lru_cache
+from datetime import timezone
+from email.utils import formatdate, parsedate_to_datetime
 from html import escape
-from typing import List
+from typing import List, Union
 
 from restit.internal.response_status_parameter import ResponseStatusParameter
 
@@ -28,6 +28,22 @@ def get_open_api_resource_path() -> str:
     return path
 
 
+def format_http_date(timestamp: float) -> str:
+    return formatdate(timestamp, usegmt=True)
+
+
+def parse_http_date(http_date: str) -> Union[int, None]:
+    """Returns the timestamp of an *HTTP* date or `None` if the value is not a valid date"""
+    try:
+        date_time = parsedate_to_datetime(http_date)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if date_time.tzinfo is None:
+        # HTTP dates are always in GMT, the asctime format just does not say so
+        date_time = date_time.replace(tzinfo=timezone.utc)
+    return int(date_time.timestamp())
+
+
 def create_dict_from_assignment_syntax(request_input_string: str, group_delimiter: str = "&") -> dict:
     if request_input_string is None or "=" not in request_input_string:
         return {}
@@ -35,7 +51,7 @@ def create_dict_from_assignment_syntax(request_input_string: str, group_delimite
     return {
         key: escape(value)
         for key, value in [
-            pair.split("=") for pair in request_input_string.strip(group_delimiter + " ").split(group_delimiter)
+            pair.split("=", 1) for pair in request_input_string.strip(group_delimiter + " ").split(group_delimiter)
         ]
     }
 
@@ -54,17 +70,15 @@ def guess_text_content_subtype_string(content: str) -> str:
     return "text/plain"
 
 
-@lru_cache()
 def get_response_status_parameters_for_method(
     method_object: object,
 ) -> List[ResponseStatusParameter]:
-    response_status_parameters = deepcopy(getattr(method_object.__self__, "__response_status_parameters__", []))
+    response_status_parameters = list(getattr(method_object.__self__, "__response_status_parameters__", []))
     response_status_parameters.extend(getattr(method_object, "__response_status_parameters__", []))
     return response_status_parameters
 
 
-@lru_cache()
 def get_exception_mapping_for_method(method_object: object) -> dict:
-    exception_mapping: dict = deepcopy(getattr(method_object.__self__, "__exception_mapping__", {}))
+    exception_mapping: dict = dict(getattr(method_object.__self__, "__exception_mapping__", {}))
     exception_mapping.update(getattr(method_object, "__exception_mapping__", {}))
     return exception_mapping
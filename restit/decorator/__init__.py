@@ -1,4 +1,6 @@
+from .conditional_request_decorator import conditional_request
 from .exception_mapping_decorator import exception_mapping
+from .max_body_size_decorator import max_body_size
 from .path_decorator import path
 from .path_parameter_decorator import path_parameter
 from .query_parameter_decorator import query_parameter
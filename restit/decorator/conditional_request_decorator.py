@@ -0,0 +1,41 @@
+import logging
+from typing import Any, Callable
+
+from restit.internal.conditional_request_properties import ConditionalRequestProperties
+
+LOGGER = logging.getLogger(__name__)
+
+
+def conditional_request(version_key: Callable[..., Any] = None):
+    """Adds a strong *ETag* to the responses of a method and answers revalidations with
+    `304 <https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/304>`_.
+
+    Without a version key, the *ETag* is a hash of the serialized response body, which saves the transfer but not the
+    work of the method. The version key is called with the request before the request body is processed and the
+    method is called. Its result identifies the current version of the resource, e.g. an update counter or the
+    modification time of a database row. If the *If-None-Match* header of a *GET* request matches it, the method is
+    not called at all.
+
+    Responses carrying an *ETag* or *Last-Modified* header, like :class:`~restit.StaticFileResponse`, are evaluated
+    against *If-None-Match* and *If-Modified-Since* without this decorator.
+
+    Example:
+
+    .. code-block:: python
+
+        @path("/users/:id")
+        class UserResource(Resource):
+            @conditional_request(version_key=lambda request: users.get_version(request.path_parameters["id"]))
+            def get(self, request: Request) -> Response:
+                return Response(users.load(request.path_parameters["id"]))
+
+    :param version_key: Returns the version of the requested resource, it must change whenever the response changes
+    :type version_key: Callable[[Request], Any]
+    """
+
+    def decorator(func):
+        LOGGER.debug("Registering conditional request for %s", func.__name__)
+        setattr(func, "__conditional_request_properties__", ConditionalRequestProperties(version_key))
+        return func
+
+    return decorator
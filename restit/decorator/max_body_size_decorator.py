@@ -0,0 +1,33 @@
+import logging
+
+LOGGER = logging.getLogger(__name__)
+
+
+def max_body_size(size: int):
+    """Limits the size of the request body of a method.
+
+    It replaces the ``max_request_body_size`` of :class:`~restit.RestItApp` for that method, so an upload endpoint
+    can accept larger bodies than the rest of the application. A larger body is answered with
+    `413 <https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/413>`_ before it is read.
+
+    Example:
+
+    .. code-block:: python
+
+        @path("/uploads")
+        class UploadResource(Resource):
+            @max_body_size(2 * 1024 ** 3)
+            def post(self, request: Request) -> Response:
+                for chunk in request.iter_body():
+                    ...
+
+    :param size: The maximum body size in bytes
+    :type size: int
+    """
+
+    def decorator(func):
+        LOGGER.debug("Registering max body size %d for %s", size, func.__name__)
+        setattr(func, "__max_body_size__", size)
+        return func
+
+    return decorator
@@ -3,12 +3,46 @@ import signal
 from contextlib import contextmanager
 from threading import Thread
 from time import sleep
-from typing import Union, Callable, Generator, List
+from typing import Union, Callable, Generator, Iterable, List
 from wsgiref.simple_server import make_server, WSGIServer
 
 LOGGER = logging.getLogger(__name__)
 
 
+class _RequestBodyInput:
+    """Limits the socket input to the *Content-Length* of the request, like production servers do."""
+
+    _DISCARD_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, wsgi_input, content_length: int):
+        self._wsgi_input = wsgi_input
+        self._remaining = content_length
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._wsgi_input.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def readline(self, size: int = -1) -> bytes:
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._wsgi_input.readline(size)
+        self._remaining -= len(data)
+        return data
+
+    def readlines(self, hint: int = -1) -> List[bytes]:
+        return list(iter(self.readline, b""))
+
+    def __iter__(self):
+        return iter(self.readline, b"")
+
+    def discard(self):
+        while self._remaining > 0 and self.read(self._DISCARD_CHUNK_SIZE):
+            pass
+
+
 class DevelopmentServer:
     def __init__(
         self,
@@ -28,7 +62,7 @@ class DevelopmentServer:
     def start(self, blocking: bool = True) -> int:
         LOGGER.debug("Creating WSGI server for host %s and port %d", self.host, self.port)
         self._register_stop_signals()
-        self.server = make_server(self.host, self.port, self.wsgi_app)
+        self.server = make_server(self.host, self.port, self._call_wsgi_app)
         self._thread = Thread(target=self.server.serve_forever)
         self._thread.start()
         self._is_running = True
@@ -47,6 +81,16 @@ class DevelopmentServer:
             )
             return self.server.server_port
 
+    def _call_wsgi_app(self, wsgi_environ: dict, start_response: Callable) -> Iterable:
+        # the request body is read lazily, so a response might be created without reading it. Closing the socket with
+        # unread data resets the connection, before the client got the response.
+        request_body_input = _RequestBodyInput(wsgi_environ["wsgi.input"], int(wsgi_environ.get("CONTENT_LENGTH") or 0))
+        wsgi_environ["wsgi.input"] = request_body_input
+        try:
+            return self.wsgi_app(wsgi_environ, start_response)
+        finally:
+            request_body_input.discard()
+
     def _wait_until_stopped(self):
         while self._is_running:
             sleep(0.5)
@@ -1,3 +1,4 @@
+from html import escape
 from typing import Union
 
 from .http_error_css import _ERROR_BOOTSTRAP_CSS
@@ -44,11 +45,13 @@ class HttpError(RuntimeError):
         traceback: str = None,
         rfc7807_type: str = None,
         rfc7807_instance: str = None,
+        headers: dict = None,
     ):
         self.description = description or self.DEFAULT_DESCRIPTION
         self.traceback = traceback
         self.rfc7807_type = rfc7807_type or self.DEFAULT_RFC7807_TYPE
         self.rfc7807_instance = rfc7807_instance
+        self.headers = headers or {}
 
     @property
     def status_code(self) -> int:
@@ -67,12 +70,14 @@ class HttpError(RuntimeError):
         }
 
     def to_html(self, debug: bool = False) -> str:
+        # the description and the traceback can contain request values, like an invalid query parameter
+        description = escape(self.description.strip("\n "), quote=False)
         if debug:
             html_string = _DEBUG_HTML_TEMPLATE.format(
                 title=self.TITLE,
                 status_code=self.STATUS_CODE,
-                description=self.description.strip("\n "),
-                traceback=self.traceback.replace("\n", "<br>"),
+                description=description,
+                traceback=escape(self.traceback, quote=False).replace("\n", "<br>"),
                 css=_ERROR_BOOTSTRAP_CSS,
                 rfc7807_type=self.rfc7807_type,
             )
@@ -80,7 +85,7 @@ class HttpError(RuntimeError):
             html_string = _HTML_TEMPLATE.format(
                 title=self.TITLE,
                 status_code=self.STATUS_CODE,
-                description=self.description.strip("\n "),
+                description=description,
             )
 
         return html_string
@@ -0,0 +1,61 @@
+from types import MappingProxyType
+from typing import Dict, Sequence, Union
+
+from restit.internal.intern_cache import InternCache
+
+
+class AcceptEncoding:
+    """The content codings of an *Accept-Encoding* header with their quality values.
+
+    Instances are shared between requests by :func:`from_accept_encoding_string` and must not be modified.
+    """
+
+    _ALIASES = {"x-gzip": "gzip"}
+
+    def __init__(self, qualities: Dict[str, float]):
+        self.qualities = MappingProxyType(dict(qualities))
+
+    @staticmethod
+    def from_accept_encoding_string(accept_encoding_string: str) -> "AcceptEncoding":
+        """Returns the parsed header, equal strings return the same interned instance"""
+        return _ACCEPT_ENCODING_CACHE.get(accept_encoding_string)
+
+    @staticmethod
+    def _parse(accept_encoding_string: str) -> "AcceptEncoding":
+        qualities = {}
+        for coding_string in accept_encoding_string.split(","):
+            coding, *parameters = [part.strip() for part in coding_string.split(";")]
+            coding = coding.lower()
+            if not coding:
+                continue
+            quality = 1.0
+            for parameter in parameters:
+                name, _, value = parameter.partition("=")
+                if name.strip().lower() == "q":
+                    try:
+                        quality = min(max(float(value), 0.0), 1.0)
+                    except ValueError:
+                        quality = 0.0
+            qualities.setdefault(AcceptEncoding._ALIASES.get(coding, coding), quality)
+        return AcceptEncoding(qualities)
+
+    def get_best_match(self, encodings: Sequence[str]) -> Union[str, None]:
+        """Returns the acceptable encoding with the highest quality, the first one of equal qualities.
+
+        A coding that is not listed gets the quality of ``*``, `None` is returned if no encoding is acceptable.
+        """
+        wildcard_quality = self.qualities.get("*", 0.0)
+        best_encoding = None
+        best_quality = 0.0
+        for encoding in encodings:
+            quality = self.qualities.get(encoding, wildcard_quality)
+            if quality > best_quality:
+                best_encoding = encoding
+                best_quality = quality
+        return best_encoding
+
+    def __str__(self):
+        return f"AcceptEncoding({dict(self.qualities)})"
+
+
+_ACCEPT_ENCODING_CACHE = InternCache(AcceptEncoding._parse)
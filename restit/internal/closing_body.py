@@ -0,0 +1,38 @@
+from typing import Callable, Iterable
+
+
+class ClosingBody:
+    """Hands a response body to the *WSGI* server and calls back once the server has closed it.
+
+    The server calls :func:`close` after the last chunk is sent or when the client has disconnected, so resources the
+    body might still read from, like the uploaded files of the request, are released only then. The chunks of the body
+    are passed on as they are.
+
+    :param iterable: The response body
+    :param on_close: Called after the body is closed
+    """
+
+    def __init__(self, iterable: Iterable[bytes], on_close: Callable[[], None]):
+        self._iterable = iterable
+        self._iterator = None
+        self._on_close = on_close
+        self._is_closed = False
+
+    def __iter__(self) -> "ClosingBody":
+        return self
+
+    def __next__(self) -> bytes:
+        if self._iterator is None:
+            self._iterator = iter(self._iterable)
+        return next(self._iterator)
+
+    def close(self):
+        if self._is_closed:
+            return
+        self._is_closed = True
+        try:
+            close = getattr(self._iterable, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._on_close()
@@ -0,0 +1,60 @@
+import re
+from typing import Dict, List, Tuple, Union, Match
+
+from restit.internal.resource_path import ResourcePath
+from restit.internal.router import Router
+from restit.resource import Resource
+
+
+class CombinedRegexRouter(Router):
+    """Combines the :class:`~restit.internal.resource_path.ResourcePath` regular expressions of all resources into
+    a single alternation, so a single ``re.match`` call finds the resource.
+
+    The alternatives are ordered like the resources, so the first matching alternative is the resource
+    :class:`~restit.internal.linear_router.LinearRouter` would have found. Each alternative ends with an empty group
+    named after its position, which tells the matching resource. Its own named groups are prefixed with that name, so
+    path parameters of different resources can not collide. The path parameter values are converted like in
+    :func:`ResourcePath.get_match`.
+
+    The marker group sits at the end of the alternative instead of wrapping it, because the regular expression engine
+    saves all groups opened so far whenever it tries the next alternative.
+
+    .. note::
+
+        Numbered back references inside request mappings are not supported by this router.
+    """
+
+    _NAMED_GROUP_REGEX = re.compile(r"\(\?P([<=])(\w+)")
+
+    def __init__(self, resources: List[Resource]):
+        super().__init__(resources)
+        self._alternatives: Dict[str, Tuple[Resource, List[Tuple[str, str, type]]]] = {}
+        regex_patterns = []
+        for index, resource in enumerate(resources):
+            resource_path = ResourcePath(resource.__request_mapping__)
+            alternative_name = f"_{index}"
+            marker_group = f"(?P<{alternative_name}>)"
+            regex_patterns.append(self._prefix_group_names(resource_path, alternative_name) + marker_group)
+            self._alternatives[alternative_name] = resource, [
+                (f"{alternative_name}_{param}", param, resource_path.type_mapping.get(param, str))
+                for param in sorted(resource_path.regex.groupindex, key=resource_path.regex.groupindex.get)
+            ]
+
+        self._regex = re.compile("|".join(regex_patterns)) if regex_patterns else None
+
+    def _prefix_group_names(self, resource_path: ResourcePath, alternative_name: str) -> str:
+        def _replace_group_name(match: Match) -> str:
+            return f"(?P{match.group(1)}{alternative_name}_{match.group(2)}"
+
+        return self._NAMED_GROUP_REGEX.sub(_replace_group_name, resource_path.regex.pattern)
+
+    def find_resource(self, url: str) -> Union[Tuple[None, None], Tuple[Resource, Dict]]:
+        match = self._regex.match(url) if self._regex is not None else None
+        if match is None:
+            return None, None
+
+        resource, path_param_groups = self._alternatives[match.lastgroup]
+        path_params = {
+            param: python_type(match.group(group_name)) for group_name, param, python_type in path_param_groups
+        }
+        return resource, path_params
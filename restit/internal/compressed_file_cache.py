@@ -0,0 +1,48 @@
+from threading import Lock
+from typing import Callable, Dict, Hashable
+
+
+class CompressedFileCache:
+    """Keeps compressed variants of static files, so a file is compressed once and not on every request.
+
+    The key should contain the modification time and the size of the file, a changed file is compressed again. Lookups
+    do not take a lock, a new variant is stored under a lock and the oldest variants are evicted once their total size
+    exceeds ``max_size``.
+
+    :param max_size: The maximum total size of the cached variants in bytes
+    :type max_size: int
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = Lock()
+        self._variants: Dict[Hashable, bytes] = {}
+        self._size = 0
+
+    def get(self, key: Hashable, compress: Callable[[], bytes]) -> bytes:
+        variant = self._variants.get(key)
+        if variant is not None:
+            return variant
+
+        variant = compress()
+        if len(variant) > self.max_size:
+            return variant
+        with self._lock:
+            if key in self._variants:
+                return self._variants[key]
+            variants = dict(self._variants)
+            variants[key] = variant
+            self._size += len(variant)
+            while self._size > self.max_size:
+                self._size -= len(variants.pop(next(iter(variants))))
+            # a new dictionary, lookups running concurrently keep reading the previous one
+            self._variants = variants
+        return variant
+
+    def clear(self):
+        with self._lock:
+            self._variants = {}
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._variants)
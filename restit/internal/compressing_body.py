@@ -0,0 +1,52 @@
+import zlib
+from typing import Iterable
+
+
+class CompressingBody:
+    """Compresses a response body while it is sent.
+
+    Every chunk is flushed with ``Z_SYNC_FLUSH``, so the client can decompress it as soon as it arrives instead of
+    waiting until the compressor's buffer is full, e.g. for server-sent rows. Like
+    :class:`~restit.internal.streaming_body.StreamingBody`, the server's ``close()`` is passed on to the wrapped body.
+
+    :param body_iterable: The iterable of uncompressed chunks
+    :param encoding: The content coding, *gzip* or *deflate*
+    :type encoding: str
+    :param level: The compression level from 1 to 9
+    :type level: int
+    """
+
+    def __init__(self, body_iterable: Iterable[bytes], encoding: str, level: int):
+        self._body_iterable = body_iterable
+        self._compressor = CompressingBody.create_compressor(encoding, level)
+        self._chunks = self._iterate_chunks()
+
+    @staticmethod
+    def create_compressor(encoding: str, level: int):
+        # deflate means the zlib format, not the raw deflate stream
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS if encoding == "gzip" else zlib.MAX_WBITS)
+
+    @staticmethod
+    def compress(data: bytes, encoding: str, level: int) -> bytes:
+        compressor = CompressingBody.create_compressor(encoding, level)
+        return compressor.compress(data) + compressor.flush()
+
+    def __iter__(self) -> "CompressingBody":
+        return self
+
+    def __next__(self) -> bytes:
+        return next(self._chunks)
+
+    def close(self):
+        self._chunks.close()
+        close = getattr(self._body_iterable, "close", None)
+        if close is not None:
+            close()
+
+    def _iterate_chunks(self):
+        for chunk in self._body_iterable:
+            if not chunk:
+                # a sync flush of nothing would still send the empty block marker
+                continue
+            yield self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield self._compressor.flush()
@@ -0,0 +1,6 @@
+from typing import Any, Callable, Optional
+
+
+class ConditionalRequestProperties:
+    def __init__(self, version_key: Optional[Callable[..., Any]]):
+        self.version_key = version_key
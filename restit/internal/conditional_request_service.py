@@ -0,0 +1,72 @@
+from hashlib import blake2b
+from http import HTTPStatus
+from typing import Any, Union
+
+from restit._response import Response
+from restit.common import parse_http_date
+from restit.internal.wsgi_headers import WsgiHeaders
+
+# headers describing the omitted body, a 304 response only repeats the validators and caching headers
+_REPRESENTATION_HEADERS = frozenset(
+    ["content-type", "content-length", "content-encoding", "content-range", "content-language", "transfer-encoding"]
+)
+_CONDITIONAL_METHODS = frozenset(["GET", "HEAD"])
+
+
+class ConditionalRequestService:
+    @staticmethod
+    def create_entity_tag(data: bytes) -> str:
+        """Returns a strong entity tag, the quoted hash of the data"""
+        return f'"{blake2b(data, digest_size=16).hexdigest()}"'
+
+    @staticmethod
+    def create_version_entity_tag(version: Any) -> str:
+        return ConditionalRequestService.create_entity_tag(str(version).encode())
+
+    @staticmethod
+    def is_not_modified(
+        request_method_name: str,
+        request_headers: WsgiHeaders,
+        entity_tag: Union[str, None],
+        last_modified: Union[str, None],
+    ) -> bool:
+        """Evaluates *If-None-Match* and, only if it is missing, *If-Modified-Since*.
+
+        Entity tags are compared weakly as :rfc:`7232#section-3.2` requires.
+        """
+        if request_method_name.upper() not in _CONDITIONAL_METHODS:
+            return False
+        if_none_match = request_headers.get_all("If-None-Match")
+        if if_none_match:
+            if entity_tag is None:
+                return False
+            opaque_tag = ConditionalRequestService._get_opaque_tag(entity_tag)
+            return any(
+                value == "*" or ConditionalRequestService._get_opaque_tag(value) == opaque_tag
+                for value in if_none_match
+            )
+
+        if_modified_since = request_headers.get("If-Modified-Since")
+        if if_modified_since is None or last_modified is None:
+            return False
+        if_modified_since_timestamp = parse_http_date(if_modified_since)
+        last_modified_timestamp = parse_http_date(last_modified)
+        if if_modified_since_timestamp is None or last_modified_timestamp is None:
+            return False
+        return last_modified_timestamp <= if_modified_since_timestamp
+
+    @staticmethod
+    def create_not_modified_response(response: Response) -> Response:
+        headers = {key: value for key, value in response.headers.items() if key.lower() not in _REPRESENTATION_HEADERS}
+        close = getattr(response.response_body_input, "close", None)
+        if close is not None:
+            # the body of a streaming response is not sent, its generator must not wait for the garbage collector
+            close()
+        not_modified_response = Response(b"", HTTPStatus.NOT_MODIFIED, headers)
+        # the response compression weakens the ETag like the one of the full response
+        not_modified_response._full_response = response
+        return not_modified_response
+
+    @staticmethod
+    def _get_opaque_tag(entity_tag: str) -> str:
+        return entity_tag[2:] if entity_tag.startswith("W/") else entity_tag
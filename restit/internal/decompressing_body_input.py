@@ -0,0 +1,108 @@
+import io
+import zlib
+from typing import Union
+
+from restit.exception import BadRequest, PayloadTooLarge, UnsupportedMediaType
+
+
+class DecompressingBodyInput(io.RawIOBase):
+    """Decodes a *gzip* or *deflate* encoded request body while it is read.
+
+    The decompressed size and the ratio of decompressed to compressed bytes are checked after every chunk, exceeding
+    one of them raises :class:`~restit.exception.PayloadTooLarge`. The ratio is not checked for the first
+    :attr:`RATIO_GRACE_SIZE` bytes, small bodies like a JSON document full of zeros compress very well, too.
+
+    :param body_input: The readable encoded body
+    :param encoding: The content coding, *gzip*, *x-gzip* or *deflate*
+    :type encoding: str
+    :param max_size: The maximum decompressed size in bytes or `None` for no limit
+    :type max_size: int
+    :param max_ratio: The maximum ratio of decompressed to compressed bytes or `None` for no limit
+    :type max_ratio: int
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    RATIO_GRACE_SIZE = 1024 * 1024
+
+    _GZIP_ENCODINGS = frozenset(["gzip", "x-gzip"])
+
+    def __init__(self, body_input, encoding: str, max_size: Union[int, None], max_ratio: Union[int, None]):
+        super().__init__()
+        if encoding not in DecompressingBodyInput._GZIP_ENCODINGS and encoding != "deflate":
+            raise UnsupportedMediaType(f"The content encoding {encoding} is not supported")
+        self._body_input = body_input
+        self._encoding = encoding
+        self._max_size = max_size
+        self._max_ratio = max_ratio
+        self._decompressor = None
+        self._input_size = 0
+        self._size = 0
+        self._is_input_exhausted = False
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(self.CHUNK_SIZE), b""))
+        if size == 0:
+            return b""
+
+        while True:
+            if self._decompressor is not None and self._decompressor.eof and self._decompressor.unused_data:
+                # gzip bodies can consist of several members, the input after the end of a member is unused data
+                data = self._decompressor.unused_data
+                self._decompressor = self._create_decompressor(data)
+            elif self._decompressor is not None and not self._decompressor.eof and self._decompressor.unconsumed_tail:
+                data = self._decompressor.unconsumed_tail
+            else:
+                data = self._read_input()
+                if not data:
+                    self._check_end_of_stream()
+                    return b""
+                if self._decompressor is None:
+                    self._decompressor = self._create_decompressor(data)
+
+            try:
+                decompressed_data = self._decompressor.decompress(data, size)
+            except zlib.error as error:
+                raise BadRequest(f"The {self._encoding} encoded request body is invalid: {error}") from error
+            if decompressed_data:
+                self._count(len(decompressed_data))
+                return decompressed_data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def _read_input(self) -> bytes:
+        if self._is_input_exhausted:
+            return b""
+        data = self._body_input.read(self.CHUNK_SIZE)
+        if not data:
+            self._is_input_exhausted = True
+        self._input_size += len(data)
+        return data
+
+    def _create_decompressor(self, data: bytes):
+        if self._encoding in DecompressingBodyInput._GZIP_ENCODINGS:
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        # deflate should be zlib wrapped, some clients send the raw deflate stream though
+        is_zlib_wrapped = len(data) >= 2 and data[0] & 0x0F == 8 and (data[0] << 8 | data[1]) % 31 == 0
+        return zlib.decompressobj(zlib.MAX_WBITS if is_zlib_wrapped else -zlib.MAX_WBITS)
+
+    def _check_end_of_stream(self):
+        if self._decompressor is not None and not self._decompressor.eof:
+            raise BadRequest(f"The {self._encoding} encoded request body is truncated")
+
+    def _count(self, size: int):
+        self._size += size
+        if self._max_size is not None and self._size > self._max_size:
+            raise PayloadTooLarge(f"The decompressed request body exceeds the maximum size of {self._max_size} bytes")
+        if (
+            self._max_ratio is not None
+            and self._size > self.RATIO_GRACE_SIZE
+            and self._size > self._max_ratio * self._input_size
+        ):
+            raise PayloadTooLarge(f"The request body exceeds the maximum compression ratio of {self._max_ratio}")
@@ -1,5 +1,5 @@
 import json
-from typing import List, Type
+from typing import BinaryIO, List, Type
 
 from restit.request_deserializer import RequestDeserializer
 
@@ -14,5 +14,13 @@ class DefaultApplicationJsonDictDeserializer(RequestDeserializer):
 
         return json.loads(request_input.decode(encoding))
 
+    def deserialize_file(self, request_input_file: BinaryIO, encoding: str = None) -> dict:
+        # the json module has no incremental parser, but the body is decoded chunk by chunk instead of as a whole
+        request_input = "".join(self.iter_decoded_chunks(request_input_file, encoding))
+        if len(request_input) == 0:
+            return {}
+
+        return json.loads(request_input)
+
     def get_deserialized_python_type(self) -> Type:
         return dict
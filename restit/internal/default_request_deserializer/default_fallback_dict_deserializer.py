@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import List, Type
+from typing import BinaryIO, List, Type
 
 from restit.request_deserializer import RequestDeserializer
 
@@ -18,5 +18,12 @@ class DefaultFallbackDictDeserializer(RequestDeserializer):
         response_as_dict = json.loads(request_input.decode(encoding))
         return response_as_dict
 
+    def deserialize_file(self, request_input_file: BinaryIO, encoding: str = None) -> dict:
+        LOGGER.warning("Trying to parse JSON from content type != application/json")
+        request_input = "".join(self.iter_decoded_chunks(request_input_file, encoding))
+        if len(request_input) == 0:
+            return {}
+        return json.loads(request_input)
+
     def get_deserialized_python_type(self) -> Type:
         return dict
@@ -1,6 +1,6 @@
-from typing import List, Type
+from typing import BinaryIO, List, Type
 
-from restit.common import create_dict_from_assignment_syntax
+from restit.internal.query_parser import QueryParser
 from restit.request_deserializer import RequestDeserializer
 
 
@@ -8,14 +8,16 @@ class DefaultFormDataDictDeserializer(RequestDeserializer):
     def get_content_type_list(self) -> List[str]:
         return [
             "application/x-www-form-urlencoded",
-            "multipart/form-data",
             "application/x-url-encoded",
         ]
 
     def deserialize(self, request_input: bytes, encoding: str = None) -> dict:
         if len(request_input) == 0:
             return {}
-        return create_dict_from_assignment_syntax(request_input.decode(encoding))
+        return QueryParser.parse(request_input.decode(encoding))
+
+    def deserialize_file(self, request_input_file: BinaryIO, encoding: str = None) -> dict:
+        return QueryParser.parse_chunks(self.iter_decoded_chunks(request_input_file, encoding))
 
     def get_deserialized_python_type(self) -> Type:
         return dict
@@ -0,0 +1,50 @@
+import os
+from typing import BinaryIO, List, Tuple
+
+
+class FileRangeBody:
+    """Sends byte ranges of a file, each range is read with positioned reads of at most the block size.
+
+    :param file: The file opened in binary mode, it is closed with the body
+    :param parts: Tuples of the bytes sent before a range, the first and the last byte position of the range
+    :param epilogue: The bytes sent after the last range
+    :param block_size: The maximum size of a single read
+    """
+
+    def __init__(self, file: BinaryIO, parts: List[Tuple[bytes, int, int]], epilogue: bytes, block_size: int):
+        self._file = file
+        self._parts = parts
+        self._epilogue = epilogue
+        self._block_size = block_size
+        self._chunks = self._iterate_chunks()
+
+    def __iter__(self) -> "FileRangeBody":
+        return self
+
+    def __next__(self) -> bytes:
+        return next(self._chunks)
+
+    def close(self):
+        self._chunks.close()
+        self._file.close()
+
+    def _iterate_chunks(self):
+        for preamble, start, end in self._parts:
+            if preamble:
+                yield preamble
+            position = start
+            while position <= end:
+                data = self._read(position, min(self._block_size, end - position + 1))
+                if not data:
+                    # the file was truncated after its size was taken
+                    return
+                position += len(data)
+                yield data
+        if self._epilogue:
+            yield self._epilogue
+
+    def _read(self, position: int, size: int) -> bytes:
+        if hasattr(os, "pread"):
+            return os.pread(self._file.fileno(), size, position)
+        self._file.seek(position)
+        return self._file.read(size)
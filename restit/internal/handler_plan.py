@@ -0,0 +1,54 @@
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
+
+from restit.common import get_exception_mapping_for_method, get_response_status_parameters_for_method
+from restit.exception import HttpError
+from restit.internal.conditional_request_properties import ConditionalRequestProperties
+from restit.internal.query_parameter import QueryParameter
+from restit.internal.request_body_properties import RequestBodyProperties
+from restit.internal.response_status_parameter import ResponseStatusParameter
+
+_ExceptionMappingTarget = Union[Tuple[Type[HttpError], str], Type[HttpError]]
+
+
+class HandlerPlan:
+    """The decorator metadata of a resource method, resolved once when the resource is initialized.
+
+    :param method_object: The bound resource method, e.g. ``resource.get``
+    :type method_object: Callable
+    """
+
+    def __init__(self, method_object: Callable):
+        self.method_object = method_object
+        self.query_parameters: List[QueryParameter] = getattr(method_object, "__query_parameters__", [])
+        self.request_body_properties: Optional[RequestBodyProperties] = getattr(
+            method_object, "__request_body_properties__", None
+        )
+        self.max_body_size: Optional[int] = getattr(method_object, "__max_body_size__", None)
+        self.conditional_request_properties: Optional[ConditionalRequestProperties] = getattr(
+            method_object, "__conditional_request_properties__", None
+        )
+        self._response_status_parameters: Dict[int, ResponseStatusParameter] = {}
+        response_status_parameters = get_response_status_parameters_for_method(method_object)
+        for response_status_parameter in response_status_parameters:
+            self._response_status_parameters.setdefault(response_status_parameter.status, response_status_parameter)
+        self.has_response_status_parameters = len(response_status_parameters) > 0
+        self._exception_mapping: Dict[Type[Exception], _ExceptionMappingTarget] = get_exception_mapping_for_method(
+            method_object
+        )
+        self._resolved_exception_mapping: Dict[Type[Exception], Optional[_ExceptionMappingTarget]] = {}
+
+    def find_response_status_parameter(self, status: int) -> Optional[ResponseStatusParameter]:
+        return self._response_status_parameters.get(status)
+
+    def find_exception_mapping(self, exception_class: Type[Exception]) -> Optional[_ExceptionMappingTarget]:
+        """Returns the mapping target of the most specific mapped class in the *MRO* of the exception class"""
+        try:
+            return self._resolved_exception_mapping[exception_class]
+        except KeyError:
+            target = None
+            for base_class in exception_class.__mro__:
+                if base_class in self._exception_mapping:
+                    target = self._exception_mapping[base_class]
+                    break
+            self._resolved_exception_mapping[exception_class] = target
+            return target
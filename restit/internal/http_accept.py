@@ -1,14 +1,26 @@
 from typing import List, Tuple, Union
 
+from restit.internal.intern_cache import InternCache
 from restit.internal.mime_type import MIMEType
 
 
 class HttpAccept:
+    """The media types of an *Accept* header, ordered by quality.
+
+    Instances are shared between requests by :func:`from_accept_string` and must not be modified.
+    """
+
     def __init__(self, mime_types: List[MIMEType]):
-        self.mime_types: List[MIMEType] = sorted(mime_types, reverse=True)
+        self.mime_types: Tuple[MIMEType, ...] = tuple(sorted(mime_types, reverse=True))
+        self._hash: Union[int, None] = None
 
     @staticmethod
     def from_accept_string(accept_string: str) -> "HttpAccept":
+        """Returns the parsed header, equal strings return the same interned instance"""
+        return _HTTP_ACCEPT_CACHE.get(accept_string)
+
+    @staticmethod
+    def _parse(accept_string: str) -> "HttpAccept":
         return HttpAccept([MIMEType.from_string(mime_type_string) for mime_type_string in accept_string.split(",")])
 
     def get_best_match(self, mime_type_strings: List[str]) -> Union[None, Tuple[str, MIMEType]]:
@@ -22,3 +34,12 @@ class HttpAccept:
 
     def __eq__(self, other: "HttpAccept") -> bool:
         return self.mime_types == other.mime_types
+
+    def __hash__(self) -> int:
+        # interned instances are used as cache keys on every response, the hash is computed once
+        if self._hash is None:
+            self._hash = hash(self.mime_types)
+        return self._hash
+
+
+_HTTP_ACCEPT_CACHE = InternCache(HttpAccept._parse)
@@ -34,7 +34,7 @@ class HttpErrorResponseMaker:
         response = Response(
             response_body=self.http_error.to_html(self.debug),
             status_code=self.http_error.status_code,
-            headers={"Content-Type": "text/html"},
+            headers={**self.http_error.headers, "Content-Type": "text/html"},
         )
         return response
 
@@ -45,7 +45,7 @@ class HttpErrorResponseMaker:
         response = Response(
             response_body=self.http_error.to_rfc7807_json(),
             status_code=self.http_error.status_code,
-            headers={"Content-Type": "application/problem+json"},
+            headers={**self.http_error.headers, "Content-Type": "application/problem+json"},
         )
         return response
 
@@ -53,4 +53,5 @@ class HttpErrorResponseMaker:
         return Response(
             response_body=self.http_error.to_text(self.debug),
             status_code=self.http_error.status_code,
+            headers=dict(self.http_error.headers),
         )
@@ -0,0 +1,71 @@
+import re
+from typing import List, Tuple, Union
+
+from restit.exception import RequestedRangeNotSatisfiable
+
+
+class HttpRange:
+    """Parses the byte ranges of a `Range <https://tools.ietf.org/html/rfc7233#section-3.1>`_ header.
+
+    Ranges are returned as tuples of the first and the last byte position, both inclusive. Ranges beyond the end are
+    shortened to the size, overlapping ones are coalesced. A header with another unit than *bytes*, an invalid syntax
+    or more than :attr:`MAX_RANGES` ranges is ignored, the whole representation is sent then.
+    """
+
+    MAX_RANGES = 100
+
+    _POSITION_REGEX = re.compile(r"^\d*$", flags=re.ASCII)
+
+    @staticmethod
+    def parse(range_header: Union[str, None], size: int) -> Union[List[Tuple[int, int]], None]:
+        """Returns the satisfiable ranges or `None` if the header is to be ignored.
+
+        :raises RequestedRangeNotSatisfiable: If none of the ranges is satisfiable
+        """
+        if not range_header:
+            return None
+        unit, _, range_set = range_header.partition("=")
+        if unit.strip().lower() != "bytes":
+            return None
+        range_specs = [range_spec.strip() for range_spec in range_set.split(",") if range_spec.strip()]
+        if not range_specs or len(range_specs) > HttpRange.MAX_RANGES:
+            return None
+
+        ranges = []
+        for range_spec in range_specs:
+            first, separator, last = range_spec.partition("-")
+            first, last = first.strip(), last.strip()
+            if not separator or not (first or last) or not HttpRange._is_position(first, last):
+                return None
+            if not first:
+                # a suffix range, the last bytes of the representation
+                if int(last) > 0 and size > 0:
+                    ranges.append((max(0, size - int(last)), size - 1))
+                continue
+            start = int(first)
+            end = int(last) if last else size - 1
+            if last and end < start:
+                return None
+            if start < size:
+                ranges.append((start, min(end, size - 1)))
+
+        if not ranges:
+            raise RequestedRangeNotSatisfiable(headers={"Content-Range": f"bytes */{size}"})
+        return HttpRange._coalesce(ranges)
+
+    @staticmethod
+    def _is_position(*positions: str) -> bool:
+        return all(HttpRange._POSITION_REGEX.match(position) for position in positions)
+
+    @staticmethod
+    def _coalesce(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        sorted_ranges = sorted(ranges)
+        coalesced_ranges = [sorted_ranges[0]]
+        for start, end in sorted_ranges[1:]:
+            last_start, last_end = coalesced_ranges[-1]
+            if start <= last_end + 1:
+                coalesced_ranges[-1] = (last_start, max(last_end, end))
+            else:
+                coalesced_ranges.append((start, end))
+        # the requested order is kept unless ranges had to be merged
+        return ranges if len(coalesced_ranges) == len(ranges) else coalesced_ranges
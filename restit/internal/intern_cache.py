@@ -0,0 +1,48 @@
+from threading import Lock
+from typing import Callable, Dict, Generic, Hashable, TypeVar
+
+_T = TypeVar("_T")
+_MISSING = object()
+
+
+class InternCache(Generic[_T]):
+    """A bounded cache of immutable objects parsed from strings, like header values, or computed from other keys.
+
+    Equal keys return the very same object, ``None`` is cached like any other value. Lookups do not take a lock, a
+    parsed object is stored under a lock and the oldest entry is evicted once ``max_size`` is reached. Strings longer
+    than ``max_key_length`` are parsed but not cached, so hostile header values cannot fill the cache with large keys.
+
+    :param parse: Parses a key into an immutable object
+    :param max_size: The maximum number of cached objects
+    :type max_size: int
+    :param max_key_length: The maximum length of a cached string key
+    :type max_key_length: int
+    """
+
+    def __init__(self, parse: Callable[[Hashable], _T], max_size: int = 256, max_key_length: int = 1024):
+        self._parse = parse
+        self.max_size = max_size
+        self.max_key_length = max_key_length
+        self._lock = Lock()
+        self._values: Dict[Hashable, _T] = {}
+
+    def get(self, key: Hashable) -> _T:
+        value = self._values.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = self._parse(key)
+        if self.max_size > 0 and not (isinstance(key, str) and len(key) > self.max_key_length):
+            with self._lock:
+                # another thread might have parsed the same string in the meantime
+                value = self._values.setdefault(key, value)
+                while len(self._values) > self.max_size:
+                    del self._values[next(iter(self._values))]
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._values = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -0,0 +1,17 @@
+from typing import Dict, Tuple, Union
+
+from restit.internal.router import Router
+from restit.resource import Resource
+
+
+class LinearRouter(Router):
+    """Tries the :class:`~restit.internal.resource_path.ResourcePath` of every resource one after the other."""
+
+    def find_resource(self, url: str) -> Union[Tuple[None, None], Tuple[Resource, Dict]]:
+        for resource in self._resources:
+            # noinspection PyProtectedMember
+            is_matching, path_params = resource._get_match(url)
+            if is_matching:
+                return resource, path_params
+
+        return None, None
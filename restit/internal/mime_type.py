@@ -1,9 +1,16 @@
 import re
+from types import MappingProxyType
 
 from restit.common import create_dict_from_assignment_syntax, get_default_encoding
+from restit.internal.intern_cache import InternCache
 
 
 class MIMEType:
+    """A media type with its parameters.
+
+    Instances are shared between requests by :func:`from_string` and must not be modified, the details are read only.
+    """
+
     _REGEX = re.compile(r"^([*a-zA-Z0-9_-]+)/([+*a-zA-Z0-9_-]+)(.+)?$")
 
     # noinspection PyShadowingBuiltins
@@ -18,17 +25,29 @@ class MIMEType:
         self.type = type if type != "*" else None
         self.subtype = subtype if subtype != "*" else None
         self.quality = quality
-        self.details = details or {}
-        self.charset = charset or get_default_encoding()
+        details = dict(details or {})
+        # the default encoding is resolved on access, an interned instance outlives changes of it
+        self._charset = charset
 
-        if "q" not in self.details and quality != 1.0:
-            self.details["q"] = str(quality)
+        if "q" not in details and quality != 1.0:
+            details["q"] = str(quality)
+        self.details = MappingProxyType(details)
 
         if self.type is None and self.subtype is not None:
             raise MIMEType.MIMETypeWildcardHierarchyException(type, subtype)
 
+    @property
+    def charset(self) -> str:
+        """The charset parameter or the default encoding if it is missing"""
+        return self._charset or get_default_encoding()
+
     @staticmethod
     def from_string(mime_type_string: str) -> "MIMEType":
+        """Returns the parsed media type, equal strings return the same interned instance"""
+        return _MIME_TYPE_CACHE.get(mime_type_string)
+
+    @staticmethod
+    def _parse(mime_type_string: str) -> "MIMEType":
         match = MIMEType._REGEX.match(mime_type_string.strip())
         if not match:
             raise MIMEType.MIMETypeParsingException(mime_type_string)
@@ -62,9 +81,12 @@ class MIMEType:
             self.type == other.type
             and self.subtype == other.subtype
             and self.details == other.details
-            and self.charset == other.charset
+            and self._charset == other._charset
         )
 
+    def __hash__(self) -> int:
+        return hash((self.type, self.subtype, self._charset, tuple(sorted(self.details.items()))))
+
     def __gt__(self, other: "MIMEType") -> bool:
         return self.quality > other.quality
 
@@ -79,3 +101,6 @@ class MIMEType:
 
     class MIMETypeWildcardHierarchyException(Exception):
         pass
+
+
+_MIME_TYPE_CACHE = InternCache(MIMEType._parse)
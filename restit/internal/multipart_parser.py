@@ -0,0 +1,261 @@
+import re
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Dict, List, Tuple, Union
+
+from restit.exception import BadRequest, PayloadTooLarge
+
+
+class UploadedFile:
+    """A file part of a *multipart/form-data* body.
+
+    The content is kept in memory up to the spool size and moved to a temporary file above.
+
+    :param name: The name of the form field
+    :type name: str
+    :param filename: The file name the client sent
+    :type filename: str
+    :param content_type: The content type of the part
+    :type content_type: str
+    """
+
+    def __init__(self, name: str, filename: str, content_type: str, spool_size: int):
+        self.name = name
+        self.filename = filename
+        self.content_type = content_type
+        self.size = 0
+        self.file: BinaryIO = SpooledTemporaryFile(max_size=spool_size)
+
+    def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self.file.seek(offset, whence)
+
+    def close(self):
+        self.file.close()
+
+    def __repr__(self):
+        return f"UploadedFile(name={self.name}, filename={self.filename}, size={self.size})"
+
+
+class _Field:
+    def __init__(self, name: str, encoding: str):
+        self.name = name
+        self.encoding = encoding
+        self.size = 0
+        self.data = bytearray()
+
+    def write(self, data: bytes):
+        self.data += data
+
+    def get_value(self) -> str:
+        return self.data.decode(self.encoding)
+
+
+class MultipartParser:
+    """Parses a *multipart/form-data* body while reading it in chunks.
+
+    The boundary is searched in the newly read data only, file parts are streamed into :class:`UploadedFile` instances
+    and fields are collected in memory. The total size is limited by the maximum body size of the request.
+
+    :param body_input: The readable body
+    :param boundary: The boundary from the *Content-Type* header
+    :type boundary: str
+    :param encoding: The encoding of the field values
+    :type encoding: str
+    :param max_part_size: The maximum size of a file part in bytes, `None` for no limit
+    :type max_part_size: int
+    :param max_field_size: The maximum size of a field value in bytes
+    :type max_field_size: int
+    :param max_parts: The maximum number of parts
+    :type max_parts: int
+    :param spool_size: The size in bytes above which a file part is moved to a temporary file
+    :type spool_size: int
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    MAX_HEADER_SIZE = 16 * 1024
+
+    _BOUNDARY_REGEX = re.compile(r"boundary=(?:\"([^\"]+)\"|([^\s;]+))", flags=re.IGNORECASE)
+    _HEADER_PARAMETER_REGEX = re.compile(r";\s*([\w*-]+)=(?:\"((?:[^\"\\]|\\.)*)\"|([^;\s]*))")
+
+    def __init__(
+        self,
+        body_input,
+        boundary: str,
+        encoding: str = "utf-8",
+        max_part_size: int = None,
+        max_field_size: int = 1024 * 1024,
+        max_parts: int = 1000,
+        spool_size: int = 1024 * 1024,
+    ):
+        self._body_input = body_input
+        self._delimiter = b"\r\n--" + boundary.encode("latin-1")
+        self._encoding = encoding
+        self._max_part_size = max_part_size
+        self._max_field_size = max_field_size
+        self._max_parts = max_parts
+        self._spool_size = spool_size
+        # the leading line break lets the first boundary match the delimiter like all following ones
+        self._buffer = bytearray(b"\r\n")
+        self._is_eof = False
+
+    @staticmethod
+    def get_boundary(content_type: str) -> Union[str, None]:
+        """Returns the boundary parameter of a *Content-Type* header value"""
+        match = MultipartParser._BOUNDARY_REGEX.search(content_type or "")
+        if match is None:
+            return None
+        return match.group(1) or match.group(2)
+
+    def parse(self) -> Tuple[Dict[str, Union[str, List[str]]], Dict[str, Union[UploadedFile, List[UploadedFile]]]]:
+        """Returns the fields and the files, a name occurring more than once maps to a list"""
+        fields = {}
+        files = {}
+        part_count = 0
+        try:
+            self._skip_preamble()
+            while self._read_delimiter_end():
+                part_count += 1
+                if part_count > self._max_parts:
+                    raise PayloadTooLarge(f"The multipart body has more than {self._max_parts} parts")
+                part = self._read_part()
+                if isinstance(part, UploadedFile):
+                    self._add_value(files, part.name, part)
+                else:
+                    self._add_value(fields, part.name, part.get_value())
+        except BaseException:
+            for uploaded_file in self._iterate_values(files):
+                uploaded_file.close()
+            raise
+
+        return fields, files
+
+    @staticmethod
+    def _add_value(values: dict, name: str, value):
+        if name not in values:
+            values[name] = value
+        elif isinstance(values[name], list):
+            values[name].append(value)
+        else:
+            values[name] = [values[name], value]
+
+    @staticmethod
+    def _iterate_values(values: dict):
+        for value in values.values():
+            yield from value if isinstance(value, list) else [value]
+
+    def _fill_buffer(self) -> bool:
+        if self._is_eof:
+            return False
+        data = self._body_input.read(self.CHUNK_SIZE)
+        if not data:
+            self._is_eof = True
+            return False
+        self._buffer += data
+        return True
+
+    def _skip_preamble(self):
+        search_start = 0
+        while True:
+            index = self._buffer.find(self._delimiter, search_start)
+            if index >= 0:
+                del self._buffer[: index + len(self._delimiter)]
+                return
+            search_start = max(0, len(self._buffer) - len(self._delimiter) + 1)
+            if not self._fill_buffer():
+                raise BadRequest("The multipart body does not contain the boundary")
+
+    def _read_delimiter_end(self) -> bool:
+        # a delimiter is followed by "--" for the last one or by a line break, transport padding is ignored
+        while True:
+            stripped_length = len(self._buffer) - len(self._buffer.lstrip(b" \t"))
+            if len(self._buffer) - stripped_length >= 2:
+                break
+            if not self._fill_buffer():
+                raise BadRequest("The multipart body ends unexpectedly")
+        del self._buffer[:stripped_length]
+        end = bytes(self._buffer[:2])
+        del self._buffer[:2]
+        if end == b"--":
+            return False
+        if end != b"\r\n":
+            raise BadRequest("The multipart boundary is not followed by a line break")
+        return True
+
+    def _read_part(self) -> Union[UploadedFile, _Field]:
+        part = self._create_part(self._read_part_headers())
+        max_size = self._max_part_size if isinstance(part, UploadedFile) else self._max_field_size
+        while True:
+            index = self._buffer.find(self._delimiter)
+            if index >= 0:
+                self._write_to_part(part, self._buffer[:index], max_size)
+                del self._buffer[: index + len(self._delimiter)]
+                break
+            # everything but a possible beginning of the delimiter belongs to the part, only the kept tail and the
+            # next chunk are searched again
+            length = max(0, len(self._buffer) - len(self._delimiter) + 1)
+            self._write_to_part(part, self._buffer[:length], max_size)
+            del self._buffer[:length]
+            if not self._fill_buffer():
+                if isinstance(part, UploadedFile):
+                    part.close()
+                raise BadRequest("The multipart body ends unexpectedly")
+
+        if isinstance(part, UploadedFile):
+            part.seek(0)
+        return part
+
+    @staticmethod
+    def _write_to_part(part: Union[UploadedFile, _Field], data: bytearray, max_size: Union[int, None]):
+        if not data:
+            return
+        part.size += len(data)
+        if max_size is not None and part.size > max_size:
+            if isinstance(part, UploadedFile):
+                part.close()
+            raise PayloadTooLarge(f"The multipart part {part.name} exceeds the maximum size of {max_size} bytes")
+        if isinstance(part, UploadedFile):
+            part.file.write(data)
+        else:
+            part.write(data)
+
+    def _read_part_headers(self) -> Dict[str, str]:
+        search_start = 0
+        while True:
+            index = self._buffer.find(b"\r\n\r\n", search_start)
+            if index >= 0:
+                break
+            if len(self._buffer) > self.MAX_HEADER_SIZE:
+                raise PayloadTooLarge(f"The multipart part headers exceed {self.MAX_HEADER_SIZE} bytes")
+            search_start = max(0, len(self._buffer) - 3)
+            if not self._fill_buffer():
+                raise BadRequest("The multipart body ends unexpectedly")
+
+        header_lines = self._buffer[:index].decode("utf-8", errors="replace").split("\r\n")
+        del self._buffer[: index + 4]
+        headers = {}
+        for header_line in header_lines:
+            if ":" in header_line:
+                key, value = header_line.split(":", 1)
+                headers[key.strip().lower()] = value.strip()
+        return headers
+
+    def _create_part(self, headers: Dict[str, str]) -> Union[UploadedFile, _Field]:
+        content_disposition = headers.get("content-disposition", "")
+        parameters = {
+            match.group(1).lower(): match.group(2).replace('\\"', '"') if match.group(2) is not None else match.group(3)
+            for match in self._HEADER_PARAMETER_REGEX.finditer(content_disposition)
+        }
+        name = parameters.get("name")
+        if name is None:
+            raise BadRequest("A multipart part has no name in its Content-Disposition header")
+
+        if "filename" in parameters:
+            return UploadedFile(
+                name,
+                parameters["filename"],
+                headers.get("content-type", "application/octet-stream"),
+                self._spool_size,
+            )
+        return _Field(name, self._encoding)
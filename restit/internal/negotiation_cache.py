@@ -0,0 +1,76 @@
+from threading import Lock
+from typing import Any, Dict, Hashable, Union
+
+
+class NegotiationCacheStatistics:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __str__(self):
+        return (
+            f"NegotiationCacheStatistics(hits={self.hits}, misses={self.misses}, evictions={self.evictions}, "
+            f"invalidations={self.invalidations}, hit_rate={self.hit_rate:.3f})"
+        )
+
+
+class NegotiationCache:
+    """Remembers the outcome of the content negotiation, which depends on the *Accept* header and the body type only.
+
+    Lookups do not take a lock. A decision is stored with the generation that was current when the negotiation
+    started, so a decision based on serializers that were replaced in the meantime is dropped instead of cached.
+
+    :param max_size: The maximum number of cached decisions, ``0`` disables the cache
+    :type max_size: int
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.statistics = NegotiationCacheStatistics()
+        self.generation = 0
+        self._lock = Lock()
+        self._decisions: Dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable) -> Union[Any, None]:
+        decision = self._decisions.get(key)
+        if decision is None:
+            self.statistics.misses += 1
+        else:
+            self.statistics.hits += 1
+        return decision
+
+    def put(self, key: Hashable, decision: Any, generation: int):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._decisions[key] = decision
+            while len(self._decisions) > self.max_size:
+                del self._decisions[next(iter(self._decisions))]
+                self.statistics.evictions += 1
+
+    def invalidate(self):
+        with self._lock:
+            self.generation += 1
+            self._decisions = {}
+            self.statistics.invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self._decisions)
@@ -1,4 +1,8 @@
-from marshmallow.fields import Field
+from typing import Any, List, Union
+
+from marshmallow.fields import Field, List as ListField
+
+from restit.internal.schema_or_field_deserializer import SchemaOrFieldDeserializer
 
 
 class QueryParameter:
@@ -10,5 +14,25 @@ class QueryParameter:
         self.description = description
         self.field_type = field_type
 
+    def deserialize(self, value: Union[str, List[str], None]) -> Any:
+        """Converts the parsed query value with the field type.
+
+        A list field takes the repeated values (``?id=1&id=2``) or a single bracketed value (``?id=[1,2]``), any
+        other field takes the last value of a repeated parameter.
+        """
+        if isinstance(self.field_type, ListField):
+            value = QueryParameter._to_list(value)
+        elif isinstance(value, list):
+            value = value[-1]
+        return SchemaOrFieldDeserializer.deserialize(value, self.field_type)
+
+    @staticmethod
+    def _to_list(value: Union[str, List[str], None]) -> Union[List[str], None]:
+        if value is None or isinstance(value, list):
+            return value
+        if value.startswith("[") and value.endswith("]"):
+            return [item.strip().strip("'\"") for item in value[1:-1].split(",")] if value[1:-1].strip() else []
+        return [value]
+
     class UnsupportedQueryFieldTypeException(Exception):
         pass
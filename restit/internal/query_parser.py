@@ -0,0 +1,87 @@
+from typing import Dict, Iterable, List, Union
+from urllib.parse import unquote_plus
+
+from restit.exception import BadRequest, URITooLong
+
+
+class QueryParser:
+    """Parses the *application/x-www-form-urlencoded* syntax of query strings and form bodies.
+
+    Keys and values are percent-decoded, a key occurring more than once maps to the list of its values in the order
+    they were sent. A key without ``=`` maps to an empty string.
+    """
+
+    @staticmethod
+    def parse(
+        query_string: str, max_parameter_count: int = None, max_length: int = None
+    ) -> Dict[str, Union[str, List[str]]]:
+        """Parses a query string.
+
+        :param query_string: The query string without the leading ``?``
+        :type query_string: str
+        :param max_parameter_count: The maximum number of parameters, more raise
+            :class:`~restit.exception.BadRequest`
+        :type max_parameter_count: int
+        :param max_length: The maximum length of the query string, a longer one raises
+            :class:`~restit.exception.URITooLong`
+        :type max_length: int
+        """
+        if not query_string:
+            return {}
+        if max_length is not None and len(query_string) > max_length:
+            raise URITooLong(f"The query string exceeds the maximum length of {max_length} characters")
+        # counting the separators is cheaper than splitting a hostile query string, the empty pairs of stray
+        # separators are only counted out if there are too many of them
+        if (
+            max_parameter_count is not None
+            and query_string.count("&") + 1 > max_parameter_count
+            and sum(1 for pair in query_string.split("&") if pair) > max_parameter_count
+        ):
+            raise BadRequest(f"The query string has more than {max_parameter_count} parameters")
+
+        parameters = {}
+        for pair in query_string.split("&"):
+            QueryParser._add_pair(parameters, pair)
+        return parameters
+
+    @staticmethod
+    def parse_chunks(chunks: Iterable[str]) -> Dict[str, Union[str, List[str]]]:
+        """Parses a form body arriving in chunks, only the pair split between two chunks is kept back.
+
+        :param chunks: The decoded chunks of the body
+        :type chunks: Iterable[str]
+        """
+        parameters = {}
+        pending_chunks = []
+        for chunk in chunks:
+            if "&" not in chunk:
+                pending_chunks.append(chunk)
+                continue
+            pairs = chunk.split("&")
+            pending_chunks.append(pairs[0])
+            QueryParser._add_pair(parameters, "".join(pending_chunks))
+            for pair in pairs[1:-1]:
+                QueryParser._add_pair(parameters, pair)
+            pending_chunks = [pairs[-1]]
+        QueryParser._add_pair(parameters, "".join(pending_chunks))
+        return parameters
+
+    @staticmethod
+    def _add_pair(parameters: Dict[str, Union[str, List[str]]], pair: str):
+        if not pair:
+            return
+        key, _, value = pair.partition("=")
+        key = QueryParser._decode(key)
+        value = QueryParser._decode(value)
+        if key not in parameters:
+            parameters[key] = value
+        elif isinstance(parameters[key], list):
+            parameters[key].append(value)
+        else:
+            parameters[key] = [parameters[key], value]
+
+    @staticmethod
+    def _decode(value: str) -> str:
+        if "%" in value or "+" in value:
+            return unquote_plus(value)
+        return value
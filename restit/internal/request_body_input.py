@@ -0,0 +1,52 @@
+import io
+from typing import Union
+
+from restit.exception import PayloadTooLarge
+
+
+class RequestBodyInput(io.RawIOBase):
+    """Reads the request body from ``wsgi.input``.
+
+    It never reads past the *Content-Length* and raises :class:`~restit.exception.PayloadTooLarge` as soon as more
+    than the maximum body size has been read, which also covers bodies without a *Content-Length*.
+
+    :param wsgi_input: The ``wsgi.input`` stream
+    :param content_length: The *Content-Length* or `None` to read until the end of the stream
+    :type content_length: int
+    :param max_size: The maximum body size in bytes or `None` for no limit
+    :type max_size: int
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, wsgi_input, content_length: Union[int, None], max_size: Union[int, None]):
+        super().__init__()
+        self._wsgi_input = wsgi_input
+        self._remaining = content_length
+        self._max_size = max_size
+        self._size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(self.CHUNK_SIZE), b""))
+
+        if self._remaining is not None:
+            size = min(size, self._remaining)
+        if size == 0:
+            return b""
+
+        data = self._wsgi_input.read(size)
+        self._size += len(data)
+        if self._remaining is not None:
+            self._remaining -= len(data)
+        if self._max_size is not None and self._size > self._max_size:
+            raise PayloadTooLarge(f"The request body exceeds the maximum size of {self._max_size} bytes")
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
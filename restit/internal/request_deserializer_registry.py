@@ -0,0 +1,61 @@
+from typing import Any, BinaryIO, Iterable, Tuple, Type, Union
+
+from restit.internal.intern_cache import InternCache
+from restit.internal.mime_type import MIMEType
+from restit.request_deserializer import RequestDeserializer
+
+
+class RequestDeserializerRegistry:
+    """An immutable, ordered collection of :class:`~restit.request_deserializer.RequestDeserializer` instances.
+
+    The first deserializer that can handle a content type and *Python* type wins. The result of that search is cached
+    per media type and *Python* type, the parameters of the content type, like a multipart boundary, are not part of
+    the key. A registry cannot be changed, registering a deserializer means creating a new registry.
+
+    :param request_deserializers: The deserializers in the order they are tried
+    :type request_deserializers: Iterable[RequestDeserializer]
+    :param max_cache_size: The maximum number of cached lookups
+    :type max_cache_size: int
+    """
+
+    def __init__(self, request_deserializers: Iterable[RequestDeserializer], max_cache_size: int = 256):
+        self._request_deserializers: Tuple[RequestDeserializer, ...] = tuple(request_deserializers)
+        self.max_cache_size = max_cache_size
+        self._cache: InternCache[Union[RequestDeserializer, None]] = InternCache(self._search, max_cache_size)
+
+    @property
+    def request_deserializers(self) -> Tuple[RequestDeserializer, ...]:
+        return self._request_deserializers
+
+    def with_request_deserializers(self, request_deserializers: Iterable[RequestDeserializer]):
+        """Returns a new registry that tries the given deserializers before the ones of this registry"""
+        return RequestDeserializerRegistry((*request_deserializers, *self._request_deserializers), self.max_cache_size)
+
+    def find(self, content_type: MIMEType, python_type: Type) -> Union[RequestDeserializer, None]:
+        return self._cache.get((content_type.type, content_type.subtype, python_type))
+
+    def _search(self, key: Tuple[Union[str, None], Union[str, None], Type]) -> Union[RequestDeserializer, None]:
+        # the parameters are not part of the key, so the search only sees the media type
+        _type, subtype, python_type = key
+        content_type = MIMEType(_type, subtype)
+        for request_deserializer in self._request_deserializers:
+            if request_deserializer.can_handle(content_type, python_type):
+                return request_deserializer
+        return None
+
+    def get(self, content_type: MIMEType, python_type: Type) -> RequestDeserializer:
+        request_deserializer = self.find(content_type, python_type)
+        if request_deserializer is None:
+            raise RequestDeserializerRegistry.NoRequestDeserializerFoundException(
+                f"Unable to find a request deserializer for content type {content_type} to type {python_type}"
+            )
+        return request_deserializer
+
+    def deserialize(self, body: bytes, content_type: MIMEType, python_type: Type) -> Any:
+        return self.get(content_type, python_type).deserialize(body, content_type.charset)
+
+    def deserialize_file(self, body_file: BinaryIO, content_type: MIMEType, python_type: Type) -> Any:
+        return self.get(content_type, python_type).deserialize_file(body_file, content_type.charset)
+
+    class NoRequestDeserializerFoundException(Exception):
+        pass
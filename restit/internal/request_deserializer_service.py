@@ -1,4 +1,4 @@
-from typing import List, Type, Union, Any
+from typing import Any, BinaryIO, Tuple, Type
 
 from restit.internal.default_request_deserializer.default_application_json_dict_deserializer import (
     DefaultApplicationJsonDictDeserializer,
@@ -10,45 +10,55 @@ from restit.internal.default_request_deserializer.default_form_data_dict_deseria
     DefaultFormDataDictDeserializer,
 )
 from restit.internal.mime_type import MIMEType
+from restit.internal.request_deserializer_registry import RequestDeserializerRegistry
 from restit.request_deserializer import RequestDeserializer
 
-_DEFAULT_REQUEST_DESERIALIZER = [
-    DefaultApplicationJsonDictDeserializer(),
-    DefaultFormDataDictDeserializer(),
-    DefaultFallbackDictDeserializer(),
-]
+_DEFAULT_REQUEST_DESERIALIZER = RequestDeserializerRegistry(
+    [
+        DefaultApplicationJsonDictDeserializer(),
+        DefaultFormDataDictDeserializer(),
+        DefaultFallbackDictDeserializer(),
+    ]
+)
 
 
 class RequestDeserializerService:
-    _REQUEST_DESERIALIZER: List[RequestDeserializer] = _DEFAULT_REQUEST_DESERIALIZER.copy()
+    """The process wide deserializers.
+
+    :class:`~restit.RestItApp` takes a snapshot of them when it is initialized, together with the deserializers passed
+    to the application, so a later registration here does not affect running applications.
+    """
+
+    _REGISTRY: RequestDeserializerRegistry = _DEFAULT_REQUEST_DESERIALIZER
+
+    NoRequestDeserializerFoundException = RequestDeserializerRegistry.NoRequestDeserializerFoundException
 
     @staticmethod
     def register_request_deserializer(request_deserializer: RequestDeserializer):
-        RequestDeserializerService._REQUEST_DESERIALIZER.insert(0, request_deserializer)
+        RequestDeserializerService._REGISTRY = RequestDeserializerService._REGISTRY.with_request_deserializers(
+            [request_deserializer]
+        )
 
     @staticmethod
     def clear_all_request_deserializers():
-        RequestDeserializerService._REQUEST_DESERIALIZER.clear()
+        RequestDeserializerService._REGISTRY = RequestDeserializerRegistry([])
 
     @staticmethod
     def restore_default_request_deserializers():
-        RequestDeserializerService._REQUEST_DESERIALIZER = _DEFAULT_REQUEST_DESERIALIZER.copy()
+        RequestDeserializerService._REGISTRY = _DEFAULT_REQUEST_DESERIALIZER
 
     @staticmethod
-    def deserialize_request_body(body: bytes, content_type: MIMEType, python_type: Type) -> Any:
-        request_deserializer = RequestDeserializerService._find_deserializer(content_type, python_type)
-        if request_deserializer is None:
-            raise RequestDeserializerService.NoRequestDeserializerFoundException(
-                f"Unable to find a request deserializer for content type {content_type} " f"to type {python_type}"
-            )
-        deserialized_value = request_deserializer.deserialize(body, content_type.charset)
-        return deserialized_value
+    def get_registry() -> RequestDeserializerRegistry:
+        return RequestDeserializerService._REGISTRY
 
     @staticmethod
-    def _find_deserializer(content_type: MIMEType, python_type: Type) -> Union[RequestDeserializer, None]:
-        for request_deserializer in RequestDeserializerService._REQUEST_DESERIALIZER:
-            if request_deserializer.can_handle(content_type, python_type):
-                return request_deserializer
+    def get_request_deserializers() -> Tuple[RequestDeserializer, ...]:
+        return RequestDeserializerService._REGISTRY.request_deserializers
 
-    class NoRequestDeserializerFoundException(Exception):
-        pass
+    @staticmethod
+    def deserialize_request_body(body: bytes, content_type: MIMEType, python_type: Type) -> Any:
+        return RequestDeserializerService._REGISTRY.deserialize(body, content_type, python_type)
+
+    @staticmethod
+    def deserialize_request_body_file(body_file: BinaryIO, content_type: MIMEType, python_type: Type) -> Any:
+        return RequestDeserializerService._REGISTRY.deserialize_file(body_file, content_type, python_type)
@@ -1,5 +1,5 @@
 import re
-from typing import Tuple, Union, Dict, AnyStr, Match
+from typing import Tuple, Union, Dict, AnyStr, Match, Pattern
 
 
 class ResourcePath:
@@ -12,6 +12,7 @@ class ResourcePath:
         None: (_STRING_PATTERN, str),
     }
     _PATH_PARAM_REGEX = re.compile(r":(\w+)(?:<(\w+)>)?")
+    _REGEX_CHARACTERS = set("\\^$*+?{}[]|()")
 
     def __init__(self, request_mapping: str):
         self._request_mapping = request_mapping
@@ -24,13 +25,49 @@ class ResourcePath:
         return re.compile(regex_pattern)
 
     def _handle_path_param(self, match: Match) -> str:
-        self._type_mapping[match.group(1)] = ResourcePath._TYPE_MAPPING.get(
-            match.group(2), ResourcePath._TYPE_MAPPING["str"]
-        )[1]
+        return ResourcePath.create_path_param_group(match, self._type_mapping)
+
+    @staticmethod
+    def create_path_param_group(match: Match, type_mapping: Dict[str, type]) -> str:
+        """Returns the named regex group for a path parameter match and adds its python type to the type mapping"""
+        pattern, python_type = ResourcePath.get_path_param_pattern_and_type(match.group(2))
+        type_mapping[match.group(1)] = python_type
+        return f"(?P<{match.group(1)}>" + pattern + ")"
+
+    @staticmethod
+    def get_path_param_pattern_and_type(type_name: Union[str, None]) -> Tuple[str, type]:
         try:
-            return f"(?P<{match.group(1)}>" + ResourcePath._TYPE_MAPPING[match.group(2)][0] + ")"
+            return ResourcePath._TYPE_MAPPING[type_name]
         except KeyError:
-            raise ResourcePath.UnknownPathParamTypeAnnotation(match.group(2))
+            raise ResourcePath.UnknownPathParamTypeAnnotation(type_name)
+
+    @staticmethod
+    def get_path_param_regex() -> Pattern:
+        return ResourcePath._PATH_PARAM_REGEX
+
+    @staticmethod
+    def contains_regex(request_mapping: str) -> bool:
+        """Does the request mapping contain regular expression syntax besides path parameters?
+
+        A dot is not considered to be regular expression syntax.
+        """
+        return not ResourcePath._REGEX_CHARACTERS.isdisjoint(request_mapping)
+
+    @staticmethod
+    def is_static(request_mapping: str) -> bool:
+        """Is the request mapping free of path parameters and regular expression syntax?"""
+        return (
+            ResourcePath._PATH_PARAM_REGEX.search(request_mapping) is None
+            and not ResourcePath.contains_regex(request_mapping)
+        )
+
+    @property
+    def regex(self) -> Pattern:
+        return self._request_mapping_regex
+
+    @property
+    def type_mapping(self) -> Dict[str, type]:
+        return self._type_mapping
 
     def get_match(self, url: str) -> Tuple[bool, Union[None, Dict[str, AnyStr]]]:
         match = self._request_mapping_regex.match(url)
@@ -26,8 +26,11 @@ from restit.internal.default_response_serializer.str_fallback_response_serialize
     StringFallbackResponseSerializer,
 )
 from restit.internal.http_accept import HttpAccept
+from restit.internal.negotiation_cache import NegotiationCache, NegotiationCacheStatistics
 from restit.internal.response_status_parameter import ResponseStatusParameter
 from restit.response_serializer import ResponseSerializer, CanHandleResultType
+from restit.static_file_response import StaticFileResponse
+from restit.streaming_response import StreamingResponse
 
 _DEFAULT_RESPONSE_SERIALIZER = [
     DefaultDictJsonResponseSerializer(),
@@ -44,25 +47,44 @@ _DEFAULT_RESPONSE_SERIALIZER = [
 
 class ResponseSerializerService:
     _RESPONSE_SERIALIZER: List[ResponseSerializer] = _DEFAULT_RESPONSE_SERIALIZER.copy()
+    _NEGOTIATION_CACHE = NegotiationCache()
 
     @staticmethod
     def register_response_serializer(response_serializer: ResponseSerializer):
-        ResponseSerializerService._RESPONSE_SERIALIZER.insert(0, response_serializer)
+        # a new list, a negotiation running concurrently keeps iterating over the previous one
+        response_serializers = [response_serializer, *ResponseSerializerService._RESPONSE_SERIALIZER]
+        ResponseSerializerService._RESPONSE_SERIALIZER = response_serializers
+        ResponseSerializerService._NEGOTIATION_CACHE.invalidate()
 
     @staticmethod
     def clear_all_response_serializer():
         ResponseSerializerService._RESPONSE_SERIALIZER = []
+        ResponseSerializerService._NEGOTIATION_CACHE.invalidate()
 
     @staticmethod
     def restore_default_response_serializer():
         ResponseSerializerService._RESPONSE_SERIALIZER = _DEFAULT_RESPONSE_SERIALIZER.copy()
+        ResponseSerializerService._NEGOTIATION_CACHE.invalidate()
+
+    @staticmethod
+    def get_negotiation_cache_statistics() -> NegotiationCacheStatistics:
+        """Returns the hits and misses of the cached serializer decisions"""
+        return ResponseSerializerService._NEGOTIATION_CACHE.statistics
+
+    @staticmethod
+    def set_negotiation_cache_size(max_size: int):
+        """Sets the maximum number of cached serializer decisions, ``0`` disables the cache"""
+        ResponseSerializerService._NEGOTIATION_CACHE.max_size = max_size
+        ResponseSerializerService._NEGOTIATION_CACHE.invalidate()
 
     @staticmethod
     def get_matching_response_serializer_for_media_type(
-        http_accept: HttpAccept,
+        http_accept: HttpAccept, response_serializers: List[ResponseSerializer] = None
     ) -> List[Tuple[ResponseSerializer, CanHandleResultType]]:
         response_serializer_matches = []
-        for response_serializer in ResponseSerializerService._RESPONSE_SERIALIZER:
+        if response_serializers is None:
+            response_serializers = ResponseSerializerService._RESPONSE_SERIALIZER
+        for response_serializer in response_serializers:
             can_handle_result = response_serializer.can_handle_incoming_media_type(http_accept)
             if can_handle_result is not None:
                 response_serializer_matches.append((response_serializer, can_handle_result))
@@ -79,31 +101,80 @@ class ResponseSerializerService:
         http_accept: HttpAccept,
         response_status_parameter: Union[None, ResponseStatusParameter] = None,
     ):
+        if isinstance(response, StreamingResponse):
+            ResponseSerializerService._prepare_streaming_response(response, http_accept, response_status_parameter)
+            return
+        if isinstance(response, StaticFileResponse):
+            # the file is sent as it is, there is nothing to negotiate
+            response._prepare_headers("application/octet-stream")
+            return
+        response_serializer, can_handle_result = ResponseSerializerService.find_response_serializer(
+            http_accept, type(response.response_body_input)
+        )
+        response.content, content_type = response_serializer.validate_and_serialize(
+            response.response_body_input,
+            response_status_parameter,
+            can_handle_result,
+        )
+        # Todo encoding from incoming accept charset
+        try:
+            response.text = response.content.decode()
+        except UnicodeDecodeError:
+            response.text = None
+        response._prepare_headers(content_type)
+
+    @staticmethod
+    def _prepare_streaming_response(
+        response: StreamingResponse,
+        http_accept: HttpAccept,
+        response_status_parameter: Union[None, ResponseStatusParameter],
+    ):
+        if response.item_type is None:
+            response._prepare_streaming_body(None, "application/octet-stream")
+            return
+        # negotiated once, every item is serialized with the same serializer
+        response_serializer, can_handle_result = ResponseSerializerService.find_response_serializer(
+            http_accept, response.item_type
+        )
+
+        def serialize(item) -> bytes:
+            return response_serializer.validate_and_serialize(item, response_status_parameter, can_handle_result)[0]
+
+        response._prepare_streaming_body(serialize, can_handle_result.content_type)
+
+    @staticmethod
+    def find_response_serializer(
+        http_accept: HttpAccept, response_data_type: type
+    ) -> Tuple[ResponseSerializer, CanHandleResultType]:
+        """Returns the serializer with the best matching media type that can serialize the response data type.
+
+        The decision is cached per *Accept* header and response data type until the serializers change.
+        """
+        negotiation_cache = ResponseSerializerService._NEGOTIATION_CACHE
+        key = (http_accept, response_data_type)
+        decision = negotiation_cache.get(key)
+        if decision is None:
+            generation = negotiation_cache.generation
+            decision = ResponseSerializerService._negotiate(
+                http_accept, response_data_type, ResponseSerializerService._RESPONSE_SERIALIZER
+            )
+            negotiation_cache.put(key, decision, generation)
+        return decision
+
+    @staticmethod
+    def _negotiate(
+        http_accept: HttpAccept, response_data_type: type, response_serializers: List[ResponseSerializer]
+    ) -> Tuple[ResponseSerializer, CanHandleResultType]:
         matching_response_serializer_list = ResponseSerializerService.get_matching_response_serializer_for_media_type(
-            http_accept
+            http_accept, response_serializers
         )
         if not matching_response_serializer_list:
             raise NotAcceptable()
 
         for response_serializer, can_handle_result in matching_response_serializer_list:
-            if isinstance(
-                response.response_body_input,
-                response_serializer.get_response_data_type(),
-            ):
-                (response.content, content_type,) = response_serializer.validate_and_serialize(
-                    response.response_body_input,
-                    response_status_parameter,
-                    can_handle_result,
-                )
-                # Todo encoding from incoming accept charset
-                try:
-                    response.text = response.content.decode()
-                except UnicodeDecodeError:
-                    response.text = None
-                response._prepare_headers(content_type)
-                return
+            if issubclass(response_data_type, response_serializer.get_response_data_type()):
+                return response_serializer, can_handle_result
 
         raise Response.ResponseBodyTypeNotSupportedException(
-            f"Unable to find response data serializer for {http_accept} and response data type "
-            f"{type(response.response_body_input)}"
+            f"Unable to find response data serializer for {http_accept} and response data type {response_data_type}"
         )
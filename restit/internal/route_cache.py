@@ -0,0 +1,168 @@
+from collections import OrderedDict
+from threading import Lock
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Tuple, Union
+
+from restit.resource import Resource
+
+
+class CachedRoute(NamedTuple):
+    resource: Union[Resource, None]
+    path_params: Union[Mapping, None]
+
+    @staticmethod
+    def from_match(resource: Union[Resource, None], path_params: Union[Dict, None]) -> "CachedRoute":
+        return CachedRoute(resource, MappingProxyType(dict(path_params)) if path_params is not None else None)
+
+    def to_tuple(self):
+        """Returns the resource and a copy of the path parameters, that can be modified while handling the request"""
+        return self.resource, dict(self.path_params) if self.path_params is not None else None
+
+
+class RouteCacheStatistics:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def to_dict(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def __str__(self):
+        return f"RouteCacheStatistics(hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+
+
+class RouteCache:
+    """Base class of the caches :class:`~restit.RestItApp` uses to remember the resource found for an url.
+
+    The cached path parameters are read only, use :func:`CachedRoute.to_tuple` to get a copy.
+
+    :param max_size: The maximum number of cached routes, ``0`` disables the cache
+    :type max_size: int
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.statistics = RouteCacheStatistics()
+
+    def get(self, url: str) -> Union[CachedRoute, None]:
+        cached_route = self._lookup(url)
+        if cached_route is None:
+            self.statistics.misses += 1
+        else:
+            self.statistics.hits += 1
+        return cached_route
+
+    def put(self, url: str, resource: Union[Resource, None], path_params: Union[Dict, None]) -> CachedRoute:
+        cached_route = CachedRoute.from_match(resource, path_params)
+        if self.max_size > 0:
+            self._store(url, cached_route)
+        return cached_route
+
+    def create_empty(self) -> "RouteCache":
+        """Returns a new empty cache with the same settings, that keeps counting on the same statistics"""
+        route_cache = self.__class__(self.max_size)
+        route_cache.statistics = self.statistics
+        return route_cache
+
+    def clear(self):
+        raise NotImplementedError()
+
+    def _lookup(self, url: str) -> Union[CachedRoute, None]:
+        raise NotImplementedError()
+
+    def _store(self, url: str, cached_route: CachedRoute):
+        raise NotImplementedError()
+
+    def __len__(self) -> int:
+        raise NotImplementedError()
+
+
+class LRURouteCache(RouteCache):
+    """Evicts the least recently used route once ``max_size`` is reached."""
+
+    def __init__(self, max_size: int = 1024):
+        super().__init__(max_size)
+        self._lock = Lock()
+        self._cached_routes: "OrderedDict[str, CachedRoute]" = OrderedDict()
+
+    def clear(self):
+        with self._lock:
+            self._cached_routes.clear()
+
+    def _lookup(self, url: str) -> Union[CachedRoute, None]:
+        with self._lock:
+            cached_route = self._cached_routes.get(url)
+            if cached_route is not None:
+                self._cached_routes.move_to_end(url)
+            return cached_route
+
+    def _store(self, url: str, cached_route: CachedRoute):
+        with self._lock:
+            self._cached_routes[url] = cached_route
+            self._cached_routes.move_to_end(url)
+            while len(self._cached_routes) > self.max_size:
+                self._cached_routes.popitem(last=False)
+                self.statistics.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._cached_routes)
+
+
+class ClockRouteCache(RouteCache):
+    """Approximates LRU with the CLOCK algorithm.
+
+    A hit only sets a reference bit and does not reorder anything, so lookups do not need a lock. On insertion the
+    clock hand skips and clears referenced slots and evicts the first unreferenced one.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        super().__init__(max_size)
+        self._lock = Lock()
+        self._slots: Dict[str, int] = {}
+        self._entries: List[Union[Tuple[str, CachedRoute], None]] = [None] * max_size
+        self._referenced: List[bool] = [False] * max_size
+        self._hand = 0
+
+    def clear(self):
+        with self._lock:
+            self._slots = {}
+            self._entries = [None] * self.max_size
+            self._referenced = [False] * self.max_size
+            self._hand = 0
+
+    def _lookup(self, url: str) -> Union[CachedRoute, None]:
+        slot = self._slots.get(url)
+        if slot is None:
+            return None
+        entry = self._entries[slot]
+        # the slot might have been reused for another url in the meantime
+        if entry is None or entry[0] != url:
+            return None
+        self._referenced[slot] = True
+        return entry[1]
+
+    def _store(self, url: str, cached_route: CachedRoute):
+        with self._lock:
+            slot = self._slots.get(url)
+            if slot is None:
+                slot = self._find_free_slot()
+            self._entries[slot] = url, cached_route
+            self._referenced[slot] = True
+            self._slots[url] = slot
+
+    def _find_free_slot(self) -> int:
+        while self._referenced[self._hand]:
+            self._referenced[self._hand] = False
+            self._hand = (self._hand + 1) % self.max_size
+
+        slot = self._hand
+        self._hand = (self._hand + 1) % self.max_size
+        evicted_entry = self._entries[slot]
+        if evicted_entry is not None:
+            del self._slots[evicted_entry[0]]
+            self.statistics.evictions += 1
+        return slot
+
+    def __len__(self) -> int:
+        return len(self._slots)
@@ -0,0 +1,17 @@
+from typing import Dict, List, Tuple, Union
+
+from restit.resource import Resource
+
+
+class Router:
+    """Base class for the routing backends of :class:`~restit.RestItApp`.
+
+    A router is built once from the resources in the order given by :func:`Resource.sort_resources`. For an incoming
+    url it has to return the first resource in that order that matches the url together with its path parameters.
+    """
+
+    def __init__(self, resources: List[Resource]):
+        self._resources = resources
+
+    def find_resource(self, url: str) -> Union[Tuple[None, None], Tuple[Resource, Dict]]:
+        raise NotImplementedError()
@@ -0,0 +1,34 @@
+from restit.internal.route_cache import RouteCacheStatistics
+
+
+class RoutingStatistics:
+    """Counts the route lookups of :class:`~restit.RestItApp` by the kind of route they ended up with.
+
+    - ``static``: The url was found in the exact match table of the request mappings without path parameters
+    - ``dynamic``: The url was matched by the route cache or the router
+    - ``not_found``: No resource matches the url
+    """
+
+    STATIC = "static"
+    DYNAMIC = "dynamic"
+    NOT_FOUND = "not_found"
+
+    def __init__(self, route_cache_statistics: RouteCacheStatistics):
+        self.route_kinds = {
+            RoutingStatistics.STATIC: 0,
+            RoutingStatistics.DYNAMIC: 0,
+            RoutingStatistics.NOT_FOUND: 0,
+        }
+        self.route_cache_statistics = route_cache_statistics
+
+    def count(self, route_kind: str):
+        self.route_kinds[route_kind] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "route_kinds": dict(self.route_kinds),
+            "route_cache": self.route_cache_statistics.to_dict(),
+        }
+
+    def __str__(self):
+        return f"RoutingStatistics(route_kinds={self.route_kinds}, route_cache={self.route_cache_statistics})"
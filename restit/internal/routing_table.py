@@ -0,0 +1,156 @@
+from typing import Callable, Dict, Hashable, List, Tuple, Type, Union
+
+from restit.internal.resource_path import ResourcePath
+from restit.internal.route_cache import CachedRoute, RouteCache
+from restit.internal.router import Router
+from restit.internal.routing_statistics import RoutingStatistics
+from restit.namespace import Namespace
+from restit.resource import Resource
+
+
+class _HostRoutes:
+    __slots__ = ("router", "mounted_routers", "static_routes")
+
+    def __init__(self, resources: Tuple[Resource, ...], namespaces: List[Namespace], router_class: Type[Router]):
+        # the resources of a namespace with path parameters in its prefix are routed like the ones of the application
+        # noinspection PyProtectedMember
+        resources = tuple(
+            Resource.sort_resources(
+                [*resources, *(r for n in namespaces if not n.is_mounted for r in n._adapt_resources())]
+            )
+        )
+        self.router = router_class(list(resources))
+        mounted_resources: Dict[str, List[Resource]] = {}
+        for namespace in (n for n in namespaces if n.is_mounted):
+            namespace_resources = mounted_resources.setdefault(namespace.path, [])
+            namespace_resources.extend(r for r in namespace.resources if r not in namespace_resources)
+        self.mounted_routers: Dict[str, Router] = {
+            prefix: router_class(Resource.sort_resources(prefix_resources))
+            for prefix, prefix_resources in mounted_resources.items()
+        }
+        self.static_routes: Dict[str, CachedRoute] = self._create_static_routes(resources, mounted_resources)
+
+    def _create_static_routes(
+        self, resources: Tuple[Resource, ...], mounted_resources: Dict[str, List[Resource]]
+    ) -> Dict[str, CachedRoute]:
+        urls = [resource.__request_mapping__ for resource in resources]
+        for prefix, prefix_resources in mounted_resources.items():
+            urls.extend(prefix + resource.__request_mapping__ for resource in prefix_resources)
+
+        # the lookup decides which resource wins, since a preceding regex request mapping might shadow the path
+        static_routes = {}
+        for url in urls:
+            if ResourcePath.is_static(url) and url not in static_routes:
+                winning_resource, path_params = self.find_resource(url)
+                if winning_resource is not None:
+                    static_routes[url] = CachedRoute.from_match(winning_resource, path_params)
+
+        return static_routes
+
+    def find_resource(self, url: str) -> Union[Tuple[None, None], Tuple[Resource, Dict]]:
+        if self.mounted_routers:
+            # try the mounted prefixes from the longest to the shortest one, e.g. /a/b, /a and the root mount
+            index = len(url)
+            while index >= 0:
+                mounted_router = self.mounted_routers.get(url[:index])
+                if mounted_router is not None:
+                    resource, path_params = mounted_router.find_resource(url[index:] or "/")
+                    if resource is not None:
+                        return resource, path_params
+                index = url.rfind("/", 0, index)
+
+        return self.router.find_resource(url)
+
+
+class RoutingTable:
+    """An immutable snapshot of the routing state of :class:`~restit.RestItApp`.
+
+    A snapshot is never modified once it is created. Registering resources at runtime builds a new snapshot off to the
+    side, which is then swapped in with a single attribute assignment. Request threads read the current snapshot once
+    per request and never need a lock. Every snapshot has its own route cache, so the swap also invalidates all cached
+    routes.
+
+    The resources of a :class:`~restit.Namespace` get a router of their own, which is only searched for urls below
+    the namespace path. The resources of a namespace with path parameters in its path are part of the router of the
+    application instead. Namespaces bound to a host get a route index per host name, which also contains everything not
+    bound to any host. Requests for other hosts only search the index of the unbound resources and namespaces.
+
+    :param resources: The initialized resources, that are not part of a namespace
+    :type resources: List[Resource]
+    :param namespaces: The namespaces with initialized resources
+    :type namespaces: List[Namespace]
+    :param router_class: The routing backend
+    :type router_class: Type[Router]
+    :param route_cache: An empty route cache
+    :type route_cache: RouteCache
+    :param wsgi_apps: The mounted *WSGI* applications by path prefix
+    :type wsgi_apps: Dict[str, Callable]
+    """
+
+    def __init__(
+        self,
+        resources: List[Resource],
+        namespaces: List[Namespace],
+        router_class: Type[Router],
+        route_cache: RouteCache,
+        wsgi_apps: Dict[str, Callable] = None,
+    ):
+        self.resources: Tuple[Resource, ...] = tuple(Resource.sort_resources(resources))
+        self.namespaces: Tuple[Namespace, ...] = tuple(namespaces)
+        self.route_cache = route_cache
+        self.wsgi_apps: Dict[str, Callable] = dict(wsgi_apps or {})
+        self._router_class = router_class
+        self._default_routes = _HostRoutes(self.resources, [n for n in self.namespaces if n.host is None], router_class)
+        self._routes_by_host: Dict[str, _HostRoutes] = {
+            host_name: _HostRoutes(
+                self.resources, [n for n in self.namespaces if n.host in (None, host_name)], router_class
+            )
+            for host_name in {n.host for n in self.namespaces if n.host is not None}
+        }
+        self.is_host_aware = len(self._routes_by_host) > 0
+
+    def with_resources(
+        self, resources: List[Resource], namespaces: List[Namespace] = None, wsgi_apps: Dict[str, Callable] = None
+    ) -> "RoutingTable":
+        """Returns a new snapshot containing the additional, already initialized resources, namespaces and mounted
+        *WSGI* applications"""
+        return RoutingTable(
+            list(self.resources) + list(resources),
+            list(self.namespaces) + list(namespaces or []),
+            self._router_class,
+            self.route_cache.create_empty(),
+            {**self.wsgi_apps, **(wsgi_apps or {})},
+        )
+
+    def find_wsgi_app(self, url: str) -> Union[Tuple[str, Callable], None]:
+        """Returns the longest path prefix of the url a *WSGI* application is mounted at together with the
+        application"""
+        index = len(url)
+        while index >= 0:
+            wsgi_app = self.wsgi_apps.get(url[:index])
+            if wsgi_app is not None:
+                return url[:index], wsgi_app
+            index = url.rfind("/", 0, index)
+
+        return None
+
+    def find_route(self, url: str, host_name: str = None) -> Tuple[CachedRoute, str]:
+        """Returns the cached route for the url and host name together with its route kind"""
+        host_routes = self._routes_by_host.get(host_name) if host_name is not None else None
+        if host_routes is None:
+            host_routes = self._default_routes
+            cache_key: Hashable = url
+        else:
+            cache_key = (host_name, url)
+
+        static_route = host_routes.static_routes.get(url)
+        if static_route is not None:
+            return static_route, RoutingStatistics.STATIC
+
+        cached_route = self.route_cache.get(cache_key)
+        if cached_route is None:
+            resource, path_params = host_routes.find_resource(url)
+            cached_route = self.route_cache.put(cache_key, resource, path_params)
+
+        route_kind = RoutingStatistics.DYNAMIC if cached_route.resource is not None else RoutingStatistics.NOT_FOUND
+        return cached_route, route_kind
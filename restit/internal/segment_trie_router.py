@@ -0,0 +1,149 @@
+import re
+from math import inf
+from typing import Dict, List, Tuple, Union
+
+from restit.internal.resource_path import ResourcePath
+from restit.internal.router import Router
+from restit.resource import Resource
+
+_Candidate = Tuple[int, Resource, Dict]
+
+
+class _SegmentPattern:
+    """A single path segment containing one or more path parameters, e.g. ``:id<int>`` or ``report_:year.pdf``."""
+
+    def __init__(self, segment: str):
+        self._type_mapping = {}
+        regex_pattern = ""
+        position = 0
+        for match in ResourcePath.get_path_param_regex().finditer(segment):
+            regex_pattern += re.escape(segment[position : match.start()]) + ResourcePath.create_path_param_group(
+                match, self._type_mapping
+            )
+            position = match.end()
+        regex_pattern += re.escape(segment[position:])
+        self.key = regex_pattern
+        self._regex = re.compile("^" + regex_pattern + "$")
+
+    def match(self, segment: str) -> Union[Dict, None]:
+        match = self._regex.match(segment)
+        if match:
+            return {param: self._type_mapping[param](value) for param, value in match.groupdict().items()}
+
+        return None
+
+
+class _TrieNode:
+    __slots__ = ["static_children", "pattern_children", "resource", "priority", "min_priority"]
+
+    def __init__(self):
+        self.static_children: Dict[str, _TrieNode] = {}
+        self.pattern_children: Dict[str, Tuple[_SegmentPattern, _TrieNode]] = {}
+        self.resource: Union[Resource, None] = None
+        self.priority = inf
+        self.min_priority = inf
+
+
+class SegmentTrieRouter(Router):
+    """Indexes the request mappings segment by segment in a trie.
+
+    Static segments are looked up in a dictionary, segments with path parameters are tried in registration order.
+    Every resource gets its position in the sorted resource list as priority and the lookup returns the matching
+    resource with the lowest priority, so the precedence of :func:`Resource.sort_resources` is kept. Sub trees that
+    can not contain a better candidate than the one already found are skipped, so the lookup time depends on the
+    depth of the path rather than on the number of resources.
+
+    .. note::
+
+        A dot inside a request mapping is matched literally by this router.
+
+    Request mappings containing other regular expression syntax (like the one of
+    :class:`~restit.StaticDirectoryResource`) can not be split into segments. They are tried one after the other
+    using their :class:`~restit.internal.resource_path.ResourcePath`, filtered by their literal prefix.
+    """
+
+    _NON_LITERAL_CHARACTERS = set("\\^$*+?{}[]|().:")
+    _QUANTIFIER_CHARACTERS = set("?*{")
+
+    def __init__(self, resources: List[Resource]):
+        super().__init__(resources)
+        self._root = _TrieNode()
+        self._regex_routes: List[Tuple[int, str, Resource]] = []
+        for priority, resource in enumerate(resources):
+            request_mapping = resource.__request_mapping__
+            if ResourcePath.contains_regex(request_mapping):
+                self._regex_routes.append((priority, self._get_literal_prefix(request_mapping), resource))
+            else:
+                self._insert(request_mapping, priority, resource)
+
+    def _insert(self, request_mapping: str, priority: int, resource: Resource):
+        node = self._root
+        node.min_priority = min(node.min_priority, priority)
+        for segment in request_mapping.split("/"):
+            if ":" in segment:
+                segment_pattern = _SegmentPattern(segment)
+                _, node = node.pattern_children.setdefault(segment_pattern.key, (segment_pattern, _TrieNode()))
+            else:
+                node = node.static_children.setdefault(segment, _TrieNode())
+            node.min_priority = min(node.min_priority, priority)
+
+        if node.resource is None:
+            node.resource = resource
+            node.priority = priority
+
+    @staticmethod
+    def _get_literal_prefix(request_mapping: str) -> str:
+        if "|" in request_mapping:
+            return ""
+
+        for index, character in enumerate(request_mapping):
+            if character in SegmentTrieRouter._NON_LITERAL_CHARACTERS:
+                if character in SegmentTrieRouter._QUANTIFIER_CHARACTERS:
+                    index -= 1
+                return request_mapping[: max(index, 0)]
+
+        return request_mapping
+
+    def find_resource(self, url: str) -> Union[Tuple[None, None], Tuple[Resource, Dict]]:
+        best = self._search(self._root, url.split("/"), 0, {}, None)
+        for priority, literal_prefix, resource in self._regex_routes:
+            if best is not None and priority >= best[0]:
+                break
+            if url.startswith(literal_prefix):
+                # noinspection PyProtectedMember
+                is_matching, path_params = resource._get_match(url)
+                if is_matching:
+                    best = priority, resource, path_params
+                    break
+
+        if best is None:
+            return None, None
+
+        return best[1], best[2]
+
+    def _search(
+        self, node: _TrieNode, segments: List[str], index: int, path_params: Dict, best: Union[_Candidate, None]
+    ) -> Union[_Candidate, None]:
+        if best is not None and node.min_priority >= best[0]:
+            return best
+
+        if index == len(segments):
+            if node.resource is not None and (best is None or node.priority < best[0]):
+                return node.priority, node.resource, path_params
+            return best
+
+        segment = segments[index]
+        static_child = node.static_children.get(segment)
+        if static_child is not None:
+            best = self._search(static_child, segments, index + 1, path_params, best)
+
+        for segment_pattern, pattern_child in node.pattern_children.values():
+            if best is not None and pattern_child.min_priority >= best[0]:
+                continue
+            segment_path_params = segment_pattern.match(segment)
+            if segment_path_params is not None:
+                best = self._search(
+                    pattern_child, segments, index + 1, {**path_params, **segment_path_params}, best
+                )
+
+        return best
@@ -0,0 +1,61 @@
+from typing import Any, Callable, Iterable, Union
+
+
+class StreamingBody:
+    """The iterable a streamed response body is handed to the *WSGI* server as.
+
+    Chunks of type `bytes` are passed on as they are, `str` chunks are encoded and all other chunks are serialized one
+    by one. The server calls :func:`close` once the body is sent or the client has disconnected, it is passed on to
+    the iterable of the response.
+
+    :param iterable: The response body
+    :param serialize: Turns a chunk that is neither `bytes` nor `str` into bytes, `None` if such chunks are not expected
+    :param encoding: The encoding of `str` chunks
+    :type encoding: str
+    """
+
+    def __init__(
+        self, iterable: Iterable[Any], serialize: Union[Callable[[Any], bytes], None] = None, encoding: str = "utf-8"
+    ):
+        self._iterable = iterable
+        self._iterator = None
+        self._serialize = serialize
+        self._encoding = encoding
+        self._is_closed = False
+
+    def __iter__(self) -> "StreamingBody":
+        return self
+
+    def __next__(self) -> bytes:
+        if self._is_closed:
+            raise StopIteration
+        if self._iterator is None:
+            self._iterator = iter(self._iterable)
+        chunk = next(self._iterator)
+        if isinstance(chunk, bytes):
+            return chunk
+        if isinstance(chunk, (bytearray, memoryview)):
+            return bytes(chunk)
+        if isinstance(chunk, str) and self._serialize is None:
+            return chunk.encode(self._encoding)
+        if self._serialize is None:
+            raise StreamingBody.ChunkTypeNotSupportedException(
+                f"Unable to stream a chunk of type {type(chunk)}, pass the item type to the response to serialize it"
+            )
+        return self._serialize(chunk)
+
+    def close(self):
+        if self._is_closed:
+            return
+        self._is_closed = True
+        # a generator is its own iterator, other iterables might have a closeable iterator of their own
+        closeables = [self._iterable]
+        if self._iterator is not None and self._iterator is not self._iterable:
+            closeables.append(self._iterator)
+        for closeable in closeables:
+            close = getattr(closeable, "close", None)
+            if close is not None:
+                close()
+
+    class ChunkTypeNotSupportedException(Exception):
+        pass
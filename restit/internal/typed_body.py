@@ -1,17 +1,38 @@
+from typing import BinaryIO, Callable
+
 from restit.internal.mime_type import MIMEType
-from restit.internal.request_deserializer_service import RequestDeserializerService
+from restit.internal.request_deserializer_registry import RequestDeserializerRegistry
 
 
 class TypedBody:
-    def __init__(self, body: bytes, content_type: MIMEType):
-        self.body = body
+    """Deserializes the buffered body, the deserializers read from the buffer instead of a copy of the body.
+
+    The buffer is requested on the first deserialization only. A body that is parsed while streaming, like
+    *multipart/form-data*, provides its dictionary with ``create_dict`` instead.
+    """
+
+    def __init__(
+        self,
+        get_body_file: Callable[[], BinaryIO],
+        content_type: MIMEType,
+        request_deserializer_registry: RequestDeserializerRegistry,
+        create_dict: Callable[[], dict] = None,
+    ):
+        self.get_body_file = get_body_file
         self.content_type = content_type
+        self.request_deserializer_registry = request_deserializer_registry
+        self.create_dict = create_dict
         self.cache = {}
 
     def __getitem__(self, python_type: type):
-        value = self.cache.get(
-            python_type,
-            RequestDeserializerService.deserialize_request_body(self.body, self.content_type, python_type),
-        )
-        self.cache[python_type] = value
-        return value
+        try:
+            return self.cache[python_type]
+        except KeyError:
+            if python_type is dict and self.create_dict is not None:
+                value = self.create_dict()
+            else:
+                body_file = self.get_body_file()
+                body_file.seek(0)
+                value = self.request_deserializer_registry.deserialize_file(body_file, self.content_type, python_type)
+            self.cache[python_type] = value
+            return value
@@ -0,0 +1,85 @@
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+
+# the CGI variables that carry a header without the HTTP_ prefix
+_UNPREFIXED_ENVIRON_KEYS = frozenset(["CONTENT_TYPE", "CONTENT_LENGTH", "CONTENT_ENCODING"])
+
+
+@lru_cache(maxsize=512)
+def _get_environ_keys(header_name: str) -> Tuple[str, ...]:
+    key = header_name.upper().replace("-", "_")
+    if key in _UNPREFIXED_ENVIRON_KEYS:
+        return key, "HTTP_" + key
+    return ("HTTP_" + key,)
+
+
+def _get_header_name(environ_key: str) -> str:
+    if environ_key.startswith("HTTP_"):
+        environ_key = environ_key[5:]
+    return environ_key.replace("_", "-").title()
+
+
+class WsgiHeaders(Mapping):
+    """A read-only, case-insensitive view on the request headers in the *WSGI* environment.
+
+    Header names are translated to environment keys on lookup, nothing is copied up front. An empty *Content-Type* or
+    *Content-Length*, which some servers set for requests without body, counts as missing.
+
+    :param wsgi_environment: The *WSGI* environment
+    :type wsgi_environment: dict
+    """
+
+    def __init__(self, wsgi_environment: dict):
+        self._wsgi_environment = wsgi_environment
+
+    def __getitem__(self, header_name: str) -> str:
+        for environ_key in _get_environ_keys(header_name):
+            value = self._wsgi_environment.get(environ_key)
+            if value is not None and value != "":
+                return str(value)
+        raise KeyError(header_name)
+
+    def __contains__(self, header_name) -> bool:
+        try:
+            self[header_name]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        seen_header_names = set()
+        for environ_key, value in list(self._wsgi_environment.items()):
+            if (environ_key.startswith("HTTP_") or environ_key in _UNPREFIXED_ENVIRON_KEYS) and value != "":
+                header_name = _get_header_name(environ_key)
+                if header_name not in seen_header_names:
+                    seen_header_names.add(header_name)
+                    yield header_name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def get_all(self, header_name: str) -> List[str]:
+        """Returns the values of a list-valued header.
+
+        Servers join a header that was sent more than once with commas, the values are split at commas outside of
+        quoted strings. A missing header returns an empty list.
+        """
+        value = self.get(header_name)
+        if value is None:
+            return []
+
+        values = []
+        start = 0
+        is_quoted = False
+        for index, character in enumerate(value):
+            if character == '"':
+                is_quoted = not is_quoted
+            elif character == "," and not is_quoted:
+                values.append(value[start:index].strip())
+                start = index + 1
+        values.append(value[start:].strip())
+        return [value for value in values if value]
+
+    def __repr__(self) -> str:
+        return f"WsgiHeaders({dict(self.items())})"
@@ -1,23 +1,92 @@
-from functools import lru_cache
-from typing import List
+import warnings
+from typing import List, Tuple, Union
 
+from restit.exception import PathIsNotStartingWithSlashException
+from restit.internal.resource_path import ResourcePath
 from restit.resource import Resource
 
 
 class Namespace:
-    def __init__(self, path: str, resources: List[Resource] = None):
-        self.__path = path
+    """Mounts resources under a common path prefix.
+
+    The resources keep their own request mapping. The application dispatches on the prefix first and then only searches
+    the route index of the namespace, so the same resource instance can be mounted by more than one namespace.
+
+    .. note::
+
+        For an url below the prefix, the resources of the namespace take precedence over resources registered to the
+        application directly. Before namespaces were mounted, all resources were ordered together, so a resource of
+        the application with a more specific request mapping could win over the one of a namespace.
+
+    A path prefix with path parameters, e.g. ``/tenants/:tenant``, cannot be dispatched on. The namespace then
+    prepends its prefix to the request mapping of its resources and they are routed and ordered together with the
+    resources of the application, like all namespaces were before. Their path parameters include the ones of the
+    prefix, but such a resource instance can only be part of one namespace.
+
+    .. note::
+
+        Register all resources before the namespace is registered to the application.
+
+    :param path: The path prefix, e.g. ``/api/v1``
+    :type path: str
+    :param resources: A list of :class:`Resource` instances
+    :type resources: List[Resource]
+    :param host: If set, the resources are only routed for requests to that host name, e.g. ``api.example.com``.
+        Requests to other hosts do not even search the route table of these resources.
+    :type host: str
+    """
+
+    def __init__(self, path: str, resources: List[Resource] = None, host: str = None):
+        if not path.startswith("/"):
+            raise PathIsNotStartingWithSlashException(path)
+        self.__path = path.rstrip("/")
+        self.__is_mounted = ResourcePath.is_static(self.__path)
         self.__resources: List[Resource] = resources or []
+        self.__adapted_resources: List[Resource] = []
+        self.__host: Union[str, None] = host.lower() if host is not None else None
+
+    @property
+    def path(self) -> str:
+        """The path prefix without trailing slash, an empty string for the root path"""
+        return self.__path
+
+    @property
+    def host(self) -> Union[str, None]:
+        return self.__host
+
+    @property
+    def resources(self) -> Tuple[Resource, ...]:
+        return tuple(self.__resources)
+
+    @property
+    def is_mounted(self) -> bool:
+        """`True` if the application dispatches on the path prefix, `False` for a prefix with path parameters"""
+        return self.__is_mounted
 
     def register_resources(self, resources: List[Resource]):
         self.__resources.extend(resources)
 
-    @lru_cache(maxsize=1)
     def get_adapted_resources(self) -> List[Resource]:
-        for resource in self.__resources:
-            resource.__request_mapping__ = self._prepend_path(resource.__request_mapping__)
+        """Prepends the path prefix to the request mapping of the resources and returns them.
+
+        .. deprecated::
 
-        return self.__resources
+            The application mounts namespaces itself, register the namespace instead of its adapted resources.
+            The host of the namespace is not applied to the returned resources.
+        """
+        warnings.warn(
+            "Namespace.get_adapted_resources is deprecated, register the namespace to the application instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self._adapt_resources()
+
+    def _adapt_resources(self) -> List[Resource]:
+        for resource in self.__resources:
+            if resource not in self.__adapted_resources:
+                resource.__request_mapping__ = self._prepend_path(resource.__request_mapping__)
+                self.__adapted_resources.append(resource)
+        return list(self.__adapted_resources)
 
     def _prepend_path(self, url: str) -> str:
-        return "/".join([self.__path.rstrip("/"), url.lstrip("/")])
+        return "/".join([self.__path, url.lstrip("/")])
@@ -55,48 +55,59 @@ class OpenApiDocumentation:
     def __init__(self, info: InfoObject, path: str = "/api"):
         self.info = info
         self.path = path
-        self._resources: List[Resource] = []
+        self._resources: List[Tuple[str, Resource]] = []
         self._servers = []
+        self._spec: Union[dict, None] = None
 
-    def register_resource(self, resource: Resource):
+    def register_resource(self, resource: Resource, path_prefix: str = ""):
         """Register a resource that should be documented.
 
         .. note:: Only use this function if you want to generate the API specification outside your app.
 
         :param resource: The resource that should be registered
         :type resource: Resource
+        :param path_prefix: The path of the :class:`~restit.Namespace` the resource is mounted in
+        :type path_prefix: str
         """
         if (
-            resource not in self._resources
+            (path_prefix, resource) not in self._resources
             and resource.__class__.__name__ not in OpenApiDocumentation._IGNORE_RESOURCE_CLASS_NAMES
         ):
-            self._resources.append(resource)
+            self._resources.append((path_prefix, resource))
+            self._spec = None
 
-    @lru_cache(maxsize=1)
     def generate_spec(self) -> dict:
         """Generate the `OpenApi`_ specification as a dictionary
 
         .. note:: Only use this function if you want to generate the API specification outside your app.
 
+        The specification is generated once and regenerated after another resource has been registered.
+
         :return: The generated specification
         :rtype: dict
         """
-        self._resources.sort(key=lambda r: r.__request_mapping__)
-        root_spec = self._generate_root_spec()
-        self._generate_paths(root_spec)
-        return root_spec
+        spec = self._spec
+        if spec is None:
+            spec = self._generate_root_spec()
+            self._generate_paths(spec)
+            self._spec = spec
+        return spec
 
     def _generate_paths(self, root_spec: dict):
         paths = root_spec["paths"]
-        for resource in self._resources:
+        resources = sorted(
+            self._resources,
+            key=lambda path_prefix_and_resource: OpenApiDocumentation._get_path(*path_prefix_and_resource),
+        )
+        for path_prefix, resource in resources:
             if resource.__request_mapping__:
-                self._add_resource(paths, resource, root_spec)
+                self._add_resource(paths, path_prefix, resource, root_spec)
 
-    def _add_resource(self, paths: dict, resource: Resource, root_spec: dict):
+    def _add_resource(self, paths: dict, path_prefix: str, resource: Resource, root_spec: dict):
         (
             path,
             inferred_path_parameters,
-        ) = self._infer_path_params_and_open_api_path_syntax(resource.__request_mapping__)
+        ) = self._infer_path_params_and_open_api_path_syntax(self._get_path(path_prefix, resource))
         # noinspection PyTypeChecker
         summary, description = self._get_summary_and_description_from_doc(resource.__doc__)
         paths[path] = {"summary": summary, "description": description}
@@ -110,6 +121,10 @@ class OpenApiDocumentation:
             self._add_request_body(method_spec, method_object, root_spec)
             self._add_responses(method_spec, method_object, root_spec)
 
+    @staticmethod
+    def _get_path(path_prefix: str, resource: Resource) -> str:
+        return path_prefix + resource.__request_mapping__
+
     @staticmethod
     def _add_responses(method_spec: dict, method_object: object, root_spec: dict):
         response_status_parameters = get_response_status_parameters_for_method(method_object)
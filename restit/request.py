@@ -1,72 +1,116 @@
-from functools import lru_cache
-from io import BufferedReader
-from typing import Any
+import io
+import shutil
+from tempfile import SpooledTemporaryFile
+from typing import Any, BinaryIO, Dict, Iterator, List, Mapping, Union
 from urllib.parse import quote
 
-from restit.common import create_dict_from_assignment_syntax
+from restit.exception import BadRequest, PayloadTooLarge
+from restit.internal.decompressing_body_input import DecompressingBodyInput
 from restit.internal.forwarded_header import ForwardedHeader
 from restit.internal.http_accept import HttpAccept
 from restit.internal.mime_type import MIMEType
+from restit.internal.multipart_parser import MultipartParser, UploadedFile
+from restit.internal.query_parser import QueryParser
+from restit.internal.request_deserializer_registry import RequestDeserializerRegistry
 from restit.internal.request_deserializer_service import RequestDeserializerService
+from restit.internal.request_body_input import RequestBodyInput
 from restit.internal.typed_body import TypedBody
+from restit.internal.wsgi_headers import WsgiHeaders
 
 
 class Request:
-    """https://www.python.org/dev/peps/pep-0333/"""
-
-    def __init__(self, wsgi_environment: dict, path_params: dict):
+    """https://www.python.org/dev/peps/pep-0333/
+
+    Headers, query parameters, forwarded information and the body are taken from the *WSGI* environment when they are
+    accessed for the first time, so a handler only pays for what it uses.
+
+    The body can be streamed with :func:`iter_body` or buffered with :attr:`body_file`. The buffer is kept in memory
+    up to :attr:`body_spool_size` bytes and moved to a temporary file above.
+
+    A *multipart/form-data* body is parsed while it is read, its fields are available with :attr:`form_fields` and
+    its files with :attr:`files`. The size of a file part is limited by :attr:`multipart_max_part_size`, the size of
+    a field by :attr:`multipart_max_field_size` and the number of parts by :attr:`multipart_max_parts`, the total
+    size by the maximum body size.
+
+    A *gzip* or *deflate* encoded body is decoded while it is read, everything reading the body sees the plain bytes.
+    The decoded size is limited by :attr:`max_decompressed_body_size` and by the maximum body size if that is smaller,
+    the ratio of decoded to encoded bytes by :attr:`max_compression_ratio`.
+
+    The query string is parsed on the first access of :attr:`query_parameters`, it is limited to
+    :attr:`max_query_string_length` characters and :attr:`max_query_parameter_count` parameters.
+
+    :param wsgi_environment: The *WSGI* environment
+    :type wsgi_environment: dict
+    :param path_params: The path parameters of the matching resource
+    :type path_params: dict
+    :param max_body_size: The maximum body size in bytes, a larger body raises
+        :class:`~restit.exception.PayloadTooLarge`
+    :type max_body_size: int
+    :param request_deserializer_registry: The deserializers of the application, defaults to the process wide ones of
+        :class:`~restit.internal.request_deserializer_service.RequestDeserializerService`
+    :type request_deserializer_registry: RequestDeserializerRegistry
+    """
+
+    body_spool_size = 1024 * 1024
+    multipart_max_part_size: Union[int, None] = None
+    multipart_max_field_size = 1024 * 1024
+    multipart_max_parts = 1000
+    max_query_string_length = 64 * 1024
+    max_query_parameter_count = 1000
+    max_decompressed_body_size: Union[int, None] = 32 * 1024 * 1024
+    max_compression_ratio: Union[int, None] = 100
+
+    def __init__(
+        self,
+        wsgi_environment: dict,
+        path_params: dict,
+        max_body_size: int = None,
+        request_deserializer_registry: RequestDeserializerRegistry = None,
+    ):
         self._wsgi_environment = wsgi_environment
         self._path_params = path_params
-        self._query_string = wsgi_environment["QUERY_STRING"]
-        self._path = wsgi_environment["PATH_INFO"]
-        self._method_name = wsgi_environment["REQUEST_METHOD"]
-
-        self._query_parameters: dict = create_dict_from_assignment_syntax(self._query_string)
-        self._headers = self._create_headers()
-
-        self._forwarded = ForwardedHeader.from_headers(self._headers)
+        self.max_body_size = max_body_size
+        self._request_deserializer_registry = request_deserializer_registry
 
-        self._typed_body = TypedBody(self.body, self.content_type)
+        self._query_parameters: Union[dict, None] = None
+        self._headers: Union[WsgiHeaders, None] = None
+        self._forwarded: Union[ForwardedHeader, None] = None
+        self._typed_body: Union[TypedBody, None] = None
         self._deserialized_body = None
-
-        self._request_deserializer_service = RequestDeserializerService()
-
-    def _create_headers(self):
-        headers = {
-            "Content-Type": self._wsgi_environment.get("CONTENT_TYPE"),
-            "Content-Length": int(self._wsgi_environment.get("CONTENT_LENGTH", 0) or 0),
-            "Content-Encoding": self._wsgi_environment.get("CONTENT_ENCODING"),
-        }
-
-        for key, value in self._wsgi_environment.items():
-            if key.startswith("HTTP_"):
-                header_key = key[5:].replace("_", "-").title()
-                headers[header_key] = value
-
-        return headers
-
-    @lru_cache()
-    def _get_body_from_wsgi_environment(self, buffered_input: BufferedReader) -> bytes:
-        body = buffered_input.read(self.headers["Content-Length"])
-        return body
+        # cached per instance, a global cache keyed on the request would keep requests and their bodies alive
+        self._body_file: Union[SpooledTemporaryFile, None] = None
+        self._is_body_input_consumed = False
+        self._host: Union[str, None] = None
+        self._content_type: Union[MIMEType, None] = None
+        self._http_accept: Union[HttpAccept, None] = None
+        self._form_fields: Union[Dict[str, Union[str, List[str]]], None] = None
+        self._files: Union[Dict[str, Union[UploadedFile, List[UploadedFile]]], None] = None
 
     def is_json(self) -> bool:
         return self.content_type.to_string() == "application/json"
 
     @property
     def path(self) -> str:
-        return self._path
+        return self._wsgi_environment["PATH_INFO"]
 
     @property
     def request_method_name(self) -> str:
-        return self._method_name
+        return self._wsgi_environment["REQUEST_METHOD"]
 
     @property
-    def headers(self) -> dict:
+    def headers(self) -> Mapping[str, str]:
+        """A read-only, case-insensitive mapping of the request headers that reads them from the environment"""
+        if self._headers is None:
+            self._headers = WsgiHeaders(self._wsgi_environment)
         return self._headers
 
     @property
     def query_parameters(self) -> dict:
+        """The percent-decoded query parameters, a name sent more than once maps to a list of values"""
+        if self._query_parameters is None:
+            self._query_parameters = QueryParser.parse(
+                self.query_string, self.max_query_parameter_count, self.max_query_string_length
+            )
         return self._query_parameters
 
     @property
@@ -75,42 +119,190 @@ class Request:
 
     @property
     def query_string(self) -> str:
-        return self._query_string
+        return self._wsgi_environment.get("QUERY_STRING", "")
+
+    @staticmethod
+    def get_host_name(wsgi_environment: dict) -> str:
+        """Returns the lower case host name the client requested, without port and without building a request.
+
+        It uses the same sources as :attr:`host`: the forwarded host, the *Host* header, the forwarded server and
+        finally the *SERVER_NAME*.
+        """
+        if "HTTP_FORWARDED" in wsgi_environment:
+            forwarded = ForwardedHeader.from_string(wsgi_environment["HTTP_FORWARDED"])
+            host = forwarded.host or wsgi_environment.get("HTTP_HOST") or wsgi_environment["SERVER_NAME"]
+        else:
+            host = (
+                wsgi_environment.get("HTTP_X_FORWARDED_HOST")
+                or wsgi_environment.get("HTTP_HOST")
+                or wsgi_environment.get("HTTP_X_FORWARDED_SERVER")
+                or wsgi_environment["SERVER_NAME"]
+            )
+        host = host.split(",", 1)[0].strip().lower()
+        if host.startswith("["):
+            return host[: host.find("]") + 1]
+        return host.split(":", 1)[0]
 
     @property
-    @lru_cache()
     def host(self) -> str:
-        host = self.forwarded.host or self._headers.get("Host")
-        if host is None:
-            host = self.forwarded.server or self._wsgi_environment["SERVER_NAME"]
-            port = self._wsgi_environment["SERVER_PORT"]
-            if port != 443 and port != 80:
-                host += f":{port}"
+        if self._host is None:
+            host = self.forwarded.host or self.headers.get("Host")
+            if host is None:
+                host = self.forwarded.server or self._wsgi_environment["SERVER_NAME"]
+                port = self._wsgi_environment["SERVER_PORT"]
+                if port != 443 and port != 80:
+                    host += f":{port}"
+            self._host = self.protocol + "://" + host
 
-        return self.protocol + "://" + host
+        return self._host
 
     @property
     def protocol(self) -> str:
         return self.forwarded.proto or self._wsgi_environment["wsgi.url_scheme"]
 
     @property
-    def content_encoding(self) -> str:
-        return self._headers.get("Content-Encoding")
+    def content_encoding(self) -> Union[str, None]:
+        return self.headers.get("Content-Encoding")
 
     @property
     def content_type(self) -> MIMEType:
-        return MIMEType.from_string(self._headers.get("Content-Type") or "text/plain")
+        if self._content_type is None:
+            self._content_type = MIMEType.from_string(self._wsgi_environment.get("CONTENT_TYPE") or "text/plain")
+        return self._content_type
+
+    @property
+    def content_length(self) -> Union[int, None]:
+        """The *Content-Length* or `None`, if the header is missing"""
+        content_length = self._wsgi_environment.get("CONTENT_LENGTH")
+        return int(content_length) if content_length else None
+
+    def check_body_size(self):
+        """Raises :class:`~restit.exception.PayloadTooLarge` if the *Content-Length* exceeds the maximum body size.
+
+        It does not read anything, a body without *Content-Length* is checked while reading.
+        """
+        content_length = self.content_length
+        if self.max_body_size is not None and content_length is not None and content_length > self.max_body_size:
+            raise PayloadTooLarge(f"The request body exceeds the maximum size of {self.max_body_size} bytes")
+
+    def _open_body_input(self) -> io.RawIOBase:
+        if self._is_body_input_consumed:
+            raise Request.BodyAlreadyConsumedException()
+        self.check_body_size()
+        self._is_body_input_consumed = True
+        content_length = self.content_length
+        if content_length is None and not self._wsgi_environment.get("wsgi.input_terminated", False):
+            # without Content-Length, a server has to flag that the input can be read until its end
+            content_length = 0
+        body_input = RequestBodyInput(self._wsgi_environment["wsgi.input"], content_length, self.max_body_size)
+
+        content_encoding = self.content_encoding
+        if content_encoding:
+            max_decompressed_body_size = min(
+                (size for size in (self.max_decompressed_body_size, self.max_body_size) if size is not None),
+                default=None,
+            )
+            # the codings are listed in the order they were applied
+            for encoding in reversed(content_encoding.lower().split(",")):
+                encoding = encoding.strip()
+                if encoding and encoding != "identity":
+                    body_input = DecompressingBodyInput(
+                        body_input, encoding, max_decompressed_body_size, self.max_compression_ratio
+                    )
+        return body_input
+
+    def iter_body(self, chunk_size: int = RequestBodyInput.CHUNK_SIZE) -> Iterator[bytes]:
+        """Iterates over the body in chunks.
+
+        If the body has not been buffered yet, the chunks are streamed from the input without buffering them, so the
+        body cannot be read a second time.
+
+        :param chunk_size: The maximum chunk size in bytes
+        :type chunk_size: int
+        """
+        body_file = self.body_file if self._body_file is not None else self._open_body_input()
+        return iter(lambda: body_file.read(chunk_size), b"")
+
+    @property
+    def body_file(self) -> BinaryIO:
+        """The buffered body as a readable file object positioned at the start"""
+        if self._body_file is None:
+            body_input = self._open_body_input()
+            body_file = SpooledTemporaryFile(max_size=self.body_spool_size)
+            shutil.copyfileobj(body_input, body_file, RequestBodyInput.CHUNK_SIZE)
+            self._body_file = body_file
+        self._body_file.seek(0)
+        return self._body_file
 
     @property
     def body(self) -> bytes:
-        return self._get_body_from_wsgi_environment(self._wsgi_environment["wsgi.input"])
+        """The body as bytes, read from the buffer on every access"""
+        return self.body_file.read()
 
     @property
     def typed_body(self) -> TypedBody:
+        if self._typed_body is None:
+            create_dict = self._create_form_dict if self.is_multipart_form_data() else None
+            self._typed_body = TypedBody(
+                lambda: self.body_file,
+                self.content_type,
+                self._request_deserializer_registry or RequestDeserializerService.get_registry(),
+                create_dict,
+            )
         return self._typed_body
 
+    def is_multipart_form_data(self) -> bool:
+        return (self._wsgi_environment.get("CONTENT_TYPE") or "").lower().startswith("multipart/form-data")
+
+    @property
+    def form_fields(self) -> Dict[str, Union[str, List[str]]]:
+        """The fields of a *multipart/form-data* body, a name sent more than once maps to a list of values"""
+        if self._form_fields is None:
+            self._parse_multipart_form_data()
+        return self._form_fields
+
+    @property
+    def files(self) -> Dict[str, Union[UploadedFile, List[UploadedFile]]]:
+        """The files of a *multipart/form-data* body, a name sent more than once maps to a list of files"""
+        if self._files is None:
+            self._parse_multipart_form_data()
+        return self._files
+
+    def _create_form_dict(self) -> dict:
+        return {**self.form_fields, **self.files}
+
+    def _parse_multipart_form_data(self):
+        if not self.is_multipart_form_data():
+            self._form_fields, self._files = {}, {}
+            return
+
+        boundary = MultipartParser.get_boundary(self._wsgi_environment["CONTENT_TYPE"])
+        if boundary is None:
+            raise BadRequest("The multipart/form-data content type has no boundary")
+        # an already buffered body is parsed from the buffer, otherwise the parts are streamed from the input
+        body_input = self.body_file if self._body_file is not None else self._open_body_input()
+        self._form_fields, self._files = MultipartParser(
+            body_input,
+            boundary,
+            encoding=self.content_type.charset,
+            max_part_size=self.multipart_max_part_size,
+            max_field_size=self.multipart_max_field_size,
+            max_parts=self.multipart_max_parts,
+            spool_size=self.body_spool_size,
+        ).parse()
+
+    def close(self):
+        """Releases the body buffer, the uploaded files and their temporary files"""
+        if self._body_file is not None:
+            self._body_file.close()
+        for uploaded_files in (self._files or {}).values():
+            for uploaded_file in uploaded_files if isinstance(uploaded_files, list) else [uploaded_files]:
+                uploaded_file.close()
+
     @property
     def forwarded(self) -> ForwardedHeader:
+        if self._forwarded is None:
+            self._forwarded = ForwardedHeader.from_headers(self.headers)
         return self._forwarded
 
     @property
@@ -128,7 +320,9 @@ class Request:
 
     @property
     def http_accept_object(self) -> HttpAccept:
-        return HttpAccept.from_accept_string(self.headers.get("Accept", "*/*"))
+        if self._http_accept is None:
+            self._http_accept = HttpAccept.from_accept_string(self._wsgi_environment.get("HTTP_ACCEPT", "*/*"))
+        return self._http_accept
 
     @property
     def original_url(self) -> str:
@@ -150,3 +344,6 @@ class Request:
 
     class DeserializedBodyAlreadySetException(Exception):
         pass
+
+    class BodyAlreadyConsumedException(Exception):
+        pass
@@ -1,15 +1,41 @@
-from typing import Any, List, Type, Union
+import codecs
+from typing import Any, BinaryIO, Iterator, List, Type, Union
 
 from restit.internal.mime_type import MIMEType
 
 
 class RequestDeserializer:
+    CHUNK_SIZE = 64 * 1024
+
     def get_content_type_list(self) -> Union[List[str], None]:
         raise NotImplementedError()
 
     def deserialize(self, request_input: bytes, encoding: str = None) -> Any:
         raise NotImplementedError()
 
+    def deserialize_file(self, request_input_file: BinaryIO, encoding: str = None) -> Any:
+        """Deserializes the buffered request body.
+
+        Reads the whole body and passes it to :func:`deserialize` by default. Override it to deserialize
+        large bodies incrementally, e.g. with :func:`iter_decoded_chunks`.
+        """
+        return self.deserialize(request_input_file.read(), encoding)
+
+    @staticmethod
+    def iter_decoded_chunks(request_input_file: BinaryIO, encoding: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+        """Reads the body in chunks of at most `chunk_size` bytes and decodes them one by one.
+
+        A character split between two chunks is decoded with the next chunk.
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+        for chunk in iter(lambda: request_input_file.read(chunk_size), b""):
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield text
+
     def get_deserialized_python_type(self) -> Type:
         raise NotImplementedError()
 
@@ -1,21 +1,15 @@
-import ast
-import inspect
 import logging
-import re
-from typing import Tuple, AnyStr, Dict, Union, List, Callable, Optional
+from typing import Tuple, AnyStr, Dict, Union, List, Optional
 
 from marshmallow import ValidationError
 
 from restit._path_parameter import PathParameter
 from restit._response import Response
-from restit.common import (
-    get_response_status_parameters_for_method,
-    get_exception_mapping_for_method,
-)
 from restit.exception import MethodNotAllowed
 from restit.exception.client_errors_4xx import BadRequest
+from restit.internal.conditional_request_service import ConditionalRequestService
+from restit.internal.handler_plan import HandlerPlan
 from restit.internal.query_parameter import QueryParameter
-from restit.internal.request_body_properties import RequestBodyProperties
 from restit.internal.request_body_schema_deserializer import (
     RequestBodySchemaDeserializer,
 )
@@ -24,6 +18,8 @@ from restit.internal.response_serializer_service import ResponseSerializerServic
 from restit.internal.response_status_parameter import ResponseStatusParameter
 from restit.internal.schema_or_field_deserializer import SchemaOrFieldDeserializer
 from restit.request import Request
+from restit.static_file_response import StaticFileResponse
+from restit.streaming_response import StreamingResponse
 
 LOGGER = logging.getLogger(__name__)
 
@@ -60,9 +56,13 @@ class Resource:
 
     def __init__(self):
         self._resource_path = None
+        self._handler_plans: Dict[str, HandlerPlan] = {}
 
     def init(self):
         self._resource_path = ResourcePath(self.__request_mapping__)
+        self._handler_plans = {
+            method_name: HandlerPlan(getattr(self, method_name)) for method_name in self._get_allowed_method_names()
+        }
 
     def get(self, request: Request) -> Response:
         raise MethodNotAllowed()
@@ -89,8 +89,7 @@ class Resource:
 
         The HTTP OPTIONS method is used to describe the communication options for the target resource.
         """
-        allow = " ".join(self.get_allowed_methods()).upper()
-        return Response("", 204, headers={"Allow": allow})
+        return Response("", 204, headers={"Allow": self._get_allow_header_value()})
 
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
     def trace(self, request: Request) -> Response:
@@ -104,90 +103,132 @@ class Resource:
     def head(self, request: Request) -> Response:
         raise MethodNotAllowed()
 
-    def handle_request(self, request: Request, path_params: Dict) -> Response:
-        LOGGER.info(request.log_str())
-        method_object = getattr(self, request.request_method_name.lower())
+    def handle_request(self, request: Request, path_params: Dict, handler_plan: HandlerPlan = None) -> Response:
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(request.log_str())
+        if handler_plan is None:
+            handler_plan = self._get_handler_plan(request.request_method_name)
+        if handler_plan.max_body_size is not None:
+            request.max_body_size = handler_plan.max_body_size
+        request.check_body_size()
         request._path_params = self._collect_and_convert_path_parameters(path_params)
-        self._process_query_parameters(method_object, request)
-        request = self._validate_request_body(method_object, request)
-        response: Response = self._execute_request_with_exception_mapping(method_object, request)
+        self._process_query_parameters(handler_plan, request)
+        version_entity_tag = self._get_version_entity_tag(handler_plan, request)
+        if version_entity_tag is not None and ConditionalRequestService.is_not_modified(
+            request.request_method_name, request.headers, version_entity_tag, None
+        ):
+            return ConditionalRequestService.create_not_modified_response(
+                Response(b"", headers={"ETag": version_entity_tag})
+            )
+        request = self._validate_request_body(handler_plan, request)
+        response: Response = self._execute_request_with_exception_mapping(handler_plan, request)
         if not isinstance(response, Response):
             raise Resource.NoResponseReturnException(
-                f"Resource method {method_object} does not return a response object"
+                f"Resource method {handler_plan.method_object} does not return a response object"
             )
-        response_status_parameter = Resource._find_response_schema_by_status(response.status_code, method_object)
+        response_status_parameter = Resource._find_response_schema_by_status(response.status_code, handler_plan)
         ResponseSerializerService.validate_and_serialize_response_body(
             response, request.http_accept_object, response_status_parameter
         )
+        if response.status_code != 200:
+            return response
+        self._add_entity_tag(handler_plan, response, version_entity_tag)
+        if ConditionalRequestService.is_not_modified(
+            request.request_method_name,
+            request.headers,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        ):
+            return ConditionalRequestService.create_not_modified_response(response)
+        if isinstance(response, StaticFileResponse) and request.request_method_name.upper() == "GET":
+            # noinspection PyProtectedMember
+            response._apply_range(request.headers.get("Range"), request.headers.get("If-Range"))
         return response
 
+    def _get_handler_plan(self, method_name: str) -> HandlerPlan:
+        method_name = method_name.lower()
+        handler_plan = self._handler_plans.get(method_name)
+        if handler_plan is None:
+            if method_name not in self._get_allowed_method_names():
+                raise MethodNotAllowed(headers={"Allow": self._get_allow_header_value()})
+            # a resource that was not initialized builds its plans on first use, the dict is swapped not modified
+            handler_plan = HandlerPlan(getattr(self, method_name))
+            self._handler_plans = {**self._handler_plans, method_name: handler_plan}
+        return handler_plan
+
+    @staticmethod
+    def _get_version_entity_tag(handler_plan: HandlerPlan, request: Request) -> Optional[str]:
+        conditional_request_properties = handler_plan.conditional_request_properties
+        if conditional_request_properties is None or conditional_request_properties.version_key is None:
+            return None
+        return ConditionalRequestService.create_version_entity_tag(conditional_request_properties.version_key(request))
+
+    @staticmethod
+    def _add_entity_tag(handler_plan: HandlerPlan, response: Response, version_entity_tag: Optional[str]):
+        if "ETag" in response.headers or handler_plan.conditional_request_properties is None:
+            return
+        if version_entity_tag is not None:
+            response.headers["ETag"] = version_entity_tag
+        elif not isinstance(response, (StreamingResponse, StaticFileResponse)):
+            # the body of a streaming response is not known before it is sent
+            response.headers["ETag"] = ConditionalRequestService.create_entity_tag(response.content)
+
     @staticmethod
-    def _execute_request_with_exception_mapping(method_object: Callable, request: Request) -> Response:
-        exception_mapping = get_exception_mapping_for_method(method_object)
+    def _execute_request_with_exception_mapping(handler_plan: HandlerPlan, request: Request) -> Response:
         try:
-            return method_object(request)
+            return handler_plan.method_object(request)
         except Exception as exception:
-            for (
-                source_exception_class,
+            target_exception_tuple_or_class = handler_plan.find_exception_mapping(type(exception))
+            if target_exception_tuple_or_class is None:
+                raise exception
+
+            if isinstance(target_exception_tuple_or_class, tuple):
+                LOGGER.debug(
+                    "Mapping exception class %s to %s with description: %s",
+                    type(exception),
+                    target_exception_tuple_or_class[0],
+                    target_exception_tuple_or_class[1],
+                )
+                raise target_exception_tuple_or_class[0](target_exception_tuple_or_class[1])
+
+            LOGGER.debug(
+                "Mapping exception class %s to %s",
+                type(exception),
                 target_exception_tuple_or_class,
-            ) in exception_mapping.items():
-                if isinstance(exception, source_exception_class):
-                    if isinstance(target_exception_tuple_or_class, tuple):
-                        LOGGER.debug(
-                            "Mapping exception class %s to %s with description: %s",
-                            type(exception),
-                            target_exception_tuple_or_class[0],
-                            target_exception_tuple_or_class[1],
-                        )
-                        raise target_exception_tuple_or_class[0](target_exception_tuple_or_class[1])
-
-                    LOGGER.debug(
-                        "Mapping exception class %s to %s",
-                        type(exception),
-                        target_exception_tuple_or_class,
-                    )
-                    raise target_exception_tuple_or_class(str(exception))
-
-            raise exception
+            )
+            raise target_exception_tuple_or_class(str(exception))
 
     @staticmethod
-    def _find_response_schema_by_status(status: int, method_object: object) -> Optional[ResponseStatusParameter]:
-        response_status_parameters = get_response_status_parameters_for_method(method_object)
-        if response_status_parameters:
-            for response_status_parameter in response_status_parameters:  # type: ResponseStatusParameter
-                if response_status_parameter.status == status:
-                    return response_status_parameter
-
-            LOGGER.warning("Response status code %d is not expected for %s", status, method_object)
+    def _find_response_schema_by_status(status: int, handler_plan: HandlerPlan) -> Optional[ResponseStatusParameter]:
+        response_status_parameter = handler_plan.find_response_status_parameter(status)
+        if response_status_parameter is None and handler_plan.has_response_status_parameters:
+            LOGGER.warning("Response status code %d is not expected for %s", status, handler_plan.method_object)
 
-        return None
+        return response_status_parameter
 
     @staticmethod
-    def _validate_request_body(method_object: object, request: Request) -> Request:
-        request_body_properties: RequestBodyProperties = getattr(method_object, "__request_body_properties__", None)
-        if request_body_properties:
-            RequestBodySchemaDeserializer.deserialize(request, request_body_properties)
+    def _validate_request_body(handler_plan: HandlerPlan, request: Request) -> Request:
+        if handler_plan.request_body_properties:
+            RequestBodySchemaDeserializer.deserialize(request, handler_plan.request_body_properties)
 
         return request
 
     @staticmethod
-    def _process_query_parameters(method_object: object, request: Request):
-        for query_parameter in getattr(method_object, "__query_parameters__", []):  # type: QueryParameter
-            value: str = request.query_parameters.get(
-                query_parameter.name,
-            )
+    def _process_query_parameters(handler_plan: HandlerPlan, request: Request):
+        for query_parameter in handler_plan.query_parameters:  # type: QueryParameter
+            value: Union[str, List[str], None] = request.query_parameters.get(query_parameter.name)
             if value is None and query_parameter.field_type.required:
-                # ToDo message
-                raise BadRequest()
+                raise BadRequest(f"Query parameter '{query_parameter.name}' is required")
 
-            if value is not None:
-                value = ast.literal_eval(value) if value.startswith("[") else value
-            # noinspection PyProtectedMember
-            request._query_parameters[query_parameter.name] = SchemaOrFieldDeserializer.deserialize(
-                value, query_parameter.field_type
-            )
+            try:
+                request.query_parameters[query_parameter.name] = query_parameter.deserialize(value)
+            except ValidationError as error:
+                raise BadRequest(
+                    f"Query parameter value '{value}' is not matching '{query_parameter.name}' ({str(error)})"
+                ) from error
 
     def _collect_and_convert_path_parameters(self, path_params: dict) -> dict:
+        path_params = dict(path_params)
         for path_parameter in getattr(self, "__path_parameters__", []):  # type: PathParameter
             try:
                 path_parameter_value = path_params[path_parameter.name]
@@ -208,19 +249,25 @@ class Resource:
         return path_params
 
     def get_allowed_methods(self) -> List[str]:
-        allowed = []
-        for method_name in Resource._METHOD_NAMES:
-            method_object = getattr(self, method_name)
-            resource_method_code = inspect.getsource(method_object)
-            match = re.match(
-                r"^.+def\s+\w+\(self,\s*request:\s*Request\s*\)\s*->\s*Response:.+raise\s+MethodNotAllowed\(\).*$",
-                resource_method_code,
-                flags=re.DOTALL | re.IGNORECASE,
+        """Returns the names of the *HTTP* methods the resource class implements."""
+        return list(self._get_allowed_method_names())
+
+    @classmethod
+    def _get_allowed_method_names(cls) -> Tuple[str, ...]:
+        # computed once per resource class, a method is allowed if it overrides the one raising MethodNotAllowed
+        allowed_method_names = cls.__dict__.get("__allowed_methods__")
+        if allowed_method_names is None:
+            allowed_method_names = tuple(
+                method_name
+                for method_name in Resource._METHOD_NAMES
+                if method_name == "options" or getattr(cls, method_name) is not getattr(Resource, method_name)
             )
-            if match is None:
-                allowed.append(method_name)
+            cls.__allowed_methods__ = allowed_method_names
+
+        return allowed_method_names
 
-        return allowed
+    def _get_allow_header_value(self) -> str:
+        return " ".join(self._get_allowed_method_names()).upper()
 
     def _get_match(self, url: str) -> Tuple[bool, Union[None, Dict[str, AnyStr]]]:
         assert self._resource_path
@@ -0,0 +1,217 @@
+import os
+from http import HTTPStatus
+from typing import Iterable, Tuple, Union
+
+from restit._response import Response
+from restit.internal.accept_encoding import AcceptEncoding
+from restit.internal.compressed_file_cache import CompressedFileCache
+from restit.internal.compressing_body import CompressingBody
+from restit.request import Request
+from restit.static_file_response import StaticFileResponse
+from restit.streaming_response import StreamingResponse
+
+
+class ResponseCompression:
+    """Compresses response bodies with the best *gzip* or *deflate* coding of the *Accept-Encoding* header.
+
+    Pass an instance to :class:`~restit.RestItApp` to compress its responses:
+
+    .. code-block:: python
+
+        app = RestItApp(resources=[...], response_compression=ResponseCompression(min_size=2048))
+
+    Only bodies of the allowed content types are compressed, they get a *Vary: Accept-Encoding* header even if the
+    client does not accept a compressed body. Regular bodies smaller than the minimum size are sent as they are, the
+    bodies of :class:`~restit.StreamingResponse` are compressed while they are sent. A compressed body gets a weak
+    version of the *ETag*, so revalidations still match it. A *304* response gets the *ETag* the full response would
+    have.
+
+    A :class:`~restit.StaticFileResponse`, and with it :class:`~restit.StaticDirectoryResource`, sends a precompressed
+    sibling like ``app.js.gz`` if it is not older than the file. Otherwise the compressed variant of a file up to
+    ``max_cached_file_size`` bytes is built once and kept in memory, larger files are compressed while they are sent.
+
+    :param min_size: The minimum body size in bytes
+    :type min_size: int
+    :param content_types: The media types to compress, ``text/*`` allows all subtypes
+    :type content_types: Iterable[str]
+    :param level: The compression level from 1 (fastest) to 9 (smallest)
+    :type level: int
+    :param max_cached_file_size: The maximum size of a static file whose compressed variant is cached
+    :type max_cached_file_size: int
+    :param file_cache_size: The maximum total size of the cached compressed static files in bytes
+    :type file_cache_size: int
+    """
+
+    ENCODINGS = ("gzip", "deflate")
+    PRECOMPRESSED_SUFFIXES = {"gzip": ".gz"}
+    DEFAULT_CONTENT_TYPES = (
+        "text/*",
+        "application/json",
+        "application/problem+json",
+        "application/javascript",
+        "application/xml",
+        "application/xhtml+xml",
+        "image/svg+xml",
+    )
+
+    def __init__(
+        self,
+        min_size: int = 1024,
+        content_types: Iterable[str] = DEFAULT_CONTENT_TYPES,
+        level: int = 6,
+        max_cached_file_size: int = 8 * 1024 * 1024,
+        file_cache_size: int = 64 * 1024 * 1024,
+    ):
+        self.min_size = min_size
+        self.content_types = frozenset(content_type.lower() for content_type in content_types)
+        self.level = level
+        self.max_cached_file_size = max_cached_file_size
+        self.file_cache = CompressedFileCache(file_cache_size)
+        self._wildcard_types = frozenset(
+            content_type[:-2] for content_type in self.content_types if content_type.endswith("/*")
+        )
+
+    def compress(self, request: Request, response: Response) -> Response:
+        """Returns the response with a compressed body or the response as it is"""
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            # a not modified response has no body, but the same Vary header and ETag as the full response
+            ResponseCompression._add_vary_header(response)
+            # noinspection PyProtectedMember
+            full_response = response._full_response
+            if full_response is not None and self._is_compressed(request, full_response):
+                ResponseCompression._weaken_entity_tag(response)
+            return response
+        if not self.is_compressible_content_type(response.headers.get("Content-Type")):
+            return response
+        ResponseCompression._add_vary_header(response)
+        encoding = self._negotiate_encoding(request, response)
+        if encoding is None:
+            return response
+
+        if isinstance(response, StreamingResponse):
+            return self._compress_streaming_response(response, encoding)
+        if isinstance(response, StaticFileResponse):
+            return self._compress_static_file_response(response, encoding)
+        return self._compress_content(response, encoding)
+
+    def is_compressible_content_type(self, content_type: str) -> bool:
+        if not content_type:
+            return False
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        return media_type in self.content_types or media_type.split("/", 1)[0] in self._wildcard_types
+
+    def _negotiate_encoding(self, request: Request, response: Response) -> Union[str, None]:
+        if (
+            response.status_code in (HTTPStatus.NO_CONTENT, HTTPStatus.PARTIAL_CONTENT)
+            or response.headers.get("Content-Encoding")
+            or "no-transform" in str(response.headers.get("Cache-Control", "")).lower()
+        ):
+            return None
+        accept_encoding = request.headers.get("Accept-Encoding")
+        if not accept_encoding:
+            return None
+        return AcceptEncoding.from_accept_encoding_string(accept_encoding).get_best_match(self.ENCODINGS)
+
+    def _is_compressed(self, request: Request, response: Response) -> bool:
+        """Tells if the body of the full response would be compressed, without compressing it"""
+        content_type = response.headers.get("Content-Type")
+        if content_type is not None and not self.is_compressible_content_type(content_type):
+            return False
+        encoding = self._negotiate_encoding(request, response)
+        if encoding is None:
+            return False
+        if content_type is None:
+            # the version key of a conditional request answered it without calling the handler, so the body is
+            # unknown and expected to be compressed like the one of the full responses
+            return True
+        if isinstance(response, StreamingResponse):
+            return True
+        if isinstance(response, StaticFileResponse):
+            return response.file_size >= self.min_size or self._find_precompressed_file(response, encoding) is not None
+        # a body of a compressible type and the minimum size hardly ever grows when it is compressed
+        return len(response.content) >= self.min_size
+
+    def _compress_content(self, response: Response, encoding: str) -> Response:
+        if len(response.content) < self.min_size:
+            return response
+        compressed_content = CompressingBody.compress(response.content, encoding, self.level)
+        if len(compressed_content) >= len(response.content):
+            return response
+        response.content = compressed_content
+        response.headers["Content-Length"] = len(compressed_content)
+        ResponseCompression._set_encoding_headers(response, encoding)
+        return response
+
+    def _compress_streaming_response(self, response: StreamingResponse, encoding: str) -> Response:
+        # noinspection PyProtectedMember
+        response._wrap_body_iterable(lambda body_iterable: CompressingBody(body_iterable, encoding, self.level))
+        response.headers.pop("Content-Length", None)
+        ResponseCompression._set_encoding_headers(response, encoding)
+        return response
+
+    def _compress_static_file_response(self, response: StaticFileResponse, encoding: str) -> Response:
+        precompressed_file = self._find_precompressed_file(response, encoding)
+        if precompressed_file is not None:
+            # noinspection PyProtectedMember
+            response._use_encoded_file(*precompressed_file)
+            ResponseCompression._set_encoding_headers(response, encoding)
+            return response
+
+        if response.file_size < self.min_size:
+            return response
+        headers = {key: value for key, value in response.headers.items() if key != "Accept-Ranges"}
+        if response.file_size > self.max_cached_file_size:
+            headers.pop("Content-Length", None)
+            # noinspection PyProtectedMember
+            streaming_response = StreamingResponse(response._get_body_iterable(), response.status_code, headers)
+            return self._compress_streaming_response(streaming_response, encoding)
+
+        compressed_content = self.file_cache.get(
+            (str(response.file_path), response.modification_time_ns, response.file_size, encoding, self.level),
+            lambda: CompressingBody.compress(ResponseCompression._read_file(response.file_path), encoding, self.level),
+        )
+        compressed_response = Response(compressed_content, response.status_code, headers)
+        compressed_response.content = compressed_content
+        compressed_response.headers["Content-Length"] = len(compressed_content)
+        ResponseCompression._set_encoding_headers(compressed_response, encoding)
+        return compressed_response
+
+    def _find_precompressed_file(self, response: StaticFileResponse, encoding: str) -> Union[Tuple[str, int], None]:
+        suffix = self.PRECOMPRESSED_SUFFIXES.get(encoding)
+        if suffix is None:
+            return None
+        precompressed_file_path = f"{response.file_path}{suffix}"
+        try:
+            precompressed_file_stat = os.stat(precompressed_file_path)
+        except OSError:
+            return None
+        if precompressed_file_stat.st_mtime_ns < response.modification_time_ns:
+            return None
+        return precompressed_file_path, precompressed_file_stat.st_size
+
+    @staticmethod
+    def _read_file(file_path: str) -> bytes:
+        with open(file_path, "rb") as fp:
+            return fp.read()
+
+    @staticmethod
+    def _set_encoding_headers(response: Response, encoding: str):
+        response.headers["Content-Encoding"] = encoding
+        ResponseCompression._weaken_entity_tag(response)
+
+    @staticmethod
+    def _weaken_entity_tag(response: Response):
+        entity_tag = response.headers.get("ETag")
+        if entity_tag is not None and not entity_tag.startswith("W/"):
+            # the compressed body is not byte for byte the identity one, but semantically equivalent
+            response.headers["ETag"] = f"W/{entity_tag}"
+
+    @staticmethod
+    def _add_vary_header(response: Response):
+        vary = response.headers.get("Vary")
+        if not vary:
+            response.headers["Vary"] = "Accept-Encoding"
+            return
+        field_names = [field_name.strip().lower() for field_name in vary.split(",")]
+        if "*" not in field_names and "accept-encoding" not in field_names:
+            response.headers["Vary"] = f"{vary}, Accept-Encoding"
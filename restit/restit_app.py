@@ -1,9 +1,9 @@
 import logging
 import traceback
 from contextlib import contextmanager
-from functools import lru_cache
+from threading import Lock
 from time import time
-from typing import Iterable, Callable, List, Tuple, Dict, Union
+from typing import Iterable, Callable, List, Tuple, Dict, Union, Type
 
 from restit._response import Response
 from restit.development_server import DevelopmentServer
@@ -11,15 +11,27 @@ from restit.exception import (
     InternalServerError,
     NotFound,
     MissingRequestMappingException,
+    PathIsNotStartingWithSlashException,
 )
 from restit.exception.http_error import HttpError
+from restit.internal.closing_body import ClosingBody
 from restit.internal.default_favicon_resource import DefaultFaviconResource
 from restit.internal.http_error_response_maker import HttpErrorResponseMaker
+from restit.internal.request_deserializer_registry import RequestDeserializerRegistry
+from restit.internal.request_deserializer_service import RequestDeserializerService
+from restit.internal.route_cache import RouteCache, LRURouteCache
+from restit.internal.router import Router
+from restit.internal.routing_statistics import RoutingStatistics
+from restit.internal.routing_table import RoutingTable
+from restit.internal.segment_trie_router import SegmentTrieRouter
 from restit.namespace import Namespace
 from restit.open_api.open_api_documentation import OpenApiDocumentation
 from restit.open_api.open_api_resource import OpenApiResource
 from restit.request import Request
+from restit.request_deserializer import RequestDeserializer
 from restit.resource import Resource
+from restit.response_compression import ResponseCompression
+from restit.static_file_response import StaticFileResponse
 
 LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +53,30 @@ class RestItApp:
     :param open_api_documentation: An instance of :class:`OpenApiDocumentation`. If not set, no
            `OpenApi <https://swagger.io/docs/specification/about/>`_ documentation will be generated.
     :type open_api_documentation: OpenApiDocumentation
+    :param router_class: The routing backend used to find the resource for an incoming *URL*, defaults to
+        :class:`~restit.internal.segment_trie_router.SegmentTrieRouter`. Use
+        :class:`~restit.internal.linear_router.LinearRouter` to try all resources one after the other.
+    :type router_class: Type[Router]
+    :param route_cache: The cache remembering the resource found for an *URL*, defaults to a
+        :class:`~restit.internal.route_cache.LRURouteCache` holding up to 1024 routes.
+    :type route_cache: RouteCache
+    :param max_request_body_size: The maximum request body size in bytes. A larger body is answered with
+        `413 <https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/413>`_ before it is read. Use the
+        :func:`~restit.decorator.max_body_size` decorator to set another limit for a method.
+    :type max_request_body_size: int
+    :param request_deserializers: Request body deserializers of this application. They are tried in the given order
+        before the process wide ones of :class:`~restit.internal.request_deserializer_service.RequestDeserializerService`
+    :type request_deserializers: List[RequestDeserializer]
+    :param response_compression: Compresses the response bodies, see :class:`~restit.ResponseCompression`. If not set,
+        no response is compressed.
+    :type response_compression: ResponseCompression
+
+    Resources and namespaces can still be registered while the application is serving requests. The routing state is
+    an immutable :class:`~restit.internal.routing_table.RoutingTable`, a registration builds a new one and swaps it in
+    atomically, so request threads never wait for a lock. The swap starts with an empty route cache.
+
+    The request deserializers are fixed once the application is initialized, it uses an immutable
+    :class:`~restit.internal.request_deserializer_registry.RequestDeserializerRegistry` from then on.
     """
 
     def __init__(
@@ -50,19 +86,34 @@ class RestItApp:
         debug: bool = False,
         raise_exceptions: bool = False,
         open_api_documentation: OpenApiDocumentation = None,
+        router_class: Type[Router] = SegmentTrieRouter,
+        route_cache: RouteCache = None,
+        max_request_body_size: int = None,
+        request_deserializers: List[RequestDeserializer] = None,
+        response_compression: ResponseCompression = None,
     ):
         self._namespaces: List[Namespace] = []
         self._resources: List[Resource] = []
+        self._wsgi_apps: Dict[str, Callable] = {}
         self.debug = debug
         self.raise_exceptions = raise_exceptions
+        self.max_request_body_size = max_request_body_size
+        self.response_compression = response_compression
         self._open_api_documentation = open_api_documentation
+        self._router_class = router_class
+        self._route_cache = route_cache if route_cache is not None else LRURouteCache()
+        self._routing_table: Union[RoutingTable, None] = None
+        self._routing_statistics = RoutingStatistics(self._route_cache.statistics)
+        self._request_deserializers: List[RequestDeserializer] = list(request_deserializers or [])
+        self._request_deserializer_registry: Union[RequestDeserializerRegistry, None] = None
+        # only serializes registrations, request threads just read the current routing table
+        self._registration_lock = Lock()
+        self._init_called = False
         self.register_namespaces(namespaces or [])
         self.register_resources(resources or [])
 
         self.__development_server: Union[DevelopmentServer, None] = None
 
-        self._init_called = False
-
     def set_open_api_documentation(self, open_api_documentation: OpenApiDocumentation):
         """Set an instance of :class:`OpenApiDocumentation`.
 
@@ -74,19 +125,89 @@ class RestItApp:
 
         self._open_api_documentation = open_api_documentation
 
+    @property
+    def route_cache(self) -> RouteCache:
+        """The route cache, its hit, miss and eviction counters are available via ``route_cache.statistics``."""
+        routing_table = self._routing_table
+        return routing_table.route_cache if routing_table is not None else self._route_cache
+
+    @property
+    def routing_statistics(self) -> RoutingStatistics:
+        """Route lookup counters by route kind together with the route cache statistics."""
+        return self._routing_statistics
+
     def register_resources(self, resources: List[Resource]):
         """Register an instance of :class:`Resource` to your application.
 
-        A list of resource instances can also be set in the constructor.
+        A list of resource instances can also be set in the constructor. Resources registered after the application
+        has started serving requests are initialized right away and are routable with the next request.
         """
 
         self.__check_resource_request_mapping(resources)
-        self._resources.extend(resources)
-        self._resources = Resource.sort_resources(self._resources)
+        with self._registration_lock:
+            self._resources.extend(resources)
+            self._resources = Resource.sort_resources(self._resources)
+            if self._init_called:
+                self._init_resources(resources)
+                self._routing_table = self._routing_table.with_resources(resources)
 
     def register_namespaces(self, namespaces: List[Namespace]):
+        """Register instances of :class:`Namespace` to your application.
+
+        A list of namespaces can also be set in the constructor. Like resources, namespaces can be registered after
+        the application has started serving requests.
+        """
         for namespace in namespaces:
-            self.register_resources(namespace.get_adapted_resources())
+            self.__check_resource_request_mapping(namespace.resources)
+        with self._registration_lock:
+            self._namespaces.extend(namespaces)
+            if self._init_called:
+                for namespace in namespaces:
+                    self._init_namespace_resources(namespace)
+                self._routing_table = self._routing_table.with_resources([], namespaces)
+
+    def register_request_deserializer(self, request_deserializer: RequestDeserializer):
+        """Registers a request body deserializer for this application only.
+
+        It is tried before the deserializers registered earlier. Deserializers cannot be registered once the
+        application is initialized.
+        """
+        with self._registration_lock:
+            if self._init_called:
+                raise RestItApp.RequestDeserializerRegistrationAfterInitException(
+                    "Request deserializers have to be registered before the application handles requests"
+                )
+            self._request_deserializers.insert(0, request_deserializer)
+
+    @property
+    def request_deserializers(self) -> Tuple[RequestDeserializer, ...]:
+        """The deserializers of this application followed by the process wide ones"""
+        if self._request_deserializer_registry is not None:
+            return self._request_deserializer_registry.request_deserializers
+        return (*self._request_deserializers, *RequestDeserializerService.get_request_deserializers())
+
+    def mount_wsgi_app(self, path: str, wsgi_app: Callable):
+        """Delegates all requests below the path to another `WSGI <https://www.python.org/dev/peps/pep-3333/>`_
+        application, e.g. a legacy application that is migrated to *RestIt* piece by piece.
+
+        The path is moved from ``PATH_INFO`` to ``SCRIPT_NAME``, so for the path ``/legacy`` a request to
+        ``/legacy/users`` reaches the mounted application with ``SCRIPT_NAME`` ``/legacy`` and ``PATH_INFO``
+        ``/users``. No :class:`Request` is created for these requests and the iterable returned by the mounted
+        application is passed to the server as it is. A mounted application takes precedence over resources below
+        its path.
+
+        :param path: The path prefix, e.g. ``/legacy``
+        :type path: str
+        :param wsgi_app: The *WSGI* application
+        :type wsgi_app: Callable
+        """
+        if not path.startswith("/"):
+            raise PathIsNotStartingWithSlashException(path)
+        path_prefix = path.rstrip("/")
+        with self._registration_lock:
+            self._wsgi_apps[path_prefix] = wsgi_app
+            if self._init_called:
+                self._routing_table = self._routing_table.with_resources([], wsgi_apps={path_prefix: wsgi_app})
 
     def start_development_server(self, host: str = None, port: int = 5000, blocking: bool = True) -> int:
         """This function starts a development server
@@ -164,30 +285,89 @@ class RestItApp:
                 )
 
     def _init(self):
-        self._resources.append(DefaultFaviconResource())
-        if self._open_api_documentation:
-            self._resources.append(OpenApiResource(self._open_api_documentation))
-        for resource in self._resources:
+        with self._registration_lock:
+            if self._init_called:
+                return
+            self._resources.append(DefaultFaviconResource())
+            if self._open_api_documentation:
+                self._resources.append(OpenApiResource(self._open_api_documentation))
+            self._init_resources(self._resources)
+            for namespace in self._namespaces:
+                self._init_namespace_resources(namespace)
+            self._resources = Resource.sort_resources(self._resources)
+            self._route_cache.clear()
+            self._routing_table = RoutingTable(
+                self._resources, self._namespaces, self._router_class, self._route_cache, self._wsgi_apps
+            )
+            self._request_deserializer_registry = RequestDeserializerService.get_registry().with_request_deserializers(
+                self._request_deserializers
+            )
+            self._init_called = True
+
+    def _init_resources(self, resources: Iterable[Resource], path_prefix: str = ""):
+        for resource in resources:
             resource.init()
             if self._open_api_documentation:
-                self._open_api_documentation.register_resource(resource)
-        self._resources = Resource.sort_resources(self._resources)
-        self._init_called = True
+                self._open_api_documentation.register_resource(resource, path_prefix)
+
+    def _init_namespace_resources(self, namespace: Namespace):
+        if namespace.is_mounted:
+            self._init_resources(namespace.resources, namespace.path)
+        else:
+            # the prefix is part of the request mapping of the resources, they are initialized with it
+            # noinspection PyProtectedMember
+            self._init_resources(namespace._adapt_resources())
 
     def __call__(self, wsgi_environ: dict, start_response: Callable) -> Iterable:
         if not self._init_called:
             self._init()
+        routing_table = self._routing_table
+        if routing_table.wsgi_apps:
+            path_prefix_and_wsgi_app = routing_table.find_wsgi_app(wsgi_environ["PATH_INFO"])
+            if path_prefix_and_wsgi_app is not None:
+                return self._call_mounted_wsgi_app(*path_prefix_and_wsgi_app, wsgi_environ, start_response)
         start_time = time()
-        resource, path_params = self._find_resource_for_url(wsgi_environ["PATH_INFO"])
-        request = Request(wsgi_environ, path_params)
+        resource, path_params = self._find_resource_for_wsgi_environment(wsgi_environ, routing_table)
+        request = Request(wsgi_environ, path_params, self.max_request_body_size, self._request_deserializer_registry)
         LOGGER.debug("Start handling %s request %s", request.request_method_name.upper(), request)
-        response = self._create_response_and_handle_exceptions(path_params, request, resource)
-        LOGGER.debug("Got response %s", response)
-        header_as_list = [(key, str(value)) for key, value in response.headers.items()]
-        start_response(response.status_string, header_as_list)
+        try:
+            response = self._create_response_and_handle_exceptions(path_params, request, resource)
+            response = self._compress_response(request, response)
+            LOGGER.debug("Got response %s", response)
+            # noinspection PyProtectedMember
+            body_iterable = response._get_body_iterable(wsgi_environ.get("wsgi.file_wrapper"))
+            # headers set to None, like the default Content-Encoding, are not sent
+            header_as_list = [(key, str(value)) for key, value in response.headers.items() if value is not None]
+            start_response(response.status_string, header_as_list)
+        except BaseException:
+            request.close()
+            raise
         end_time = time()
         LOGGER.debug("Request processing took %d seconds", (end_time - start_time))
-        return [response.content]
+        return self._close_request_with_body(request, response, body_iterable)
+
+    @staticmethod
+    def _close_request_with_body(request: Request, response: Response, body_iterable: Iterable) -> Iterable:
+        if isinstance(body_iterable, list) or isinstance(response, StaticFileResponse):
+            # neither a serialized body nor a file reads from the request anymore, the result of the server's file
+            # wrapper is passed on as it is, since the server only uses sendfile if it gets it back
+            request.close()
+            return body_iterable
+        # a streamed body might still read from the request, e.g. an uploaded file, it is closed after the last chunk
+        return ClosingBody(body_iterable, request.close)
+
+    def _compress_response(self, request: Request, response: Response) -> Response:
+        if self.response_compression is None:
+            return response
+        return self.response_compression.compress(request, response)
+
+    @staticmethod
+    def _call_mounted_wsgi_app(
+        path_prefix: str, wsgi_app: Callable, wsgi_environ: dict, start_response: Callable
+    ) -> Iterable:
+        wsgi_environ["SCRIPT_NAME"] = wsgi_environ.get("SCRIPT_NAME", "") + path_prefix
+        wsgi_environ["PATH_INFO"] = wsgi_environ["PATH_INFO"][len(path_prefix) :]
+        return wsgi_app(wsgi_environ, start_response)
 
     def _create_response_and_handle_exceptions(
         self, path_params: dict, request: Request, resource: Resource
@@ -216,20 +396,35 @@ class RestItApp:
     @staticmethod
     def _get_response_or_raise_not_found(path_params: dict, request: Request, resource: Resource) -> Response:
         if resource is not None:
-            # noinspection PyBroadException
+            # a wrong method is answered with 405 before any request handling, the plan is handed on to not look it
+            # up twice
             # noinspection PyProtectedMember
-            response = resource.handle_request(request, path_params)
+            handler_plan = resource._get_handler_plan(request.request_method_name)
+            response = resource.handle_request(request, path_params, handler_plan)
 
         else:
             raise NotFound()
         return response
 
-    @lru_cache()
-    def _find_resource_for_url(self, url: str) -> Union[Tuple[None, None], Tuple[Resource, Dict]]:
-        for resource in self._resources:
-            # noinspection PyProtectedMember
-            is_matching, path_params = resource._get_match(url)
-            if is_matching:
-                return resource, path_params
-
-        return None, None
+    def _find_resource_for_wsgi_environment(
+        self, wsgi_environ: dict, routing_table: RoutingTable = None
+    ) -> Union[Tuple[None, None], Tuple[Resource, Dict]]:
+        routing_table = routing_table or self._routing_table
+        # resolving the host name is skipped if no resource is bound to a host
+        host_name = Request.get_host_name(wsgi_environ) if routing_table.is_host_aware else None
+        return self._find_route(routing_table, wsgi_environ["PATH_INFO"], host_name)
+
+    def _find_resource_for_url(
+        self, url: str, host_name: str = None
+    ) -> Union[Tuple[None, None], Tuple[Resource, Dict]]:
+        return self._find_route(self._routing_table, url, host_name)
+
+    def _find_route(
+        self, routing_table: RoutingTable, url: str, host_name: Union[str, None]
+    ) -> Union[Tuple[None, None], Tuple[Resource, Dict]]:
+        cached_route, route_kind = routing_table.find_route(url, host_name)
+        self._routing_statistics.count(route_kind)
+        return cached_route.to_tuple()
+
+    class RequestDeserializerRegistrationAfterInitException(Exception):
+        pass
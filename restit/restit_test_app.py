@@ -8,7 +8,11 @@ from restit import Resource, Namespace
 from restit._response import Response
 from restit.common import get_default_encoding
 from restit.request import Request
+from restit.request_deserializer import RequestDeserializer
+from restit.response_compression import ResponseCompression
 from restit.restit_app import RestItApp
+from restit.static_file_response import StaticFileResponse
+from restit.streaming_response import StreamingResponse
 
 
 class RestItTestApp:
@@ -18,8 +22,19 @@ class RestItTestApp:
         namespaces: List[Namespace] = None,
         debug: bool = True,
         raise_exceptions: bool = False,
+        max_request_body_size: int = None,
+        request_deserializers: List[RequestDeserializer] = None,
+        response_compression: ResponseCompression = None,
     ):
-        self._restit_app = RestItApp(resources, namespaces, debug, raise_exceptions)
+        self._restit_app = RestItApp(
+            resources,
+            namespaces,
+            debug,
+            raise_exceptions,
+            max_request_body_size=max_request_body_size,
+            request_deserializers=request_deserializers,
+            response_compression=response_compression,
+        )
         # noinspection PyProtectedMember
         self._restit_app._init()
 
@@ -31,6 +46,9 @@ class RestItTestApp:
             restit_app._namespaces,
             restit_app.debug,
             restit_app.raise_exceptions,
+            restit_app.max_request_body_size,
+            restit_app._request_deserializers,
+            restit_app.response_compression,
         )
 
     @property
@@ -105,16 +123,37 @@ class RestItTestApp:
     ):
         wsgi_environment = self._create_wsgi_environment(json, data, headers, path, method)
         response = self._get_response(wsgi_environment)
+        if isinstance(response, (StreamingResponse, StaticFileResponse)):
+            self._read_body_iterable(response)
         return response
 
+    @staticmethod
+    def _read_body_iterable(response: Union[StreamingResponse, StaticFileResponse]):
+        # noinspection PyProtectedMember
+        body_iterable = response._get_body_iterable()
+        try:
+            response.content = b"".join(body_iterable)
+        finally:
+            body_iterable.close()
+        try:
+            response.text = response.content.decode()
+        except UnicodeDecodeError:
+            response.text = None
+
     # noinspection PyProtectedMember
     def _get_response(self, wsgi_environment: dict):
-        resource, path_params = self._restit_app._find_resource_for_url(wsgi_environment["PATH_INFO"])
-        request = Request(wsgi_environment, path_params)
+        resource, path_params = self._restit_app._find_resource_for_wsgi_environment(wsgi_environment)
+        request = Request(
+            wsgi_environment,
+            path_params,
+            self._restit_app.max_request_body_size,
+            self._restit_app._request_deserializer_registry,
+        )
         if self.raise_exceptions:
-            return self._restit_app._get_response_or_raise_not_found(path_params, request, resource)
+            response = self._restit_app._get_response_or_raise_not_found(path_params, request, resource)
         else:
-            return self._restit_app._create_response_and_handle_exceptions(path_params, request, resource)
+            response = self._restit_app._create_response_and_handle_exceptions(path_params, request, resource)
+        return self._restit_app._compress_response(request, response)
 
     def _create_wsgi_environment(
         self,
@@ -127,10 +166,13 @@ class RestItTestApp:
         header = header or {}
         wsgi_environment = {}
         parsed_path = urlparse(path)
+        if "Host" in header:
+            wsgi_environment["HTTP_HOST"] = header["Host"]
         setup_testing_defaults(wsgi_environment)
         body_as_bytes = b""
         wsgi_environment["HTTP_ACCEPT"] = header.get("Accept", "*/*")
-        wsgi_environment["CONTENT_ENCODING"] = header.get("Content-Encoding", "gzip, deflate")
+        if "Content-Encoding" in header:
+            wsgi_environment["CONTENT_ENCODING"] = header["Content-Encoding"]
         wsgi_environment["HTTP_ACCEPT_ENCODING"] = header.get("Accept-Encoding", "gzip, deflate")
         content_type = "application/octet-stream"
         accept_charset = header.get("Accept-Charset", get_default_encoding())
@@ -3,9 +3,9 @@ from pathlib import Path
 from typing import Union
 
 from restit._response import Response
-from restit.internal.suffix_media_type_mapping import SUFFIX_MEDIA_TYPE_MAPPING
 from restit.request import Request
 from restit.resource import Resource
+from restit.static_file_response import StaticFileResponse
 
 
 class StaticDirectoryResource(Resource):
@@ -19,12 +19,4 @@ class StaticDirectoryResource(Resource):
         file_name = request.path_parameters["file_name"] or self.entry_file
 
         file_path = os.path.join(self.static_directory_path, file_name)
-        with open(file_path, "rb") as fp:
-            file_content = fp.read()
-
-        _, suffix = os.path.splitext(file_name)
-        content_type = SUFFIX_MEDIA_TYPE_MAPPING.get(
-            suffix,
-        )
-
-        return Response(file_content, headers={"Content-Type": content_type})
+        return StaticFileResponse(file_path)
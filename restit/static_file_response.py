@@ -1,13 +1,44 @@
 import os
 from http import HTTPStatus
 from pathlib import Path
-from typing import Union
+from typing import Callable, Iterable, List, Tuple, Union
+from uuid import uuid4
+from wsgiref.util import FileWrapper
 
 from restit._response import Response
+from restit.common import format_http_date, parse_http_date
+from restit.internal.file_range_body import FileRangeBody
+from restit.internal.http_range import HttpRange
 from restit.internal.suffix_media_type_mapping import SUFFIX_MEDIA_TYPE_MAPPING
 
 
 class StaticFileResponse(Response):
+    """A response sending a file as it is, without serializing it.
+
+    The *Content-Length* is taken from the file size and the file is opened only when the body is handed to the server.
+    If the server provides ``wsgi.file_wrapper``, the file is passed to it, so servers like
+    `Gunicorn <https://gunicorn.org/>`_ can use ``sendfile``. Otherwise the file is read in chunks of
+    :attr:`BLOCK_SIZE` bytes.
+
+    A *GET* request with a `Range <https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Range>`_ header is answered
+    with `206 <https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/206>`_ and the requested ranges, several ranges
+    as *multipart/byteranges*. The ranges are read with positioned reads of at most :attr:`BLOCK_SIZE` bytes. An
+    *If-Range* header not matching the *ETag* or the *Last-Modified* date leads to the whole file.
+
+    The *ETag* is built from the modification time and the size of the file, a request with a matching
+    *If-None-Match* or *If-Modified-Since* header is answered with
+    `304 <https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/304>`_.
+
+    :param file_path: The path of the file
+    :param status_code: The response status code
+    :param headers: The response headers, the *Content-Type* defaults to the one of the file suffix
+    :type headers: dict
+    :param suffix: The suffix used to find the *Content-Type*, defaults to the suffix of the file path
+    :type suffix: str
+    """
+
+    BLOCK_SIZE = 64 * 1024
+
     def __init__(
         self,
         file_path: Union[str, Path],
@@ -17,15 +48,92 @@ class StaticFileResponse(Response):
     ):
         headers = headers or {}
         suffix = suffix or StaticFileResponse._get_suffix_from_file_path(file_path)
-        content_type = SUFFIX_MEDIA_TYPE_MAPPING.get(
-            suffix,
-        )
+        content_type = SUFFIX_MEDIA_TYPE_MAPPING.get(suffix, "application/octet-stream")
         headers.setdefault("Content-Type", content_type)
 
-        with open(file_path, "rb") as fp:
-            file_content = fp.read()
+        super().__init__(None, status_code, headers)
+        self.file_path = file_path
+        file_stat = os.stat(file_path)
+        self.file_size = file_stat.st_size
+        self.modification_time = int(file_stat.st_mtime)
+        self.modification_time_ns = file_stat.st_mtime_ns
+        # like most web servers, the entity tag changes with the modification time in nanoseconds and the size
+        self.entity_tag = f'"{file_stat.st_mtime_ns:x}-{self.file_size:x}"'
+        self._range_parts: Union[List[Tuple[bytes, int, int]], None] = None
+        self._range_epilogue = b""
+        self._headers.setdefault("Accept-Ranges", "bytes")
+        self._headers.setdefault("Last-Modified", format_http_date(self.modification_time))
+        self._headers.setdefault("ETag", self.entity_tag)
+
+    def _prepare_headers(self, content_type: str):
+        self._headers.setdefault("Content-Type", content_type)
+        self._headers.setdefault("Content-Length", self.file_size)
+
+    def _apply_range(self, range_header: Union[str, None], if_range: Union[str, None]):
+        if self._status != HTTPStatus.OK or not range_header:
+            return
+        if if_range is not None and not self._is_if_range_matching(if_range):
+            return
+        ranges = HttpRange.parse(range_header, self.file_size)
+        if ranges is None:
+            return
+
+        self._status = HTTPStatus.PARTIAL_CONTENT
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            self._range_parts = [(b"", start, end)]
+            self._headers["Content-Range"] = self._get_content_range(start, end)
+        else:
+            boundary = uuid4().hex
+            self._range_parts, self._range_epilogue = self._get_multipart_byteranges(ranges, boundary)
+            self._headers["Content-Type"] = f"multipart/byteranges; boundary={boundary}"
+        self._headers["Content-Length"] = sum(
+            len(preamble) + end - start + 1 for preamble, start, end in self._range_parts
+        ) + len(self._range_epilogue)
+
+    def _use_encoded_file(self, file_path: Union[str, Path], file_size: int):
+        """Sends an encoded variant of the file, like a precompressed sibling, instead"""
+        self.file_path = file_path
+        self.file_size = file_size
+        self._headers["Content-Length"] = file_size
+        # ranges would refer to the encoded file
+        self._headers.pop("Accept-Ranges", None)
+
+    def _is_if_range_matching(self, if_range: str) -> bool:
+        if if_range.startswith(('"', "W/")):
+            # an entity tag, only a strong one matching the one of the file is accepted
+            entity_tag = self._headers.get("ETag")
+            return entity_tag is not None and not entity_tag.startswith("W/") and entity_tag == if_range.strip()
+        return parse_http_date(if_range) == self.modification_time
+
+    def _get_content_range(self, start: int, end: int) -> str:
+        return f"bytes {start}-{end}/{self.file_size}"
+
+    def _get_multipart_byteranges(
+        self, ranges: List[Tuple[int, int]], boundary: str
+    ) -> Tuple[List[Tuple[bytes, int, int]], bytes]:
+        delimiter = f"--{boundary}"
+        content_type = self._headers.get("Content-Type")
+        parts = []
+        for index, (start, end) in enumerate(ranges):
+            # the line break before a delimiter belongs to the delimiter
+            line_break = "" if index == 0 else "\r\n"
+            preamble = (
+                f"{line_break}{delimiter}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Range: {self._get_content_range(start, end)}\r\n\r\n"
+            )
+            parts.append((preamble.encode("latin-1"), start, end))
+        return parts, f"\r\n{delimiter}--\r\n".encode("latin-1")
 
-        super().__init__(file_content, status_code, headers)
+    def _get_body_iterable(self, file_wrapper: Callable = None) -> Iterable[bytes]:
+        file = open(self.file_path, "rb")
+        if self._range_parts is not None:
+            # a file wrapper sends the file up to its end, ranges are read one by one instead
+            return FileRangeBody(file, self._range_parts, self._range_epilogue, self.BLOCK_SIZE)
+        if file_wrapper is not None:
+            return file_wrapper(file, self.BLOCK_SIZE)
+        return FileWrapper(file, self.BLOCK_SIZE)
 
     @staticmethod
     def _get_suffix_from_file_path(file_path: str) -> str:
@@ -0,0 +1,70 @@
+from http import HTTPStatus
+from typing import Any, Callable, Iterable, Union
+
+from restit._response import Response
+from restit.common import get_default_encoding
+from restit.internal.streaming_body import StreamingBody
+
+
+class StreamingResponse(Response):
+    """A response whose body is sent chunk by chunk while it is produced, e.g. a large export.
+
+    The body is an iterable of `bytes` or `str` chunks, or of objects of the item type. Those are serialized one after
+    the other with the response serializer negotiated for the item type and followed by the separator, a stream of
+    dictionaries becomes newline delimited *JSON* by default.
+
+    No *Content-Length* header is sent, so the server uses chunked transfer encoding or closes the connection after
+    the body. If the client disconnects, the server calls ``close()`` on the body, a generator can clean up in a
+    ``finally`` block then.
+
+    .. note::
+
+        The status and the headers are sent before the first chunk is produced. An exception raised while iterating
+        can therefore not be answered with an error response anymore, the server aborts the response instead.
+
+    :param response_body: The iterable of chunks
+    :type response_body: Iterable
+    :param status_code: The response status code
+    :param headers: The response headers, *Content-Type* defaults to *application/octet-stream* for byte chunks
+    :type headers: dict
+    :param item_type: The type of the objects to serialize, `None` for `bytes` and `str` chunks only
+    :type item_type: type
+    :param separator: Follows every serialized object
+    :type separator: bytes
+    """
+
+    def __init__(
+        self,
+        response_body: Iterable[Any],
+        status_code: Union[int, HTTPStatus] = HTTPStatus.OK,
+        headers: dict = None,
+        item_type: type = None,
+        separator: bytes = b"\n",
+    ):
+        super().__init__(response_body, status_code, headers)
+        self.item_type = item_type
+        self.separator = separator
+        self._streaming_body: Union[Iterable[bytes], None] = None
+
+    def _prepare_streaming_body(self, serialize: Union[Callable[[Any], bytes], None], content_type: str):
+        if serialize is not None:
+            separator = self.separator
+
+            def serialize_with_separator(item: Any) -> bytes:
+                return serialize(item) + separator
+
+        else:
+            serialize_with_separator = None
+        self._streaming_body = StreamingBody(self.response_body_input, serialize_with_separator, get_default_encoding())
+        self._headers.setdefault("Content-Type", content_type)
+
+    def _wrap_body_iterable(self, wrap: Callable[[Iterable[bytes]], Iterable[bytes]]):
+        self._streaming_body = wrap(self._get_body_iterable())
+
+    def _get_body_iterable(self, file_wrapper: Callable = None) -> Iterable[bytes]:
+        if self._streaming_body is None:
+            self._prepare_streaming_body(None, "application/octet-stream")
+        return self._streaming_body
+
+    def __str__(self) -> str:
+        return f"StreamingResponse({self.status_string})"
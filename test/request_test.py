@@ -2,6 +2,7 @@ import unittest
 from io import BytesIO
 
 from restit import Request
+from restit.exception import PayloadTooLarge
 from restit.internal.http_accept import HttpAccept
 
 
@@ -14,7 +15,7 @@ class RequestTestCase(unittest.TestCase):
 
         self.assertEqual(b"1234567890", request.body)
         self.assertEqual("text/plain", request.content_type.to_string())
-        self.assertEqual("gzip, deflate", request.content_encoding)
+        self.assertIsNone(request.content_encoding)
         self.assertEqual("utf-8", request.headers["Accept-Charset"])
         self.assertEqual("*/*", request.headers["Accept"])
         self.assertEqual("gzip, deflate", request.headers["Accept-Encoding"])
@@ -41,12 +42,111 @@ class RequestTestCase(unittest.TestCase):
         request = Request(self.wsgi_environment, {})
         self.assertEqual({"key": "value"}, request.typed_body[dict])
 
+    def test_parsed_headers_are_memoized(self):
+        request = Request(self.wsgi_environment, {})
+
+        self.assertIs(request.http_accept_object, request.http_accept_object)
+        self.assertIs(request.content_type, request.content_type)
+        self.assertIs(request.http_accept_object, Request(self.wsgi_environment, {}).http_accept_object)
+
+    def test_lazy_request(self):
+        class UnreadableInput:
+            def read(self, size: int = -1) -> bytes:
+                raise AssertionError("The body must not be read")
+
+        self.wsgi_environment["wsgi.input"] = UnreadableInput()
+        del self.wsgi_environment["QUERY_STRING"]
+        request = Request(self.wsgi_environment, {})
+
+        self.assertEqual("/path", request.path)
+        self.assertEqual("GET", request.request_method_name)
+        self.assertEqual({}, request.query_parameters)
+        self.assertEqual("text/plain", request.content_type.to_string())
+        self.assertEqual(HttpAccept.from_accept_string("*/*"), request.http_accept_object)
+        self.assertIsNone(request._headers)
+        self.assertIsNone(request._forwarded)
+        self.assertEqual("http://localhost:8080", request.host)
+        self.assertIsNotNone(request._forwarded)
+        typed_body = request.typed_body
+        with self.assertRaises(AssertionError):
+            _ = typed_body[dict]
+
+    def test_iter_body_streams_without_buffering(self):
+        request = Request(self.wsgi_environment, {})
+
+        self.assertEqual([b"1234", b"5678", b"90"], list(request.iter_body(4)))
+        self.assertIsNone(request._body_file)
+        with self.assertRaises(Request.BodyAlreadyConsumedException):
+            _ = request.body
+
+    def test_iter_body_of_buffered_body(self):
+        request = Request(self.wsgi_environment, {})
+
+        self.assertEqual(b"1234567890", request.body)
+        self.assertEqual([b"123456", b"7890"], list(request.iter_body(6)))
+        self.assertEqual(b"1234567890", request.body_file.read())
+
+    def test_body_file_is_moved_to_temporary_file_above_spool_size(self):
+        request = Request(self.wsgi_environment, {})
+        request.body_spool_size = 4
+
+        self.assertEqual(b"1234567890", request.body)
+        self.assertTrue(request.body_file._rolled)
+        request.close()
+        self.assertTrue(request._body_file.closed)
+
+    def test_body_does_not_read_past_content_length(self):
+        self.wsgi_environment["wsgi.input"] = BytesIO(b"1234567890next request")
+
+        self.assertEqual(b"1234567890", Request(self.wsgi_environment, {}).body)
+
+    def test_max_body_size_with_content_length(self):
+        class UnreadableInput:
+            def read(self, size: int = -1) -> bytes:
+                raise AssertionError("The body must not be read")
+
+        self.wsgi_environment["wsgi.input"] = UnreadableInput()
+        request = Request(self.wsgi_environment, {}, max_body_size=9)
+
+        with self.assertRaises(PayloadTooLarge):
+            request.check_body_size()
+        with self.assertRaises(PayloadTooLarge):
+            _ = request.body
+
+    def test_max_body_size_without_content_length(self):
+        del self.wsgi_environment["CONTENT_LENGTH"]
+        self.assertEqual(b"", Request(self.wsgi_environment, {}).body)
+
+        self.wsgi_environment["wsgi.input_terminated"] = True
+        self.wsgi_environment["wsgi.input"] = BytesIO(b"1234567890")
+        self.assertEqual(b"1234567890", Request(self.wsgi_environment, {}, max_body_size=10).body)
+
+        self.wsgi_environment["wsgi.input"] = BytesIO(b"1234567890")
+        request = Request(self.wsgi_environment, {}, max_body_size=9)
+        request.check_body_size()
+        with self.assertRaises(PayloadTooLarge):
+            _ = request.body
+
+    def test_get_host_name(self):
+        self.assertEqual("localhost", Request.get_host_name(self.wsgi_environment))
+
+        self.wsgi_environment["HTTP_HOST"] = "API.example.com:8080"
+        self.assertEqual("api.example.com", Request.get_host_name(self.wsgi_environment))
+
+        self.wsgi_environment["HTTP_HOST"] = "[::1]:8080"
+        self.assertEqual("[::1]", Request.get_host_name(self.wsgi_environment))
+
+        self.wsgi_environment["HTTP_X_FORWARDED_HOST"] = "proxied.example.com, other.example.com"
+        self.assertEqual("proxied.example.com", Request.get_host_name(self.wsgi_environment))
+
+        self.wsgi_environment["HTTP_FORWARDED"] = "for=192.0.2.60;proto=http;host=forwarded.example.com"
+        self.assertEqual("forwarded.example.com", Request.get_host_name(self.wsgi_environment))
+
     @staticmethod
     def _create_wsgi_environment():
         return {
             "HTTP_ACCEPT": "*/*",
             "HTTP_ACCEPT_CHARSET": "utf-8",
-            "CONTENT_ENCODING": "gzip, deflate",
             "HTTP_ACCEPT_ENCODING": "gzip, deflate",
             "REQUEST_METHOD": "GET",
             "PATH_INFO": "/path",
@@ -29,3 +29,20 @@ class ResourceTestCase(unittest.TestCase):
             ],
             [r.__request_mapping__ for r in resources],
         )
+
+    def test_get_allowed_methods(self):
+        class MyResource(Resource):
+            def get(self, request):
+                pass
+
+            def post(self, request):
+                pass
+
+        self.assertEqual(["get", "post", "options"], MyResource().get_allowed_methods())
+        self.assertEqual(["options"], Resource().get_allowed_methods())
+
+    def test_get_allowed_methods_without_source_code(self):
+        namespace = {"Resource": Resource}
+        exec(compile("class MyResource(Resource):\n    def put(self, request):\n        pass\n", "<none>", "exec"), namespace)
+
+        self.assertEqual(["put", "options"], namespace["MyResource"]().get_allowed_methods())
@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+from email.utils import formatdate
+
+from restit import Request, Resource, Response, RestItTestApp, StaticDirectoryResource
+from restit.decorator import conditional_request, path
+
+_calls = []
+_versions = {"1": 1}
+
+
+@path("/content")
+class ContentResource(Resource):
+    @conditional_request()
+    def get(self, request: Request) -> Response:
+        _calls.append("content")
+        return Response({"key": "value"})
+
+
+@path("/users/:id")
+class VersionedResource(Resource):
+    @conditional_request(version_key=lambda request: _versions[request.path_parameters["id"]])
+    def get(self, request: Request) -> Response:
+        _calls.append("versioned")
+        return Response({"id": request.path_parameters["id"], "version": _versions[request.path_parameters["id"]]})
+
+
+@path("/handler-etag")
+class HandlerEntityTagResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response("text", headers={"ETag": '"handler"'})
+
+
+@path("/plain")
+class PlainResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response("text")
+
+
+class ConditionalRequestTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        _calls.clear()
+        _versions["1"] = 1
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temporary_directory.name, "file.txt")
+        with open(self.file_path, "wb") as fp:
+            fp.write(b"static content")
+        os.utime(self.file_path, (1000000000, 1000000000))
+        self.rest_test_app = RestItTestApp(
+            resources=[
+                ContentResource(),
+                VersionedResource(),
+                HandlerEntityTagResource(),
+                PlainResource(),
+                StaticDirectoryResource("/static", self.temporary_directory.name),
+            ]
+        )
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_entity_tag_from_content(self):
+        response = self.rest_test_app.get("/content")
+        self.assertEqual(200, response.status_code)
+        entity_tag = response.headers["ETag"]
+        self.assertRegex(entity_tag, r'^"[0-9a-f]{32}"$')
+
+        response = self.rest_test_app.get("/content", headers={"If-None-Match": entity_tag})
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b"", response.content)
+        self.assertEqual(entity_tag, response.headers["ETag"])
+        self.assertNotIn("Content-Type", response.headers)
+        self.assertNotIn("Content-Length", response.headers)
+
+        response = self.rest_test_app.get("/content", headers={"If-None-Match": '"outdated"'})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"key": "value"}, response.json())
+
+    def test_version_key_short_circuits_the_handler(self):
+        response = self.rest_test_app.get("/users/1")
+        self.assertEqual(200, response.status_code)
+        entity_tag = response.headers["ETag"]
+        self.assertEqual(["versioned"], _calls)
+
+        response = self.rest_test_app.get("/users/1", headers={"If-None-Match": entity_tag})
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(entity_tag, response.headers["ETag"])
+        self.assertEqual(["versioned"], _calls)
+
+        _versions["1"] = 2
+        response = self.rest_test_app.get("/users/1", headers={"If-None-Match": entity_tag})
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(entity_tag, response.headers["ETag"])
+        self.assertEqual({"id": "1", "version": 2}, response.json())
+        self.assertEqual(["versioned", "versioned"], _calls)
+
+    def test_handler_entity_tag_is_evaluated(self):
+        response = self.rest_test_app.get("/handler-etag", headers={"If-None-Match": '"handler"'})
+
+        self.assertEqual(304, response.status_code)
+        self.assertEqual('"handler"', response.headers["ETag"])
+
+    def test_responses_without_validators_are_unchanged(self):
+        response = self.rest_test_app.get("/plain", headers={"If-None-Match": "*"})
+
+        self.assertEqual(200, response.status_code)
+        self.assertNotIn("ETag", response.headers)
+
+    def test_static_file_validators(self):
+        response = self.rest_test_app.get("/static/file.txt")
+        self.assertEqual(200, response.status_code)
+        entity_tag = response.headers["ETag"]
+        self.assertEqual(f'"{1000000000 * 10 ** 9:x}-e"', entity_tag)
+
+        response = self.rest_test_app.get("/static/file.txt", headers={"If-None-Match": entity_tag})
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b"", response.content)
+
+        response = self.rest_test_app.get(
+            "/static/file.txt", headers={"If-Modified-Since": formatdate(1000000000, usegmt=True)}
+        )
+        self.assertEqual(304, response.status_code)
+
+        os.utime(self.file_path, (1000000005, 1000000005))
+        response = self.rest_test_app.get("/static/file.txt", headers={"If-None-Match": entity_tag})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(b"static content", response.content)
+
+    def test_if_range_with_static_entity_tag(self):
+        entity_tag = self.rest_test_app.get("/static/file.txt").headers["ETag"]
+
+        response = self.rest_test_app.get("/static/file.txt", headers={"Range": "bytes=0-5", "If-Range": entity_tag})
+
+        self.assertEqual(206, response.status_code)
+        self.assertEqual(b"static", response.content)
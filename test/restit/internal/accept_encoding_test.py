@@ -0,0 +1,29 @@
+import unittest
+
+from restit.internal.accept_encoding import AcceptEncoding
+
+
+class AcceptEncodingTestCase(unittest.TestCase):
+    def test_parse(self):
+        accept_encoding = AcceptEncoding.from_accept_encoding_string("gzip;q=0.8, DEFLATE, br;q=1.5, x-gzip;q=0.1, ;")
+
+        self.assertEqual({"gzip": 0.8, "deflate": 1.0, "br": 1.0}, dict(accept_encoding.qualities))
+        self.assertIs(
+            accept_encoding,
+            AcceptEncoding.from_accept_encoding_string("gzip;q=0.8, DEFLATE, br;q=1.5, x-gzip;q=0.1, ;"),
+        )
+
+    def test_get_best_match(self):
+        encodings = ("gzip", "deflate")
+
+        self.assertEqual("gzip", AcceptEncoding.from_accept_encoding_string("gzip, deflate").get_best_match(encodings))
+        self.assertEqual("gzip", AcceptEncoding.from_accept_encoding_string("deflate, gzip").get_best_match(encodings))
+        self.assertEqual(
+            "deflate", AcceptEncoding.from_accept_encoding_string("gzip;q=0.5, deflate").get_best_match(encodings)
+        )
+        self.assertEqual("gzip", AcceptEncoding.from_accept_encoding_string("x-gzip").get_best_match(encodings))
+        self.assertEqual("gzip", AcceptEncoding.from_accept_encoding_string("*").get_best_match(encodings))
+        self.assertEqual("deflate", AcceptEncoding.from_accept_encoding_string("*, gzip;q=0").get_best_match(encodings))
+        self.assertIsNone(AcceptEncoding.from_accept_encoding_string("identity").get_best_match(encodings))
+        self.assertIsNone(AcceptEncoding.from_accept_encoding_string("gzip;q=0, br").get_best_match(encodings))
+        self.assertIsNone(AcceptEncoding.from_accept_encoding_string("gzip;q=x").get_best_match(encodings))
@@ -0,0 +1,63 @@
+import unittest
+
+from restit import Resource, StaticDirectoryResource
+from restit.internal.combined_regex_router import CombinedRegexRouter
+from restit.internal.linear_router import LinearRouter
+
+
+class CombinedRegexRouterTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        resources = [StaticDirectoryResource("/static", "/some/path")]
+        for request_mapping in [
+            "/",
+            "/users",
+            "/users/api",
+            "/users/:id<int>",
+            "/users/:id",
+            "/users/:id/size/:id2",
+            "/:wuff/:id",
+            "/favicon.ico",
+        ]:
+            resource = Resource()
+            resource.__request_mapping__ = request_mapping
+            resources.append(resource)
+        for resource in resources:
+            resource.init()
+        self.resources = Resource.sort_resources(resources)
+        self.router = CombinedRegexRouter(self.resources)
+
+    def test_path_params_of_different_resources_do_not_collide(self):
+        resource, path_params = self.router.find_resource("/users/10/size/20")
+        self.assertEqual("/users/:id/size/:id2", resource.__request_mapping__)
+        self.assertEqual({"id": "10", "id2": "20"}, path_params)
+
+        resource, path_params = self.router.find_resource("/users/10")
+        self.assertEqual("/users/:id<int>", resource.__request_mapping__)
+        self.assertEqual({"id": 10}, path_params)
+
+    def test_regex_request_mapping(self):
+        resource, path_params = self.router.find_resource("/static/js/app.js")
+        self.assertIsInstance(resource, StaticDirectoryResource)
+        self.assertEqual({"file_name": "js/app.js"}, path_params)
+
+    def test_no_resources(self):
+        self.assertEqual((None, None), CombinedRegexRouter([]).find_resource("/"))
+
+    def test_same_result_as_linear_router(self):
+        linear_router = LinearRouter(self.resources)
+        for url in [
+            "/",
+            "/users",
+            "/users/api",
+            "/users/1",
+            "/users/hans",
+            "/users/1/size/2",
+            "/users/1/size",
+            "/a/b",
+            "/favicon.ico",
+            "/faviconXico",
+            "/static",
+            "/static/index.html",
+            "/not/found/at/all",
+        ]:
+            self.assertEqual(linear_router.find_resource(url), self.router.find_resource(url), url)
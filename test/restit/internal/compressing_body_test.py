@@ -0,0 +1,78 @@
+import gzip
+import unittest
+import zlib
+
+from restit.internal.compressed_file_cache import CompressedFileCache
+from restit.internal.compressing_body import CompressingBody
+
+
+class CompressingBodyTestCase(unittest.TestCase):
+    def test_compress(self):
+        data = b"compress me " * 100
+
+        self.assertEqual(data, gzip.decompress(CompressingBody.compress(data, "gzip", 6)))
+        self.assertEqual(data, zlib.decompress(CompressingBody.compress(data, "deflate", 6)))
+
+    def test_streamed_chunks(self):
+        chunks = [b"%d,row\n" % index * 100 for index in range(100)]
+        compressing_body = CompressingBody(iter(chunks), "gzip", 6)
+
+        compressed_chunks = list(compressing_body)
+
+        self.assertTrue(all(compressed_chunks[:-1]))
+        self.assertEqual(b"".join(chunks), gzip.decompress(b"".join(compressed_chunks)))
+
+    def test_every_chunk_can_be_decompressed_when_it_arrives(self):
+        chunks = [b'{"id": %d}\n' % index for index in range(3)]
+        compressing_body = CompressingBody(iter(chunks), "deflate", 6)
+        decompressor = zlib.decompressobj()
+
+        for chunk in chunks:
+            self.assertEqual(chunk, decompressor.decompress(next(compressing_body)))
+        self.assertEqual(b"", decompressor.decompress(next(compressing_body)))
+        self.assertTrue(decompressor.eof)
+
+    def test_close_is_passed_on(self):
+        events = []
+
+        def generate():
+            try:
+                while True:
+                    yield bytes(range(256)) * 1024
+            finally:
+                events.append("closed")
+
+        compressing_body = CompressingBody(generate(), "deflate", 6)
+        next(compressing_body)
+        compressing_body.close()
+
+        self.assertEqual(["closed"], events)
+
+
+class CompressedFileCacheTestCase(unittest.TestCase):
+    def test_variants_are_compressed_once(self):
+        compressions = []
+        cache = CompressedFileCache(max_size=10)
+
+        def compress():
+            compressions.append(1)
+            return b"12345"
+
+        self.assertEqual(b"12345", cache.get("a", compress))
+        self.assertEqual(b"12345", cache.get("a", compress))
+        self.assertEqual(1, len(compressions))
+
+    def test_oldest_variants_are_evicted(self):
+        cache = CompressedFileCache(max_size=10)
+
+        cache.get("a", lambda: b"12345")
+        cache.get("b", lambda: b"12345")
+        self.assertEqual(2, len(cache))
+        cache.get("c", lambda: b"1")
+        self.assertEqual(2, len(cache))
+        self.assertEqual(b"new", cache.get("a", lambda: b"new"))
+        self.assertEqual(3, len(cache))
+        self.assertEqual(b"12345678901", cache.get("d", lambda: b"12345678901"))
+        self.assertEqual(3, len(cache))
+        cache.clear()
+        self.assertEqual(0, len(cache))
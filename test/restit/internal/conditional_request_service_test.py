@@ -0,0 +1,79 @@
+import unittest
+from email.utils import formatdate
+
+from restit import Response, StreamingResponse
+from restit.internal.conditional_request_service import ConditionalRequestService
+from restit.internal.wsgi_headers import WsgiHeaders
+
+_LAST_MODIFIED = formatdate(1000000000, usegmt=True)
+
+
+class ConditionalRequestServiceTestCase(unittest.TestCase):
+    @staticmethod
+    def _is_not_modified(wsgi_environ: dict, entity_tag=None, last_modified=None, method="GET") -> bool:
+        return ConditionalRequestService.is_not_modified(method, WsgiHeaders(wsgi_environ), entity_tag, last_modified)
+
+    def test_create_entity_tag(self):
+        entity_tag = ConditionalRequestService.create_entity_tag(b"content")
+
+        self.assertRegex(entity_tag, r'^"[0-9a-f]{32}"$')
+        self.assertEqual(entity_tag, ConditionalRequestService.create_entity_tag(b"content"))
+        self.assertNotEqual(entity_tag, ConditionalRequestService.create_entity_tag(b"other content"))
+        self.assertEqual(
+            ConditionalRequestService.create_entity_tag(b"42"), ConditionalRequestService.create_version_entity_tag(42)
+        )
+
+    def test_if_none_match(self):
+        self.assertTrue(self._is_not_modified({"HTTP_IF_NONE_MATCH": '"a"'}, '"a"'))
+        self.assertTrue(self._is_not_modified({"HTTP_IF_NONE_MATCH": '"b", W/"a"'}, '"a"'))
+        self.assertTrue(self._is_not_modified({"HTTP_IF_NONE_MATCH": '"a"'}, 'W/"a"'))
+        self.assertTrue(self._is_not_modified({"HTTP_IF_NONE_MATCH": "*"}, '"a"'))
+        self.assertFalse(self._is_not_modified({"HTTP_IF_NONE_MATCH": '"b"'}, '"a"'))
+        self.assertFalse(self._is_not_modified({"HTTP_IF_NONE_MATCH": '"a"'}))
+        self.assertFalse(self._is_not_modified({"HTTP_IF_NONE_MATCH": '"a"'}, '"a"', method="POST"))
+
+    def test_if_modified_since(self):
+        self.assertTrue(self._is_not_modified({"HTTP_IF_MODIFIED_SINCE": _LAST_MODIFIED}, None, _LAST_MODIFIED))
+        later = formatdate(1000000001, usegmt=True)
+        self.assertTrue(self._is_not_modified({"HTTP_IF_MODIFIED_SINCE": later}, None, _LAST_MODIFIED))
+        earlier = formatdate(999999999, usegmt=True)
+        self.assertFalse(self._is_not_modified({"HTTP_IF_MODIFIED_SINCE": earlier}, None, _LAST_MODIFIED))
+        self.assertFalse(self._is_not_modified({"HTTP_IF_MODIFIED_SINCE": "yesterday"}, None, _LAST_MODIFIED))
+        self.assertFalse(self._is_not_modified({"HTTP_IF_MODIFIED_SINCE": _LAST_MODIFIED}))
+
+    def test_if_none_match_takes_precedence(self):
+        wsgi_environ = {"HTTP_IF_NONE_MATCH": '"b"', "HTTP_IF_MODIFIED_SINCE": _LAST_MODIFIED}
+
+        self.assertFalse(self._is_not_modified(wsgi_environ, '"a"', _LAST_MODIFIED))
+
+    def test_create_not_modified_response(self):
+        events = []
+
+        def generate():
+            try:
+                yield b"never sent"
+            finally:
+                events.append("closed")
+
+        body = generate()
+        next(body)
+        response = StreamingResponse(
+            body,
+            headers={
+                "Content-Type": "text/csv",
+                "Content-Length": 10,
+                "ETag": '"a"',
+                "Cache-Control": "max-age=60",
+            },
+        )
+
+        not_modified_response = ConditionalRequestService.create_not_modified_response(response)
+
+        self.assertEqual(304, not_modified_response.status_code)
+        self.assertEqual(b"", not_modified_response.content)
+        self.assertEqual('"a"', not_modified_response.headers["ETag"])
+        self.assertEqual("max-age=60", not_modified_response.headers["Cache-Control"])
+        self.assertNotIn("Content-Type", not_modified_response.headers)
+        self.assertNotIn("Content-Length", not_modified_response.headers)
+        self.assertEqual(["closed"], events)
+        self.assertIsInstance(not_modified_response, Response)
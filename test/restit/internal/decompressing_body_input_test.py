@@ -0,0 +1,68 @@
+import gzip
+import unittest
+import zlib
+from io import BytesIO
+
+from restit.exception import BadRequest, PayloadTooLarge, UnsupportedMediaType
+from restit.internal.decompressing_body_input import DecompressingBodyInput
+
+_BODY = b'{"key": "value", "numbers": [' + b", ".join(str(i).encode() for i in range(20000)) + b"]}"
+
+
+def _raw_deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+class DecompressingBodyInputTestCase(unittest.TestCase):
+    def _read(self, encoded_body: bytes, encoding: str, max_size: int = None, max_ratio: int = None, size: int = -1):
+        body_input = DecompressingBodyInput(BytesIO(encoded_body), encoding, max_size, max_ratio)
+        if size < 0:
+            return body_input.read()
+        return b"".join(iter(lambda: body_input.read(size), b""))
+
+    def test_gzip(self):
+        self.assertEqual(_BODY, self._read(gzip.compress(_BODY), "gzip"))
+        self.assertEqual(_BODY, self._read(gzip.compress(_BODY), "x-gzip"))
+
+    def test_deflate(self):
+        self.assertEqual(_BODY, self._read(zlib.compress(_BODY), "deflate"))
+        self.assertEqual(_BODY, self._read(_raw_deflate(_BODY), "deflate"))
+
+    def test_small_reads(self):
+        self.assertEqual(_BODY, self._read(gzip.compress(_BODY), "gzip", size=7))
+
+    def test_gzip_members(self):
+        self.assertEqual(_BODY * 2, self._read(gzip.compress(_BODY) + gzip.compress(_BODY), "gzip"))
+
+    def test_empty_body(self):
+        self.assertEqual(b"", self._read(b"", "gzip"))
+
+    def test_invalid_body(self):
+        with self.assertRaises(BadRequest):
+            self._read(b"not gzip at all", "gzip")
+
+    def test_truncated_body(self):
+        with self.assertRaises(BadRequest):
+            self._read(gzip.compress(_BODY)[:-20], "gzip")
+
+    def test_unsupported_encoding(self):
+        with self.assertRaises(UnsupportedMediaType):
+            DecompressingBodyInput(BytesIO(b""), "br", None, None)
+
+    def test_max_size(self):
+        self.assertEqual(_BODY, self._read(gzip.compress(_BODY), "gzip", max_size=len(_BODY)))
+
+        with self.assertRaises(PayloadTooLarge):
+            self._read(gzip.compress(_BODY), "gzip", max_size=len(_BODY) - 1)
+
+    def test_max_ratio(self):
+        bomb = gzip.compress(b"\0" * (64 * 1024 * 1024))
+
+        with self.assertRaises(PayloadTooLarge):
+            self._read(bomb, "gzip", max_ratio=100, size=64 * 1024)
+
+    def test_ratio_grace_size(self):
+        zeros = b"\0" * (512 * 1024)
+
+        self.assertEqual(zeros, self._read(gzip.compress(zeros), "gzip", max_ratio=100))
@@ -0,0 +1,66 @@
+import unittest
+
+from marshmallow import fields
+
+from restit import Resource, Request, Response
+from restit.decorator import path, exception_mapping, query_parameter, response, request_body
+from restit.exception import BadRequest, NotFound, Conflict, MethodNotAllowed
+from restit.internal.handler_plan import HandlerPlan
+
+
+class MyBaseException(Exception):
+    pass
+
+
+class MyException(MyBaseException):
+    pass
+
+
+@path("/")
+@exception_mapping({MyBaseException: BadRequest, KeyError: Conflict})
+class MyResource(Resource):
+    @query_parameter("limit", "The page size", fields.Integer())
+    @request_body({"text/plain": fields.String()}, "The body")
+    @exception_mapping({MyException: (NotFound, "Miau")})
+    @response(200, {"text/plain": fields.String()}, "Ok")
+    @response(404, {"text/plain": fields.String()}, "Not found")
+    def post(self, request: Request) -> Response:
+        return Response("")
+
+    def get(self, request: Request) -> Response:
+        return Response("")
+
+
+class HandlerPlanTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        resource = MyResource()
+        self.post_handler_plan = HandlerPlan(resource.post)
+        self.get_handler_plan = HandlerPlan(resource.get)
+
+    def test_decorator_metadata(self):
+        self.assertEqual(["limit"], [q.name for q in self.post_handler_plan.query_parameters])
+        self.assertEqual("The body", self.post_handler_plan.request_body_properties.description)
+        self.assertEqual([], self.get_handler_plan.query_parameters)
+        self.assertIsNone(self.get_handler_plan.request_body_properties)
+
+    def test_find_response_status_parameter(self):
+        self.assertEqual("Not found", self.post_handler_plan.find_response_status_parameter(404).description)
+        self.assertIsNone(self.post_handler_plan.find_response_status_parameter(201))
+        self.assertTrue(self.post_handler_plan.has_response_status_parameters)
+        self.assertFalse(self.get_handler_plan.has_response_status_parameters)
+
+    def test_find_exception_mapping_by_mro(self):
+        self.assertEqual((NotFound, "Miau"), self.post_handler_plan.find_exception_mapping(MyException))
+        self.assertEqual(BadRequest, self.post_handler_plan.find_exception_mapping(MyBaseException))
+        self.assertEqual(BadRequest, self.get_handler_plan.find_exception_mapping(MyException))
+        self.assertEqual(Conflict, self.get_handler_plan.find_exception_mapping(KeyError))
+        self.assertIsNone(self.get_handler_plan.find_exception_mapping(ValueError))
+
+    def test_resource_without_init_builds_plans_on_first_use(self):
+        resource = MyResource()
+        request = Request({"REQUEST_METHOD": "GET", "PATH_INFO": "/", "HTTP_ACCEPT": "text/plain"}, {})
+
+        self.assertEqual(200, resource.handle_request(request, {}).status_code)
+        self.assertIn("get", resource._handler_plans)
+        with self.assertRaises(MethodNotAllowed):
+            resource._get_handler_plan("delete")
@@ -70,3 +70,9 @@ class HttpAcceptTestCase(unittest.TestCase):
             "HttpAccept(['MIMEType(type=text, subtype=html, quality=1.0, details={})'])",
             str(http_accept),
         )
+
+    def test_from_accept_string_is_interned(self):
+        http_accept = HttpAccept.from_accept_string("text/html,application/json;q=0.9")
+
+        self.assertIs(http_accept, HttpAccept.from_accept_string("text/html,application/json;q=0.9"))
+        self.assertIsInstance(http_accept.mime_types, tuple)
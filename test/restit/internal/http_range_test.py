@@ -0,0 +1,46 @@
+import unittest
+
+from restit.exception import RequestedRangeNotSatisfiable
+from restit.internal.http_range import HttpRange
+
+
+class HttpRangeTestCase(unittest.TestCase):
+    def test_single_ranges(self):
+        self.assertEqual([(0, 499)], HttpRange.parse("bytes=0-499", 10000))
+        self.assertEqual([(9500, 9999)], HttpRange.parse("bytes=9500-", 10000))
+        self.assertEqual([(9500, 9999)], HttpRange.parse("bytes=-500", 10000))
+        self.assertEqual([(0, 99)], HttpRange.parse("bytes=-500", 100))
+        self.assertEqual([(50, 99)], HttpRange.parse("Bytes = 50-1000", 100))
+
+    def test_multiple_ranges(self):
+        self.assertEqual([(500, 599), (0, 9)], HttpRange.parse("bytes=500-599, 0-9", 10000))
+        self.assertEqual([(0, 9), (9990, 9999)], HttpRange.parse("bytes=0-9,,-10", 10000))
+
+    def test_overlapping_ranges_are_coalesced(self):
+        self.assertEqual([(0, 20)], HttpRange.parse("bytes=5-20,0-10", 10000))
+        self.assertEqual([(0, 20), (30, 40)], HttpRange.parse("bytes=30-40,11-20,0-10", 10000))
+
+    def test_unsatisfiable_ranges_are_skipped(self):
+        self.assertEqual([(0, 9)], HttpRange.parse("bytes=0-9,100-200", 100))
+
+    def test_ignored_headers(self):
+        for range_header in [
+            None,
+            "",
+            "items=0-9",
+            "bytes=",
+            "bytes=9-0",
+            "bytes=a-b",
+            "bytes=0-9;x",
+            "bytes=-",
+            "bytes=5",
+            "bytes=+1-2",
+            "bytes=" + ",".join(["0-0"] * (HttpRange.MAX_RANGES + 1)),
+        ]:
+            self.assertIsNone(HttpRange.parse(range_header, 100), range_header)
+
+    def test_not_satisfiable(self):
+        for range_header, size in [("bytes=100-", 100), ("bytes=-0", 100), ("bytes=-10", 0), ("bytes=0-", 0)]:
+            with self.assertRaises(RequestedRangeNotSatisfiable) as context:
+                HttpRange.parse(range_header, size)
+            self.assertEqual({"Content-Range": f"bytes */{size}"}, context.exception.headers)
@@ -0,0 +1,65 @@
+import unittest
+from threading import Thread
+
+from restit.internal.intern_cache import InternCache
+
+
+class InternCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.parsed_strings = []
+        self.intern_cache = InternCache(self._parse, max_size=3, max_key_length=10)
+
+    def _parse(self, string: str) -> tuple:
+        self.parsed_strings.append(string)
+        return tuple(string.split(","))
+
+    def test_equal_strings_return_same_object(self):
+        value = self.intern_cache.get("a,b")
+
+        self.assertEqual(("a", "b"), value)
+        self.assertIs(value, self.intern_cache.get("a,b"))
+        self.assertEqual(["a,b"], self.parsed_strings)
+
+    def test_bounded(self):
+        for string in ["a", "b", "c", "d"]:
+            self.intern_cache.get(string)
+
+        self.assertEqual(3, len(self.intern_cache))
+        self.intern_cache.get("a")
+        self.assertEqual(["a", "b", "c", "d", "a"], self.parsed_strings)
+
+    def test_long_strings_are_not_cached(self):
+        self.intern_cache.get("a" * 11)
+
+        self.assertEqual(0, len(self.intern_cache))
+
+    def test_none_and_non_string_keys_are_cached(self):
+        intern_cache = InternCache(lambda key: self.parsed_strings.append(key), max_size=3, max_key_length=1)
+        intern_cache.get(("a", "b"))
+        intern_cache.get(("a", "b"))
+
+        self.assertEqual(1, len(intern_cache))
+        self.assertEqual([("a", "b")], self.parsed_strings)
+
+    def test_clear(self):
+        self.intern_cache.get("a")
+        self.intern_cache.clear()
+
+        self.assertEqual(0, len(self.intern_cache))
+
+    def test_concurrent_access(self):
+        intern_cache = InternCache(lambda string: [string], max_size=16)
+        results = []
+
+        def get_values():
+            results.append([intern_cache.get(str(index % 32)) for index in range(1000)])
+
+        threads = [Thread(target=get_values) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(len(intern_cache), 16)
+        for values in results:
+            self.assertEqual([[str(index % 32)] for index in range(1000)], values)
@@ -1,5 +1,7 @@
 import unittest
 
+from restit.common import get_default_encoding, set_default_encoding
+from restit.internal.http_accept import HttpAccept
 from restit.internal.mime_type import MIMEType
 
 
@@ -71,3 +73,25 @@ class MIMETypeTestCase(unittest.TestCase):
         mime_type = MIMEType.from_string("application/json; charset=utf-8")
 
         self.assertEqual("utf-8", mime_type.charset)
+
+    def test_interned_instance_follows_the_default_encoding(self):
+        default_encoding = get_default_encoding()
+        mime_type = MIMEType.from_string("application/json")
+        _, accept_mime_type = HttpAccept.from_accept_string("application/json").get_best_match(["application/json"])
+        self.assertEqual(default_encoding, mime_type.charset)
+
+        set_default_encoding("latin-1")
+        try:
+            self.assertIs(mime_type, MIMEType.from_string("application/json"))
+            self.assertEqual("latin-1", MIMEType.from_string("application/json").charset)
+            self.assertEqual("latin-1", accept_mime_type.charset)
+            self.assertEqual("utf-8", MIMEType.from_string("application/json; charset=utf-8").charset)
+        finally:
+            set_default_encoding(default_encoding)
+
+    def test_from_string_is_interned_and_read_only(self):
+        mime_type = MIMEType.from_string("text/plain;charset=utf-8")
+
+        self.assertIs(mime_type, MIMEType.from_string("text/plain;charset=utf-8"))
+        with self.assertRaises(TypeError):
+            mime_type.details["charset"] = "latin-1"
@@ -0,0 +1,103 @@
+import unittest
+from io import BytesIO
+
+from restit.exception import BadRequest, PayloadTooLarge
+from restit.internal.multipart_parser import MultipartParser
+
+_BOUNDARY = "----WebKitFormBoundary7MA4YWxkTrZu0gW"
+
+_BODY = (
+    b"preamble\r\n"
+    b"------WebKitFormBoundary7MA4YWxkTrZu0gW\r\n"
+    b'Content-Disposition: form-data; name="title"\r\n'
+    b"\r\n"
+    b"a=b&c=d\r\n"
+    b"------WebKitFormBoundary7MA4YWxkTrZu0gW\r\n"
+    b'Content-Disposition: form-data; name="tag"\r\n'
+    b"\r\n"
+    b"first\r\n"
+    b"------WebKitFormBoundary7MA4YWxkTrZu0gW\r\n"
+    b'Content-Disposition: form-data; name="tag"\r\n'
+    b"\r\n"
+    b"second\r\n"
+    b"------WebKitFormBoundary7MA4YWxkTrZu0gW\r\n"
+    b'Content-Disposition: form-data; name="upload"; filename="report \\"final\\".csv"\r\n'
+    b"Content-Type: text/csv\r\n"
+    b"\r\n"
+    b"id,name\r\n1,--\r\n------WebKitFormBoundary\r\n"
+    b"------WebKitFormBoundary7MA4YWxkTrZu0gW--\r\n"
+    b"epilogue"
+)
+
+
+class _ChunkedInput:
+    def __init__(self, data: bytes, max_chunk_size: int):
+        self._input = BytesIO(data)
+        self._max_chunk_size = max_chunk_size
+
+    def read(self, size: int = -1) -> bytes:
+        return self._input.read(min(size, self._max_chunk_size))
+
+
+class MultipartParserTestCase(unittest.TestCase):
+    def test_get_boundary(self):
+        self.assertEqual("abc", MultipartParser.get_boundary("multipart/form-data; boundary=abc"))
+        self.assertEqual("a=b c", MultipartParser.get_boundary('multipart/form-data; boundary="a=b c"; charset=x'))
+        self.assertIsNone(MultipartParser.get_boundary("multipart/form-data"))
+
+    def test_parse(self):
+        fields, files = MultipartParser(BytesIO(_BODY), _BOUNDARY).parse()
+
+        self.assertEqual({"title": "a=b&c=d", "tag": ["first", "second"]}, fields)
+        self.assertEqual(["upload"], list(files))
+        self.assertEqual('report "final".csv', files["upload"].filename)
+        self.assertEqual("text/csv", files["upload"].content_type)
+        self.assertEqual(b"id,name\r\n1,--\r\n------WebKitFormBoundary", files["upload"].read())
+        self.assertEqual(39, files["upload"].size)
+
+    def test_parse_with_delimiter_split_across_reads(self):
+        for max_chunk_size in range(1, 50):
+            fields, files = MultipartParser(_ChunkedInput(_BODY, max_chunk_size), _BOUNDARY).parse()
+
+            self.assertEqual({"title": "a=b&c=d", "tag": ["first", "second"]}, fields)
+            self.assertEqual(b"id,name\r\n1,--\r\n------WebKitFormBoundary", files["upload"].read())
+
+    def test_file_is_spooled_to_disk(self):
+        content = bytes(range(256)) * 4096
+        body = (
+            b"--b\r\n"
+            b'Content-Disposition: form-data; name="upload"; filename="data.bin"\r\n'
+            b"\r\n" + content + b"\r\n--b--\r\n"
+        )
+
+        _, files = MultipartParser(BytesIO(body), "b", spool_size=1024).parse()
+
+        # noinspection PyProtectedMember
+        self.assertTrue(files["upload"].file._rolled)
+        self.assertEqual(content, files["upload"].read())
+
+    def test_max_part_size(self):
+        with self.assertRaises(PayloadTooLarge):
+            MultipartParser(BytesIO(_BODY), _BOUNDARY, max_part_size=38).parse()
+
+        _, files = MultipartParser(BytesIO(_BODY), _BOUNDARY, max_part_size=39).parse()
+        self.assertEqual(39, files["upload"].size)
+
+    def test_max_field_size(self):
+        with self.assertRaises(PayloadTooLarge):
+            MultipartParser(BytesIO(_BODY), _BOUNDARY, max_field_size=6).parse()
+
+    def test_max_parts(self):
+        with self.assertRaises(PayloadTooLarge):
+            MultipartParser(BytesIO(_BODY), _BOUNDARY, max_parts=3).parse()
+
+    def test_malformed_bodies(self):
+        for body in [
+            b"no boundary at all",
+            b"--b\r\n" b'Content-Disposition: form-data; name="a"\r\n' b"\r\n" b"truncated",
+            b"--b\r\n" b'Content-Disposition: form-data; name="a"',
+            b"--b\r\n" b"Content-Disposition: form-data\r\n" b"\r\n" b"value\r\n--b--",
+            b"--bX",
+        ]:
+            with self.assertRaises(BadRequest):
+                MultipartParser(BytesIO(body), "b").parse()
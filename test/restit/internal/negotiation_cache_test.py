@@ -0,0 +1,46 @@
+import unittest
+
+from restit.internal.negotiation_cache import NegotiationCache
+
+
+class NegotiationCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.negotiation_cache = NegotiationCache(max_size=2)
+
+    def test_get_and_put(self):
+        self.assertIsNone(self.negotiation_cache.get("key"))
+        self.negotiation_cache.put("key", "decision", self.negotiation_cache.generation)
+
+        self.assertEqual("decision", self.negotiation_cache.get("key"))
+        self.assertEqual(
+            {"hits": 1, "misses": 1, "evictions": 0, "invalidations": 0, "hit_rate": 0.5},
+            self.negotiation_cache.statistics.to_dict(),
+        )
+
+    def test_bounded(self):
+        for key in ["a", "b", "c"]:
+            self.negotiation_cache.put(key, key, self.negotiation_cache.generation)
+
+        self.assertEqual(2, len(self.negotiation_cache))
+        self.assertIsNone(self.negotiation_cache.get("a"))
+        self.assertEqual(1, self.negotiation_cache.statistics.evictions)
+
+    def test_invalidate(self):
+        self.negotiation_cache.put("key", "decision", self.negotiation_cache.generation)
+        self.negotiation_cache.invalidate()
+
+        self.assertIsNone(self.negotiation_cache.get("key"))
+        self.assertEqual(1, self.negotiation_cache.statistics.invalidations)
+
+    def test_decision_of_previous_generation_is_dropped(self):
+        generation = self.negotiation_cache.generation
+        self.negotiation_cache.invalidate()
+        self.negotiation_cache.put("key", "stale decision", generation)
+
+        self.assertIsNone(self.negotiation_cache.get("key"))
+
+    def test_disabled(self):
+        negotiation_cache = NegotiationCache(max_size=0)
+        negotiation_cache.put("key", "decision", negotiation_cache.generation)
+
+        self.assertEqual(0, len(negotiation_cache))
@@ -0,0 +1,53 @@
+import unittest
+
+from restit.exception import BadRequest, URITooLong
+from restit.internal.query_parser import QueryParser
+
+
+class QueryParserTestCase(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual({"key": "value", "key2": "value2"}, QueryParser.parse("key=value&key2=value2"))
+
+    def test_empty(self):
+        self.assertEqual({}, QueryParser.parse(""))
+        self.assertEqual({}, QueryParser.parse(None))
+        self.assertEqual({}, QueryParser.parse("&&"))
+
+    def test_percent_decoding(self):
+        self.assertEqual(
+            {"q": "a b&c", "name": "<Jürgen>", "a key": "x+y"},
+            QueryParser.parse("q=a+b%26c&name=%3CJ%C3%BCrgen%3E&a%20key=x%2By"),
+        )
+
+    def test_value_containing_equals_sign(self):
+        self.assertEqual({"filter": "a=b", "token": "abc=="}, QueryParser.parse("filter=a=b&token=abc=="))
+
+    def test_key_without_value(self):
+        self.assertEqual({"flag": "", "empty": ""}, QueryParser.parse("flag&empty="))
+
+    def test_repeated_keys(self):
+        self.assertEqual({"id": ["1", "2", "3"], "sort": "asc"}, QueryParser.parse("id=1&sort=asc&id=2&id=3"))
+
+    def test_max_parameter_count(self):
+        self.assertEqual(3, len(QueryParser.parse("a=1&b=2&c=3", max_parameter_count=3)))
+
+        with self.assertRaises(BadRequest):
+            QueryParser.parse("a=1&b=2&c=3&d=4", max_parameter_count=3)
+
+    def test_max_parameter_count_ignores_empty_pairs(self):
+        self.assertEqual(3, len(QueryParser.parse("a=1&b=2&c=3&", max_parameter_count=3)))
+        self.assertEqual(1, len(QueryParser.parse("a=1&&&", max_parameter_count=1)))
+
+        with self.assertRaises(BadRequest):
+            QueryParser.parse("a=1&&b=2", max_parameter_count=1)
+
+    def test_parse_chunks(self):
+        self.assertEqual(
+            {"id": ["1", "22"], "name": "a b", "flag": ""},
+            QueryParser.parse_chunks(iter(["i", "d=1&na", "me=a", "+b&&id=2", "2&fl", "ag"])),
+        )
+        self.assertEqual({}, QueryParser.parse_chunks(iter([])))
+
+    def test_max_length(self):
+        with self.assertRaises(URITooLong):
+            QueryParser.parse("a=" + "x" * 100, max_length=100)
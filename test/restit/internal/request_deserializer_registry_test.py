@@ -0,0 +1,66 @@
+import unittest
+from typing import List, Type, Union
+
+from restit.internal.mime_type import MIMEType
+from restit.internal.request_deserializer_registry import RequestDeserializerRegistry
+from restit.request_deserializer import RequestDeserializer
+
+
+class CountingRequestDeserializer(RequestDeserializer):
+    def __init__(self, content_type: str):
+        self.content_type = content_type
+        self.can_handle_calls = 0
+
+    def get_content_type_list(self) -> Union[List[str], None]:
+        return [self.content_type]
+
+    def get_deserialized_python_type(self) -> Type:
+        return str
+
+    def deserialize(self, request_input: bytes, encoding: str = None) -> str:
+        return f"{self.content_type}: {request_input.decode(encoding)}"
+
+    def can_handle(self, content_type: MIMEType, python_type: Type) -> bool:
+        self.can_handle_calls += 1
+        return super().can_handle(content_type, python_type)
+
+
+class RequestDeserializerRegistryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.text_deserializer = CountingRequestDeserializer("text/plain")
+        self.wildcard_deserializer = CountingRequestDeserializer("text/*")
+        self.registry = RequestDeserializerRegistry([self.text_deserializer, self.wildcard_deserializer])
+
+    def test_find_first_matching(self):
+        self.assertIs(self.text_deserializer, self.registry.find(MIMEType.from_string("text/plain"), str))
+        self.assertIs(self.wildcard_deserializer, self.registry.find(MIMEType.from_string("text/html"), str))
+        self.assertIsNone(self.registry.find(MIMEType.from_string("text/plain"), dict))
+
+    def test_lookup_is_cached_without_parameters(self):
+        self.registry.find(MIMEType.from_string("text/plain; charset=utf-8"), str)
+        self.registry.find(MIMEType.from_string("text/plain; charset=latin-1"), str)
+        self.registry.find(MIMEType.from_string("text/plain"), str)
+
+        self.assertEqual(1, self.text_deserializer.can_handle_calls)
+
+    def test_cache_is_bounded(self):
+        registry = RequestDeserializerRegistry([self.text_deserializer], max_cache_size=2)
+        for subtype in ["a", "b", "c"]:
+            registry.find(MIMEType("text", subtype), str)
+
+        self.assertEqual(2, len(registry._cache))
+
+    def test_with_request_deserializers(self):
+        html_deserializer = CountingRequestDeserializer("text/html")
+
+        registry = self.registry.with_request_deserializers([html_deserializer])
+
+        self.assertEqual((self.text_deserializer, self.wildcard_deserializer), self.registry.request_deserializers)
+        self.assertEqual(
+            (html_deserializer, self.text_deserializer, self.wildcard_deserializer), registry.request_deserializers
+        )
+        self.assertEqual("text/html: hi", registry.deserialize(b"hi", MIMEType.from_string("text/html"), str))
+
+    def test_no_request_deserializer_found(self):
+        with self.assertRaises(RequestDeserializerRegistry.NoRequestDeserializerFoundException):
+            self.registry.get(MIMEType.from_string("application/json"), str)
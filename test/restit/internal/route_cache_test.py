@@ -0,0 +1,86 @@
+import unittest
+
+from restit import Resource, Request, Response, RestItApp
+from restit.decorator import path
+from restit.internal.route_cache import LRURouteCache, ClockRouteCache
+
+
+@path("/users/:id")
+class UserResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response(request.path_parameters)
+
+
+class RouteCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.resource = UserResource()
+
+    def test_cached_path_params_are_immutable_copies(self):
+        route_cache = LRURouteCache()
+        route_cache.put("/users/1", self.resource, {"id": "1"})
+
+        cached_route = route_cache.get("/users/1")
+        with self.assertRaises(TypeError):
+            cached_route.path_params["id"] = "2"
+
+        resource, path_params = cached_route.to_tuple()
+        path_params["id"] = 1
+        self.assertIs(self.resource, resource)
+        self.assertEqual({"id": "1"}, route_cache.get("/users/1").to_tuple()[1])
+
+    def test_not_found_is_cached(self):
+        route_cache = LRURouteCache()
+        route_cache.put("/unknown", None, None)
+
+        self.assertEqual((None, None), route_cache.get("/unknown").to_tuple())
+
+    def test_lru_eviction(self):
+        route_cache = LRURouteCache(max_size=2)
+        route_cache.put("/users/1", self.resource, {"id": "1"})
+        route_cache.put("/users/2", self.resource, {"id": "2"})
+        route_cache.get("/users/1")
+        route_cache.put("/users/3", self.resource, {"id": "3"})
+
+        self.assertEqual(2, len(route_cache))
+        self.assertIsNone(route_cache.get("/users/2"))
+        self.assertIsNotNone(route_cache.get("/users/1"))
+        self.assertIsNotNone(route_cache.get("/users/3"))
+        self.assertEqual({"hits": 3, "misses": 1, "evictions": 1}, route_cache.statistics.to_dict())
+
+    def test_clock_eviction(self):
+        route_cache = ClockRouteCache(max_size=2)
+        for index in range(10):
+            route_cache.put(f"/users/{index}", self.resource, {"id": str(index)})
+
+        self.assertEqual(2, len(route_cache))
+        self.assertEqual(8, route_cache.statistics.evictions)
+        self.assertIsNotNone(route_cache.get("/users/9"))
+        self.assertIsNone(route_cache.get("/users/0"))
+
+    def test_clock_gives_referenced_routes_a_second_chance(self):
+        route_cache = ClockRouteCache(max_size=2)
+        route_cache.put("/users/1", self.resource, {"id": "1"})
+        route_cache.put("/users/2", self.resource, {"id": "2"})
+        route_cache.put("/users/3", self.resource, {"id": "3"})
+        route_cache.get("/users/3")
+        route_cache.put("/users/4", self.resource, {"id": "4"})
+
+        self.assertIsNotNone(route_cache.get("/users/3"))
+        self.assertIsNotNone(route_cache.get("/users/4"))
+
+    def test_disabled_cache(self):
+        route_cache = LRURouteCache(max_size=0)
+        route_cache.put("/users", self.resource, {})
+
+        self.assertEqual(0, len(route_cache))
+        self.assertIsNone(route_cache.get("/users"))
+
+    def test_restit_app_route_cache(self):
+        restit_app = RestItApp(resources=[self.resource], route_cache=LRURouteCache(max_size=10))
+        restit_app._init()
+
+        resource, path_params = restit_app._find_resource_for_url("/users/1")
+        path_params["id"] = 1
+        self.assertIs(self.resource, resource)
+        self.assertEqual((self.resource, {"id": "1"}), restit_app._find_resource_for_url("/users/1"))
+        self.assertEqual({"hits": 1, "misses": 1, "evictions": 0}, restit_app.route_cache.statistics.to_dict())
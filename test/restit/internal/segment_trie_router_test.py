@@ -0,0 +1,101 @@
+import unittest
+
+from restit import Resource, StaticDirectoryResource
+from restit.internal.linear_router import LinearRouter
+from restit.internal.segment_trie_router import SegmentTrieRouter
+
+
+def _create_resources(*request_mappings: str):
+    resources = []
+    for request_mapping in request_mappings:
+        resource = Resource()
+        resource.__request_mapping__ = request_mapping
+        resource.init()
+        resources.append(resource)
+
+    return Resource.sort_resources(resources)
+
+
+class SegmentTrieRouterTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.resources = _create_resources(
+            "/",
+            "/users",
+            "/users/",
+            "/users/api",
+            "/users/:id<int>",
+            "/users/:name",
+            "/users/:id/size/:id2",
+            "/users/:id/size/api",
+            "/:wuff/:id",
+            "/orders/:year<int>/:month<int>/:id",
+            "/reports/report_:year<int>.pdf",
+            "/favicon.ico",
+        )
+        self.router = SegmentTrieRouter(self.resources)
+
+    def _assert_match(self, url: str, request_mapping: str, path_params: dict):
+        resource, _path_params = self.router.find_resource(url)
+        self.assertEqual(request_mapping, resource.__request_mapping__)
+        self.assertEqual(path_params, _path_params)
+
+    def test_static_match(self):
+        self._assert_match("/", "/", {})
+        self._assert_match("/users", "/users", {})
+        self._assert_match("/users/", "/users/", {})
+        self._assert_match("/favicon.ico", "/favicon.ico", {})
+
+    def test_static_wins_over_path_parameter(self):
+        self._assert_match("/users/api", "/users/api", {})
+        self._assert_match("/users/10/size/api", "/users/:id/size/api", {"id": "10"})
+
+    def test_typed_path_parameter(self):
+        self._assert_match("/users/10", "/users/:id<int>", {"id": 10})
+        self._assert_match("/users/hans", "/users/:name", {"name": "hans"})
+        self._assert_match(
+            "/orders/2020/12/abc", "/orders/:year<int>/:month<int>/:id", {"year": 2020, "month": 12, "id": "abc"}
+        )
+        self._assert_match("/reports/report_2020.pdf", "/reports/report_:year<int>.pdf", {"year": 2020})
+
+    def test_precedence_of_sort_resources(self):
+        self._assert_match("/users/10/size/20", "/users/:id/size/:id2", {"id": "10", "id2": "20"})
+        self._assert_match("/orders/2020", "/:wuff/:id", {"wuff": "orders", "id": "2020"})
+
+    def test_not_found(self):
+        self.assertEqual((None, None), self.router.find_resource("/users/10/unknown"))
+        self.assertEqual((None, None), self.router.find_resource("/reports/report_abc.pdf"))
+        self.assertEqual((None, None), self.router.find_resource("/a/b/c/d/e/f"))
+
+    def test_regex_request_mapping(self):
+        resources = Resource.sort_resources(self.resources + [StaticDirectoryResource("/static", "/some/path")])
+        for resource in resources:
+            resource.init()
+        router = SegmentTrieRouter(resources)
+
+        resource, path_params = router.find_resource("/static/js/app.js")
+        self.assertIsInstance(resource, StaticDirectoryResource)
+        self.assertEqual({"file_name": "js/app.js"}, path_params)
+        resource, path_params = router.find_resource("/users/api")
+        self.assertEqual("/users/api", resource.__request_mapping__)
+
+    def test_same_result_as_linear_router(self):
+        linear_router = LinearRouter(self.resources)
+        urls = [
+            "/",
+            "/users",
+            "/users/",
+            "/users/api",
+            "/users/1",
+            "/users/hans",
+            "/users/1/size/2",
+            "/users/1/size/api",
+            "/users/1/size",
+            "/a/b",
+            "/orders/2020/12/1",
+            "/orders/2020/dec/1",
+            "/reports/report_2020.pdf",
+            "/favicon.ico",
+            "/not/found/at/all",
+        ]
+        for url in urls:
+            self.assertEqual(linear_router.find_resource(url), self.router.find_resource(url), url)
@@ -0,0 +1,59 @@
+import unittest
+
+from restit.internal.streaming_body import StreamingBody
+
+
+class CloseableIterable:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.is_closed = False
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+    def close(self):
+        self.is_closed = True
+
+
+class StreamingBodyTestCase(unittest.TestCase):
+    def test_bytes_and_str_chunks(self):
+        streaming_body = StreamingBody([b"1", bytearray(b"2"), memoryview(b"3"), "4"])
+
+        self.assertEqual([b"1", b"2", b"3", b"4"], list(streaming_body))
+
+    def test_serialized_chunks(self):
+        streaming_body = StreamingBody([{"a": 1}, b"raw"], serialize=lambda item: repr(item).encode())
+
+        self.assertEqual([b"{'a': 1}", b"raw"], list(streaming_body))
+
+    def test_unexpected_chunk_type(self):
+        streaming_body = StreamingBody([1])
+
+        with self.assertRaises(StreamingBody.ChunkTypeNotSupportedException):
+            next(streaming_body)
+
+    def test_close_is_passed_to_generator(self):
+        events = []
+
+        def generate():
+            try:
+                yield b"1"
+                yield b"2"
+            finally:
+                events.append("closed")
+
+        streaming_body = StreamingBody(generate())
+        self.assertEqual(b"1", next(streaming_body))
+        streaming_body.close()
+        streaming_body.close()
+
+        self.assertEqual(["closed"], events)
+        self.assertEqual([], list(streaming_body))
+
+    def test_close_is_passed_to_iterable(self):
+        iterable = CloseableIterable([b"1"])
+        streaming_body = StreamingBody(iterable)
+
+        self.assertEqual([b"1"], list(streaming_body))
+        streaming_body.close()
+        self.assertTrue(iterable.is_closed)
@@ -0,0 +1,56 @@
+import unittest
+
+from restit.internal.wsgi_headers import WsgiHeaders
+
+
+class WsgiHeadersTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.wsgi_environment = {
+            "REQUEST_METHOD": "GET",
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": "",
+            "HTTP_HOST": "localhost:8080",
+            "HTTP_X_FORWARDED_FOR": "10.0.0.1, 10.0.0.2",
+            "HTTP_IF_NONE_MATCH": '"a,b", "c"',
+        }
+        self.headers = WsgiHeaders(self.wsgi_environment)
+
+    def test_case_insensitive_lookup(self):
+        self.assertEqual("localhost:8080", self.headers["Host"])
+        self.assertEqual("localhost:8080", self.headers["host"])
+        self.assertEqual("10.0.0.1, 10.0.0.2", self.headers["X-FORWARDED-FOR"])
+        self.assertEqual("application/json", self.headers["content-type"])
+
+    def test_missing_headers(self):
+        self.assertNotIn("Content-Length", self.headers)
+        self.assertNotIn("Content-Encoding", self.headers)
+        self.assertIsNone(self.headers.get("Accept"))
+        with self.assertRaises(KeyError):
+            _ = self.headers["Accept"]
+
+    def test_reads_environment_on_lookup(self):
+        self.wsgi_environment["HTTP_ACCEPT"] = "*/*"
+
+        self.assertEqual("*/*", self.headers["Accept"])
+
+    def test_iteration(self):
+        self.assertEqual(
+            {
+                "Content-Type": "application/json",
+                "Host": "localhost:8080",
+                "X-Forwarded-For": "10.0.0.1, 10.0.0.2",
+                "If-None-Match": '"a,b", "c"',
+            },
+            dict(self.headers),
+        )
+        self.assertEqual(4, len(self.headers))
+
+    def test_get_all(self):
+        self.assertEqual(["10.0.0.1", "10.0.0.2"], self.headers.get_all("X-Forwarded-For"))
+        self.assertEqual(['"a,b"', '"c"'], self.headers.get_all("If-None-Match"))
+        self.assertEqual(["localhost:8080"], self.headers.get_all("Host"))
+        self.assertEqual([], self.headers.get_all("Accept"))
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            self.headers["Host"] = "example.com"
@@ -0,0 +1,31 @@
+import unittest
+
+from restit import Request, Resource, Response, RestItTestApp
+from restit.decorator import path, max_body_size
+
+
+@path("/upload")
+class UploadResource(Resource):
+    @max_body_size(20)
+    def post(self, request: Request) -> Response:
+        return Response(str(sum(len(chunk) for chunk in request.iter_body(4))))
+
+    def put(self, request: Request) -> Response:
+        return Response(str(len(request.body)))
+
+
+class MaxBodySizeTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.restit_test_app = RestItTestApp(resources=[UploadResource()], max_request_body_size=10)
+
+    def test_app_wide_max_body_size(self):
+        self.assertEqual("10", self.restit_test_app.put("/upload", data=b"x" * 10).text)
+
+        response = self.restit_test_app.put("/upload", data=b"x" * 11)
+        self.assertEqual(413, response.status_code)
+
+    def test_max_body_size_decorator(self):
+        self.assertEqual("20", self.restit_test_app.post("/upload", data=b"x" * 20).text)
+
+        response = self.restit_test_app.post("/upload", data=b"x" * 21)
+        self.assertEqual(413, response.status_code)
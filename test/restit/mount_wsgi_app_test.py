@@ -0,0 +1,72 @@
+import unittest
+from wsgiref.util import setup_testing_defaults
+
+from restit import Resource, Request, Response, RestItApp
+from restit.decorator import path
+from restit.exception import PathIsNotStartingWithSlashException
+
+
+@path("/legacy/:id")
+class ShadowedResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response("resource")
+
+
+@path("/legacyx")
+class NotShadowedResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response("resource")
+
+
+class MountWsgiAppTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.wsgi_environments = []
+        self.restit_app = RestItApp(resources=[ShadowedResource(), NotShadowedResource()])
+        self.restit_app.mount_wsgi_app("/legacy/", self._legacy_wsgi_app)
+
+    def _legacy_wsgi_app(self, wsgi_environ: dict, start_response):
+        self.wsgi_environments.append(dict(wsgi_environ))
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        yield b"legacy"
+
+    def _call(self, path_info: str):
+        wsgi_environ = {"PATH_INFO": path_info, "QUERY_STRING": ""}
+        setup_testing_defaults(wsgi_environ)
+        start_response_calls = []
+        body = self.restit_app(wsgi_environ, lambda status, headers: start_response_calls.append(status))
+        return body, start_response_calls
+
+    def test_delegates_requests_below_path(self):
+        body, start_response_calls = self._call("/legacy/users/1")
+
+        self.assertEqual([], start_response_calls)
+        self.assertEqual([], self.wsgi_environments)
+        self.assertEqual(b"legacy", b"".join(body))
+        self.assertEqual(["200 OK"], start_response_calls)
+        self.assertEqual("/legacy", self.wsgi_environments[0]["SCRIPT_NAME"])
+        self.assertEqual("/users/1", self.wsgi_environments[0]["PATH_INFO"])
+
+    def test_delegates_path_itself(self):
+        body, _ = self._call("/legacy")
+
+        self.assertEqual(b"legacy", b"".join(body))
+        self.assertEqual("/legacy", self.wsgi_environments[0]["SCRIPT_NAME"])
+        self.assertEqual("", self.wsgi_environments[0]["PATH_INFO"])
+
+    def test_does_not_delegate_other_paths(self):
+        body, start_response_calls = self._call("/legacyx")
+
+        self.assertEqual([b"resource"], body)
+        self.assertEqual(["200 OK"], start_response_calls)
+        self.assertEqual([], self.wsgi_environments)
+
+    def test_mount_at_runtime(self):
+        self._call("/legacyx")
+        self.restit_app.mount_wsgi_app("/legacyx", self._legacy_wsgi_app)
+
+        body, _ = self._call("/legacyx")
+        self.assertEqual(b"legacy", b"".join(body))
+
+    def test_path_not_starting_with_slash(self):
+        with self.assertRaises(PathIsNotStartingWithSlashException):
+            self.restit_app.mount_wsgi_app("legacy", self._legacy_wsgi_app)
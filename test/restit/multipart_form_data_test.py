@@ -0,0 +1,115 @@
+import io
+import unittest
+from wsgiref.util import setup_testing_defaults
+
+from marshmallow import Schema, fields
+
+from restit import Request, Resource, Response, RestItApp, RestItTestApp, StreamingResponse
+from restit.decorator import path, request_body
+
+_HEADERS = {"Content-Type": "multipart/form-data; boundary=XyZ"}
+
+_BODY = (
+    b"--XyZ\r\n"
+    b'Content-Disposition: form-data; name="title"\r\n'
+    b"\r\n"
+    b"Hello\r\n"
+    b"--XyZ\r\n"
+    b'Content-Disposition: form-data; name="upload"; filename="hello.txt"\r\n'
+    b"Content-Type: text/plain\r\n"
+    b"\r\n"
+    b"hello world\r\n"
+    b"--XyZ--\r\n"
+)
+
+
+class UploadSchema(Schema):
+    title = fields.String(required=True)
+    upload = fields.Raw(required=True)
+
+
+@path("/upload")
+class UploadResource(Resource):
+    def post(self, request: Request) -> Response:
+        upload = request.files["upload"]
+        return Response(
+            {
+                "title": request.form_fields["title"],
+                "filename": upload.filename,
+                "content": upload.read().decode(),
+                "is_body_streamed": request._body_file is None,
+            }
+        )
+
+    @request_body({"multipart/form-data": UploadSchema()}, "The upload")
+    def put(self, request: Request) -> Response:
+        return Response({"title": request.deserialized_body["title"], "size": request.deserialized_body["upload"].size})
+
+
+@path("/echo")
+class EchoUploadResource(Resource):
+    def post(self, request: Request) -> StreamingResponse:
+        upload = request.files["upload"]
+        return StreamingResponse(iter(lambda: upload.read(4), b""))
+
+
+class MultipartFormDataTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.restit_test_app = RestItTestApp(resources=[UploadResource()])
+
+    def test_form_fields_and_files(self):
+        response = self.restit_test_app.post("/upload", data=_BODY, headers=_HEADERS)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            {"title": "Hello", "filename": "hello.txt", "content": "hello world", "is_body_streamed": True},
+            response.json(),
+        )
+
+    def test_request_body_schema(self):
+        response = self.restit_test_app.put("/upload", data=_BODY, headers=_HEADERS)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"title": "Hello", "size": 11}, response.json())
+
+    def test_missing_boundary(self):
+        response = self.restit_test_app.post("/upload", data=_BODY, headers={"Content-Type": "multipart/form-data"})
+
+        self.assertEqual(400, response.status_code)
+
+    def test_max_part_size(self):
+        Request.multipart_max_part_size = 10
+        try:
+            response = self.restit_test_app.post("/upload", data=_BODY, headers=_HEADERS)
+        finally:
+            Request.multipart_max_part_size = None
+
+        self.assertEqual(413, response.status_code)
+
+    def test_no_form_data(self):
+        request = Request({"CONTENT_TYPE": "application/json"}, {})
+
+        self.assertEqual({}, request.form_fields)
+        self.assertEqual({}, request.files)
+
+    def test_uploaded_file_is_streamed_back(self):
+        wsgi_environ = {
+            "REQUEST_METHOD": "POST",
+            "PATH_INFO": "/echo",
+            "CONTENT_TYPE": _HEADERS["Content-Type"],
+            "CONTENT_LENGTH": str(len(_BODY)),
+            "wsgi.input": io.BytesIO(_BODY),
+        }
+        setup_testing_defaults(wsgi_environ)
+        start_response_arguments = []
+        restit_app = RestItApp(resources=[EchoUploadResource()])
+
+        body = restit_app(wsgi_environ, lambda status, headers: start_response_arguments.extend([status, headers]))
+        try:
+            # the server iterates the body after the application has returned
+            content = b"".join(body)
+        finally:
+            body.close()
+
+        self.assertEqual("200 OK", start_response_arguments[0])
+        self.assertEqual(b"hello world", content)
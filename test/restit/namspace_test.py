@@ -5,9 +5,11 @@ import requests
 from restit._response import Response
 from restit.decorator import path
 from restit.namespace import Namespace
+from restit.open_api import OpenApiDocumentation, InfoObject
 from restit.request import Request
 from restit.resource import Resource
 from restit.restit_app import RestItApp
+from restit.restit_test_app import RestItTestApp
 from test.start_server_with_wsgi_app import start_server_with_wsgi_app
 
 
@@ -23,6 +25,18 @@ class MyResource2(Resource):
         return Response("Hallo from subpath 2")
 
 
+@path("/users/:id")
+class UserResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response(request.path_parameters)
+
+
+@path("/:wildcard/subpath")
+class RootResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response("root")
+
+
 class NamespaceTestCase(unittest.TestCase):
     def test_something(self):
         namespace = Namespace("/huhu", resources=[MyResource()])
@@ -37,3 +51,55 @@ class NamespaceTestCase(unittest.TestCase):
             response = requests.get(f"http://127.0.0.1:{port}/huhu/subpath2")
             self.assertEqual(200, response.status_code)
             self.assertEqual("Hallo from subpath 2", response.text)
+
+    def test_mount_resource_under_multiple_prefixes(self):
+        user_resource = UserResource()
+        restit_app = RestItApp(
+            resources=[RootResource()],
+            namespaces=[Namespace("/api/v1", [user_resource]), Namespace("/api/v2/", [user_resource, MyResource()])],
+        )
+        restit_test_app = RestItTestApp.from_restit_app(restit_app)
+
+        self.assertEqual("/users/:id", user_resource.__request_mapping__)
+        self.assertEqual({"id": "1"}, restit_test_app.get("/api/v1/users/1").json())
+        self.assertEqual({"id": "2"}, restit_test_app.get("/api/v2/users/2").json())
+        self.assertEqual(404, restit_test_app.get("/api/v3/users/2").status_code)
+        self.assertEqual(404, restit_test_app.get("/api/v1x/users/2").status_code)
+        self.assertEqual("Hallo", restit_test_app.get("/api/v2/subpath").text)
+        self.assertEqual("root", restit_test_app.get("/api/subpath").text)
+        self.assertEqual(404, restit_test_app.get("/api/v1/subpath").status_code)
+
+    def test_open_api_paths_contain_prefix(self):
+        open_api_documentation = OpenApiDocumentation(InfoObject("Title", "Description", "1.0.0"))
+        user_resource = UserResource()
+        restit_app = RestItApp(
+            namespaces=[Namespace("/v1", [user_resource]), Namespace("/v2", [user_resource])],
+            open_api_documentation=open_api_documentation,
+        )
+        restit_app._init()
+
+        self.assertEqual(["/v1/users/{id}", "/v2/users/{id}"], list(open_api_documentation.generate_spec()["paths"]))
+
+    def test_path_parameter_in_path(self):
+        user_resource = UserResource()
+        namespace = Namespace("/tenants/:tenant", [user_resource])
+        self.assertFalse(namespace.is_mounted)
+        restit_app = RestItApp(resources=[MyResource()], namespaces=[namespace])
+        restit_test_app = RestItTestApp.from_restit_app(restit_app)
+
+        self.assertEqual({"tenant": "acme", "id": "1"}, restit_test_app.get("/tenants/acme/users/1").json())
+        self.assertEqual("/tenants/:tenant/users/:id", user_resource.__request_mapping__)
+        self.assertEqual(404, restit_test_app.get("/users/1").status_code)
+        self.assertEqual("Hallo", restit_test_app.get("/subpath").text)
+
+    def test_get_adapted_resources_is_deprecated(self):
+        user_resource = UserResource()
+        namespace = Namespace("/api", [user_resource])
+
+        with self.assertWarns(DeprecationWarning):
+            adapted_resources = namespace.get_adapted_resources()
+
+        self.assertEqual([user_resource], adapted_resources)
+        self.assertEqual("/api/users/:id", user_resource.__request_mapping__)
+        restit_test_app = RestItTestApp(resources=adapted_resources)
+        self.assertEqual({"id": "1"}, restit_test_app.get("/api/users/1").json())
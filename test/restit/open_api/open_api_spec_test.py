@@ -239,3 +239,13 @@ class OpenApiSpecTestCase(unittest.TestCase):
 
             response = requests.get(f"http://127.0.0.1:{port}/api/swagger.json")
             self.assertEqual(200, response.status_code)
+
+    def test_generate_spec_after_register_resource(self):
+        open_api_dict = self.open_api_documentation.generate_spec()
+        self.assertIs(open_api_dict, self.open_api_documentation.generate_spec())
+
+        self.open_api_documentation.register_resource(FirstResource(), "/v2")
+
+        self.assertEqual(
+            ["/path", "/path/{id}/wuff/{id2}", "/v2/path"], list(self.open_api_documentation.generate_spec()["paths"])
+        )
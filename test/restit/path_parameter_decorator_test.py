@@ -49,11 +49,11 @@ class PathParameterTestCase(unittest.TestCase):
             "<h1>Bad Request</h1>\n"
             "<p>Path parameter value 'hans' is not matching "
             "'PathParameter(name='id2', description='Second path parameter', "
-            "field_type=<fields.Float(dump_default=<marshmallow.missing>, attribute=None, validate=None, "
-            "required=False, load_only=False, dump_only=False, load_default=<marshmallow.missing>, "
+            "field_type=&lt;fields.Float(dump_default=&lt;marshmallow.missing&gt;, attribute=None, validate=None, "
+            "required=False, load_only=False, dump_only=False, load_default=&lt;marshmallow.missing&gt;, "
             "allow_none=False, error_messages={'required': 'Missing data for required field.', 'null': "
             "'Field may not be null.', 'validator_failed': 'Invalid value.', 'invalid': 'Not a valid number.', "
             "'too_large': 'Number too large.', "
-            "'special': 'Special numeric values (nan or infinity) are not permitted.'})>)' (Not a valid number.)</p>\n",
+            "'special': 'Special numeric values (nan or infinity) are not permitted.'})&gt;)' (Not a valid number.)</p>\n",
             response.text,
         )
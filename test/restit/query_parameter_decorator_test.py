@@ -36,9 +36,19 @@ class QueryParameterListResource(Resource):
         return Response(request.query_parameters)
 
 
+@path("/3")
+class RequiredQueryParameterResource(Resource):
+    @query_parameter("name", description="A name", field_type=fields.String(required=True))
+    @query_parameter("limit", description="A limit", field_type=fields.Integer())
+    def get(self, request: Request) -> Response:
+        return Response(request.query_parameters)
+
+
 class QueryParameterTest(unittest.TestCase):
     def setUp(self) -> None:
-        restit_app = RestItApp(resources=[QueryParametersResource(), QueryParameterListResource()])
+        restit_app = RestItApp(
+            resources=[QueryParametersResource(), QueryParameterListResource(), RequiredQueryParameterResource()]
+        )
         self.restit_test_app = RestItTestApp.from_restit_app(restit_app)
 
     def test_query_parameter(self):
@@ -54,6 +64,50 @@ class QueryParameterTest(unittest.TestCase):
         self.assertEqual(200, response.status_code)
         self.assertEqual({"int_list": [1, 2, 3, 4]}, response.json())
 
+    def test_query_parameter_repeated_keys_list(self):
+        response = self.restit_test_app.get("/2?int_list=1&int_list=2&int_list=3")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"int_list": [1, 2, 3]}, response.json())
+
+    def test_query_parameter_single_value_list(self):
+        response = self.restit_test_app.get("/2?int_list=1")
+        self.assertEqual({"int_list": [1]}, response.json())
+
+        response = self.restit_test_app.get("/2?int_list=[]")
+        self.assertEqual({"int_list": []}, response.json())
+
+    def test_query_parameter_list_is_not_evaluated(self):
+        response = self.restit_test_app.get("/2?int_list=[__import__('os').getcwd()]")
+        self.assertEqual(400, response.status_code)
+
+    def test_query_parameter_percent_decoded(self):
+        response = self.restit_test_app.get("/3?name=J%C3%BCrgen+M&limit=2&limit=5")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"name": "Jürgen M", "limit": 5}, response.json())
+
+    def test_query_parameter_required(self):
+        response = self.restit_test_app.get("/3?limit=2")
+        self.assertEqual(400, response.status_code)
+        self.assertIn("Query parameter 'name' is required", response.text)
+
+    def test_query_parameter_invalid_value(self):
+        response = self.restit_test_app.get("/3?name=x&limit=many")
+        self.assertEqual(400, response.status_code)
+
+    def test_invalid_value_is_escaped_in_html_error(self):
+        for debug in [False, True]:
+            with self.subTest(debug=debug):
+                restit_test_app = RestItTestApp(resources=[RequiredQueryParameterResource()], debug=debug)
+
+                response = restit_test_app.get(
+                    "/3?name=x&limit=%3Cscript%3Ealert(1)%3C/script%3E", headers={"Accept": "text/html"}
+                )
+
+                self.assertEqual(400, response.status_code)
+                self.assertIn("text/html", response.headers["Content-Type"])
+                self.assertNotIn("<script>", response.text)
+                self.assertIn("&lt;script&gt;", response.text)
+
     def test_unsupported_query_field_type(self):
         with self.assertRaises(QueryParameter.UnsupportedQueryFieldTypeException):
 
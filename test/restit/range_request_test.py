@@ -0,0 +1,110 @@
+import os
+import re
+import tempfile
+import unittest
+from email.utils import formatdate
+
+from restit import RestItTestApp, StaticDirectoryResource
+from restit.internal.file_range_body import FileRangeBody
+from restit.static_file_response import StaticFileResponse
+
+_CONTENT = bytes(range(256)) * 1024
+
+
+class RangeRequestTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temporary_directory.name, "archive.gz")
+        with open(self.file_path, "wb") as fp:
+            fp.write(_CONTENT)
+        os.utime(self.file_path, (1000000000, 1000000000))
+        self.rest_test_app = RestItTestApp(
+            resources=[StaticDirectoryResource("/static", self.temporary_directory.name)]
+        )
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_whole_file_advertises_ranges(self):
+        response = self.rest_test_app.get("/static/archive.gz")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("bytes", response.headers["Accept-Ranges"])
+        self.assertEqual(formatdate(1000000000, usegmt=True), response.headers["Last-Modified"])
+        self.assertEqual(_CONTENT, response.content)
+
+    def test_single_range(self):
+        response = self.rest_test_app.get("/static/archive.gz", headers={"Range": "bytes=100-199"})
+
+        self.assertEqual(206, response.status_code)
+        self.assertEqual("bytes 100-199/262144", response.headers["Content-Range"])
+        self.assertEqual(100, response.headers["Content-Length"])
+        self.assertEqual("application/gzip", response.headers["Content-Type"])
+        self.assertEqual(_CONTENT[100:200], response.content)
+
+    def test_suffix_range(self):
+        response = self.rest_test_app.get("/static/archive.gz", headers={"Range": "bytes=-10"})
+
+        self.assertEqual(206, response.status_code)
+        self.assertEqual("bytes 262134-262143/262144", response.headers["Content-Range"])
+        self.assertEqual(_CONTENT[-10:], response.content)
+
+    def test_multiple_ranges(self):
+        response = self.rest_test_app.get("/static/archive.gz", headers={"Range": "bytes=0-9, 200000-200099"})
+
+        self.assertEqual(206, response.status_code)
+        self.assertNotIn("Content-Range", response.headers)
+        boundary = re.match(r"multipart/byteranges; boundary=(\w+)$", response.headers["Content-Type"]).group(1)
+        self.assertEqual(len(response.content), response.headers["Content-Length"])
+        self.assertEqual(
+            (
+                f"--{boundary}\r\nContent-Type: application/gzip\r\nContent-Range: bytes 0-9/262144\r\n\r\n".encode()
+                + _CONTENT[:10]
+                + f"\r\n--{boundary}\r\nContent-Type: application/gzip\r\n".encode()
+                + b"Content-Range: bytes 200000-200099/262144\r\n\r\n"
+                + _CONTENT[200000:200100]
+                + f"\r\n--{boundary}--\r\n".encode()
+            ),
+            response.content,
+        )
+
+    def test_range_not_satisfiable(self):
+        response = self.rest_test_app.get("/static/archive.gz", headers={"Range": "bytes=262144-"})
+
+        self.assertEqual(416, response.status_code)
+        self.assertEqual("bytes */262144", response.headers["Content-Range"])
+
+    def test_invalid_range_is_ignored(self):
+        response = self.rest_test_app.get("/static/archive.gz", headers={"Range": "bytes=10-5"})
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(_CONTENT, response.content)
+
+    def test_if_range(self):
+        headers = {"Range": "bytes=0-9", "If-Range": formatdate(1000000000, usegmt=True)}
+        response = self.rest_test_app.get("/static/archive.gz", headers=headers)
+        self.assertEqual(206, response.status_code)
+        self.assertEqual(_CONTENT[:10], response.content)
+
+        for if_range in [formatdate(1000000001, usegmt=True), '"some-etag"', "no date"]:
+            headers["If-Range"] = if_range
+            response = self.rest_test_app.get("/static/archive.gz", headers=headers)
+            self.assertEqual(200, response.status_code, if_range)
+            self.assertEqual(_CONTENT, response.content)
+
+    def test_ranges_are_read_in_blocks(self):
+        reads = []
+
+        class RecordingFileRangeBody(FileRangeBody):
+            def _read(self, position: int, size: int) -> bytes:
+                reads.append((position, size))
+                return super()._read(position, size)
+
+        with open(self.file_path, "rb") as file:
+            body = RecordingFileRangeBody(file, [(b"--", 1000, 200999)], b"--", StaticFileResponse.BLOCK_SIZE)
+            chunks = list(body)
+            body.close()
+
+        self.assertEqual(_CONTENT[1000:201000], b"".join(chunks[1:-1]))
+        self.assertEqual([(1000, 65536), (66536, 65536), (132072, 65536), (197608, 3392)], reads)
+        self.assertTrue(file.closed)
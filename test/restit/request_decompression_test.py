@@ -0,0 +1,76 @@
+import gzip
+import json
+import os
+import unittest
+import zlib
+
+from restit import Request, Resource, Response, RestItTestApp
+from restit.decorator import path
+
+_BODY = json.dumps({"key": "value", "list": list(range(1000))}).encode()
+
+
+@path("/echo")
+class EchoResource(Resource):
+    def post(self, request: Request) -> Response:
+        return Response({"body": request.typed_body[dict], "content_encoding": request.content_encoding})
+
+
+class RequestDecompressionTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.restit_test_app = RestItTestApp(resources=[EchoResource()], max_request_body_size=64 * 1024)
+
+    def _post(self, data: bytes, content_encoding: str):
+        return self.restit_test_app.post(
+            "/echo", data=data, headers={"Content-Type": "application/json", "Content-Encoding": content_encoding}
+        )
+
+    def test_gzip_json(self):
+        response = self._post(gzip.compress(_BODY), "gzip")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({"body": json.loads(_BODY), "content_encoding": "gzip"}, response.json())
+
+    def test_multiple_encodings(self):
+        response = self._post(zlib.compress(gzip.compress(_BODY)), "gzip, deflate")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(json.loads(_BODY), response.json()["body"])
+
+    def test_identity(self):
+        response = self._post(_BODY, "identity")
+
+        self.assertEqual(json.loads(_BODY), response.json()["body"])
+
+    def test_decompressed_body_exceeds_max_body_size(self):
+        body = json.dumps({"key": "x" * (128 * 1024)}).encode()
+
+        response = self._post(gzip.compress(body), "gzip")
+
+        self.assertEqual(413, response.status_code)
+
+    def test_decompressed_body_is_limited_by_default(self):
+        restit_test_app = RestItTestApp(resources=[EchoResource()])
+        # random bytes hardly compress, so the size limit is hit and not the compression ratio limit
+        body = (os.urandom(64 * 1024) * (Request.max_decompressed_body_size // (64 * 1024) + 1))[
+            : Request.max_decompressed_body_size + 1
+        ]
+
+        response = restit_test_app.post(
+            "/echo",
+            data=gzip.compress(body, compresslevel=1),
+            headers={"Content-Type": "application/octet-stream", "Content-Encoding": "gzip"},
+        )
+
+        self.assertEqual(413, response.status_code)
+        self.assertIn("maximum size", response.text)
+
+    def test_unsupported_encoding(self):
+        response = self._post(_BODY, "br")
+
+        self.assertEqual(415, response.status_code)
+
+    def test_invalid_body(self):
+        response = self._post(_BODY, "gzip")
+
+        self.assertEqual(400, response.status_code)
@@ -1,13 +1,43 @@
+import io
 import json
 import unittest
 from datetime import datetime
 from typing import Union, List, Type
 
+from restit import Request, Resource, Response, RestItApp, RestItTestApp
+from restit.decorator import path
 from restit.internal.mime_type import MIMEType
 from restit.internal.request_deserializer_service import RequestDeserializerService
 from restit.request_deserializer import RequestDeserializer
 
 
+class ReversedStrRequestDeserializer(RequestDeserializer):
+    def get_content_type_list(self) -> Union[List[str], None]:
+        return ["whats/up"]
+
+    def get_deserialized_python_type(self) -> Type:
+        return str
+
+    def deserialize(self, request_input: bytes, encoding: str = None) -> str:
+        return "".join(reversed(request_input.decode()))
+
+
+class ReadSizeRecordingFile(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.read_sizes = []
+
+    def read(self, size: int = -1) -> bytes:
+        self.read_sizes.append(size)
+        return super().read(size)
+
+
+@path("/str")
+class StrBodyResource(Resource):
+    def post(self, request: Request) -> Response:
+        return Response(request.typed_body[str])
+
+
 class RequestDeserializerTestCase(unittest.TestCase):
     def tearDown(self) -> None:
         RequestDeserializerService.clear_all_request_deserializers()
@@ -31,6 +61,27 @@ class RequestDeserializerTestCase(unittest.TestCase):
 
         self.assertEqual({"key": "value", "key2": "value"}, json_dict)
 
+    def test_large_bodies_are_read_in_chunks(self):
+        items = {f"key{index}": "välue" * 10 for index in range((Request.body_spool_size // 60) + 1)}
+        json_bytes = json.dumps(items, ensure_ascii=False).encode()
+        form_bytes = "&".join(f"{key}={value}" for key, value in items.items()).encode()
+        self.assertGreater(len(form_bytes), Request.body_spool_size)
+
+        for content_type, body in [
+            ("application/json", json_bytes),
+            ("whats/up", json_bytes),
+            ("application/x-www-form-urlencoded", form_bytes),
+        ]:
+            with self.subTest(content_type):
+                body_file = ReadSizeRecordingFile(body)
+
+                deserialized_body = RequestDeserializerService.get_registry().deserialize_file(
+                    body_file, MIMEType.from_string(content_type), dict
+                )
+
+                self.assertEqual(items, deserialized_body)
+                self.assertTrue(all(0 < size <= RequestDeserializer.CHUNK_SIZE for size in body_file.read_sizes))
+
     def test_request_deserializer_content_type_fallback(self):
         json_bytes = json.dumps({"key": "value"}).encode()
         with self.assertLogs(level="WARNING") as log:
@@ -83,3 +134,31 @@ class RequestDeserializerTestCase(unittest.TestCase):
             request_deserializer.get_deserialized_python_type()
         with self.assertRaises(NotImplementedError):
             request_deserializer.deserialize(b"", "")
+
+    def test_request_deserializer_per_app(self):
+        restit_test_app = RestItTestApp(
+            resources=[StrBodyResource()], request_deserializers=[ReversedStrRequestDeserializer()]
+        )
+        other_restit_test_app = RestItTestApp(resources=[StrBodyResource()])
+
+        response = restit_test_app.post("/str", data=b"hello", headers={"Content-Type": "whats/up"})
+        self.assertEqual("olleh", response.text)
+
+        response = other_restit_test_app.post("/str", data=b"hello", headers={"Content-Type": "whats/up"})
+        self.assertEqual(500, response.status_code)
+
+    def test_app_takes_snapshot_of_process_wide_deserializers(self):
+        restit_test_app = RestItTestApp(resources=[StrBodyResource()])
+        RequestDeserializerService.register_request_deserializer(ReversedStrRequestDeserializer())
+
+        response = restit_test_app.post("/str", data=b"hello", headers={"Content-Type": "whats/up"})
+        self.assertEqual(500, response.status_code)
+
+    def test_register_request_deserializer_after_init(self):
+        restit_app = RestItApp(resources=[StrBodyResource()])
+        restit_app.register_request_deserializer(ReversedStrRequestDeserializer())
+        self.assertIsInstance(restit_app.request_deserializers[0], ReversedStrRequestDeserializer)
+
+        restit_app._init()
+        with self.assertRaises(RestItApp.RequestDeserializerRegistrationAfterInitException):
+            restit_app.register_request_deserializer(ReversedStrRequestDeserializer())
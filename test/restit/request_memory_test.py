@@ -0,0 +1,61 @@
+import gc
+import os
+import sys
+import unittest
+import weakref
+from io import BytesIO
+from wsgiref.util import setup_testing_defaults
+
+from restit import Request, Resource, Response, RestItApp
+from restit.decorator import path
+
+_REQUEST_COUNT = 10000
+_BODY = b"x" * (256 * 1024)
+
+_requests = weakref.WeakSet()
+
+
+@path("/upload")
+class UploadResource(Resource):
+    def post(self, request: Request) -> Response:
+        _requests.add(request)
+        return Response(f"{len(request.body)} {request.host}")
+
+
+def _get_rss() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "RSS is read from /proc")
+class RequestMemoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.restit_app = RestItApp(resources=[UploadResource()])
+
+    def _post(self):
+        wsgi_environ = {
+            "REQUEST_METHOD": "POST",
+            "PATH_INFO": "/upload",
+            "QUERY_STRING": "",
+            "CONTENT_TYPE": "application/octet-stream",
+            "CONTENT_LENGTH": str(len(_BODY)),
+            # a copy per request, reading a BytesIO might return the very bytes object it was created with
+            "wsgi.input": BytesIO(bytes(bytearray(_BODY))),
+        }
+        setup_testing_defaults(wsgi_environ)
+        body = self.restit_app(wsgi_environ, lambda status, headers: None)
+        self.assertEqual([f"{len(_BODY)} http://127.0.0.1".encode()], body)
+
+    def test_requests_with_large_bodies_are_not_retained(self):
+        for _ in range(10):
+            self._post()
+        gc.collect()
+        rss_before = _get_rss()
+
+        for _ in range(_REQUEST_COUNT):
+            self._post()
+        gc.collect()
+
+        self.assertEqual(0, len(_requests))
+        # retaining only the last 128 requests, like a global lru_cache does, would add 32 MiB of bodies
+        self.assertLess(_get_rss() - rss_before, 16 * 1024 * 1024)
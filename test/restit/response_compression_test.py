@@ -0,0 +1,211 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+import zlib
+from wsgiref.util import setup_testing_defaults
+
+from restit import (
+    Request,
+    Resource,
+    Response,
+    ResponseCompression,
+    RestItApp,
+    RestItTestApp,
+    StaticDirectoryResource,
+    StreamingResponse,
+)
+from restit.decorator import conditional_request, path
+
+_ITEMS = [{"id": index, "name": f"item {index}"} for index in range(200)]
+_SCRIPT = b"function swaggerUi() { return 'bundle'; }\n" * 1000
+
+
+@path("/items")
+class ItemsResource(Resource):
+    @conditional_request()
+    def get(self, request: Request) -> Response:
+        return Response({"items": _ITEMS})
+
+
+@path("/small")
+class SmallResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response({"id": 1})
+
+
+@path("/image")
+class ImageResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response(bytes(4096), headers={"Content-Type": "image/png", "Vary": "Origin"})
+
+
+@path("/export")
+class ExportResource(Resource):
+    def get(self, request: Request) -> StreamingResponse:
+        return StreamingResponse((item for item in _ITEMS), item_type=dict)
+
+
+class ResponseCompressionTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory_path = self.temporary_directory.name
+        self._write_file("bundle.js", _SCRIPT)
+        self._write_file("large.js", _SCRIPT * 3)
+        self.response_compression = ResponseCompression(max_cached_file_size=len(_SCRIPT))
+        self.resources = [
+            ItemsResource(),
+            SmallResource(),
+            ImageResource(),
+            ExportResource(),
+            StaticDirectoryResource("/static", self.directory_path),
+        ]
+        self.rest_test_app = RestItTestApp(resources=self.resources, response_compression=self.response_compression)
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def _write_file(self, file_name: str, content: bytes) -> str:
+        file_path = os.path.join(self.directory_path, file_name)
+        with open(file_path, "wb") as fp:
+            fp.write(content)
+        return file_path
+
+    def test_gzip(self):
+        response = self.rest_test_app.get("/items", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual("gzip", response.headers["Content-Encoding"])
+        self.assertEqual("Accept-Encoding", response.headers["Vary"])
+        self.assertEqual(len(response.content), response.headers["Content-Length"])
+        self.assertEqual({"items": _ITEMS}, json.loads(gzip.decompress(response.content)))
+
+    def test_deflate(self):
+        response = self.rest_test_app.get("/items", headers={"Accept-Encoding": "gzip;q=0.5, deflate"})
+
+        self.assertEqual("deflate", response.headers["Content-Encoding"])
+        self.assertIn(b'"name": "item 199"', zlib.decompress(response.content))
+
+    def test_identity(self):
+        for accept_encoding in ["identity", "gzip;q=0", ""]:
+            response = self.rest_test_app.get("/items", headers={"Accept-Encoding": accept_encoding})
+            self.assertIsNone(response.headers["Content-Encoding"], accept_encoding)
+            self.assertEqual("Accept-Encoding", response.headers["Vary"])
+            self.assertEqual({"items": _ITEMS}, response.json())
+
+    def test_small_bodies_are_not_compressed(self):
+        response = self.rest_test_app.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        self.assertIsNone(response.headers["Content-Encoding"])
+        self.assertEqual("Accept-Encoding", response.headers["Vary"])
+        self.assertEqual({"id": 1}, response.json())
+
+    def test_content_type_allowlist(self):
+        response = self.rest_test_app.get("/image", headers={"Accept-Encoding": "gzip"})
+
+        self.assertIsNone(response.headers["Content-Encoding"])
+        self.assertEqual("Origin", response.headers["Vary"])
+        self.assertEqual(bytes(4096), response.content)
+
+    def test_entity_tag_is_weak_and_still_revalidates(self):
+        response = self.rest_test_app.get("/items", headers={"Accept-Encoding": "gzip"})
+        entity_tag = response.headers["ETag"]
+        self.assertTrue(entity_tag.startswith('W/"'))
+
+        response = self.rest_test_app.get("/items", headers={"Accept-Encoding": "gzip", "If-None-Match": entity_tag})
+        self.assertEqual(304, response.status_code)
+        self.assertEqual("Accept-Encoding", response.headers["Vary"])
+
+    def test_not_modified_response_has_the_entity_tag_of_the_compressed_response(self):
+        response = self.rest_test_app.get("/items", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual("gzip", response.headers["Content-Encoding"])
+        entity_tag = response.headers["ETag"]
+
+        response = self.rest_test_app.get(
+            "/items", headers={"Accept-Encoding": "gzip", "If-None-Match": entity_tag[2:]}
+        )
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(entity_tag, response.headers["ETag"])
+
+        response = self.rest_test_app.get(
+            "/items", headers={"Accept-Encoding": "identity", "If-None-Match": entity_tag}
+        )
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(entity_tag[2:], response.headers["ETag"])
+
+    def test_streaming_response(self):
+        wsgi_environ = {"REQUEST_METHOD": "GET", "PATH_INFO": "/export", "HTTP_ACCEPT_ENCODING": "gzip"}
+        setup_testing_defaults(wsgi_environ)
+        start_response_arguments = []
+        restit_app = RestItApp(resources=self.resources, response_compression=self.response_compression)
+
+        body = restit_app(wsgi_environ, lambda status, headers: start_response_arguments.extend([status, headers]))
+        headers = dict(start_response_arguments[1])
+        content = b"".join(body)
+        body.close()
+
+        self.assertEqual("gzip", headers["Content-Encoding"])
+        self.assertEqual("Accept-Encoding", headers["Vary"])
+        self.assertNotIn("Content-Length", headers)
+        self.assertEqual(
+            b"".join(b'{"id": %d, "name": "item %d"}\n' % (i, i) for i in range(200)), gzip.decompress(content)
+        )
+
+    def test_wsgi_headers_without_none_values(self):
+        wsgi_environ = {"REQUEST_METHOD": "GET", "PATH_INFO": "/small", "HTTP_ACCEPT_ENCODING": "gzip"}
+        setup_testing_defaults(wsgi_environ)
+        start_response_arguments = []
+
+        RestItApp(resources=self.resources)(
+            wsgi_environ, lambda status, headers: start_response_arguments.extend([status, headers])
+        )
+
+        self.assertNotIn("Content-Encoding", dict(start_response_arguments[1]))
+
+    def test_static_file_is_compressed_once(self):
+        response = self.rest_test_app.get("/static/bundle.js", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual("gzip", response.headers["Content-Encoding"])
+        self.assertEqual(_SCRIPT, gzip.decompress(response.content))
+        self.assertNotIn("Accept-Ranges", response.headers)
+        self.assertTrue(response.headers["ETag"].startswith('W/"'))
+        self.assertEqual(1, len(self.response_compression.file_cache))
+
+        second_response = self.rest_test_app.get("/static/bundle.js", headers={"Accept-Encoding": "gzip"})
+        self.assertIs(response.content, second_response.content)
+
+    def test_precompressed_sibling(self):
+        os.utime(os.path.join(self.directory_path, "bundle.js"), (1000000000, 1000000000))
+        self._write_file("bundle.js.gz", b"precompressed")
+
+        response = self.rest_test_app.get("/static/bundle.js", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual("gzip", response.headers["Content-Encoding"])
+        self.assertEqual("text/javascript", response.headers["Content-Type"])
+        self.assertEqual(13, response.headers["Content-Length"])
+        self.assertEqual(b"precompressed", response.content)
+        self.assertEqual(0, len(self.response_compression.file_cache))
+
+    def test_outdated_precompressed_sibling_is_ignored(self):
+        sibling_path = self._write_file("bundle.js.gz", b"outdated")
+        os.utime(sibling_path, (1000000000, 1000000000))
+
+        response = self.rest_test_app.get("/static/bundle.js", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(_SCRIPT, gzip.decompress(response.content))
+
+    def test_large_static_file_is_streamed(self):
+        response = self.rest_test_app.get("/static/large.js", headers={"Accept-Encoding": "deflate"})
+
+        self.assertEqual("deflate", response.headers["Content-Encoding"])
+        self.assertNotIn("Content-Length", response.headers)
+        self.assertEqual(_SCRIPT * 3, zlib.decompress(response.content))
+        self.assertEqual(0, len(self.response_compression.file_cache))
+
+    def test_range_requests_are_not_compressed(self):
+        response = self.rest_test_app.get(
+            "/static/bundle.js", headers={"Accept-Encoding": "gzip", "Range": "bytes=0-7"}
+        )
+
+        self.assertEqual(206, response.status_code)
+        self.assertIsNone(response.headers["Content-Encoding"])
+        self.assertEqual(b"function", response.content)
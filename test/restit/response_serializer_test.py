@@ -236,3 +236,28 @@ class ResponseSerializerTestCase(unittest.TestCase):
     def test_content_type_not_expected_exception(self):
         with self.assertRaises(ResponseSerializer.ContentTypeNotExpectedForResponseStatusException):
             ResponseSerializer.find_schema("hans/wurst", ResponseStatusParameter(HTTPStatus.OK, "", {}))
+
+    def test_negotiation_is_cached(self):
+        statistics = ResponseSerializerService.get_negotiation_cache_statistics()
+        hits, misses = statistics.hits, statistics.misses
+        http_accept = HttpAccept.from_accept_string("text/html,application/json;q=0.9")
+
+        first_decision = ResponseSerializerService.find_response_serializer(http_accept, dict)
+        second_decision = ResponseSerializerService.find_response_serializer(http_accept, dict)
+
+        self.assertIs(first_decision, second_decision)
+        self.assertEqual(hits + 1, statistics.hits)
+        self.assertEqual(misses + 1, statistics.misses)
+
+    def test_negotiation_cache_is_invalidated_on_register(self):
+        http_accept = HttpAccept.from_accept_string("application/json")
+        response_serializer, _ = ResponseSerializerService.find_response_serializer(http_accept, dict)
+        self.assertIsInstance(response_serializer, DefaultDictJsonResponseSerializer)
+
+        ResponseSerializerService.register_response_serializer(DictFallbackResponseSerializer())
+        response_serializer, _ = ResponseSerializerService.find_response_serializer(http_accept, dict)
+        self.assertIsInstance(response_serializer, DictFallbackResponseSerializer)
+
+        ResponseSerializerService.clear_all_response_serializer()
+        with self.assertRaises(NotAcceptable):
+            ResponseSerializerService.find_response_serializer(http_accept, dict)
@@ -0,0 +1,173 @@
+import unittest
+from threading import Thread
+
+from restit import Namespace, Resource, Request, Response, RestItApp, StaticDirectoryResource
+from restit.decorator import path
+from restit.restit_test_app import RestItTestApp
+
+
+@path("/health")
+class HealthResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response("ok")
+
+
+@path("/users/:id<int>")
+class UserResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response(request.path_parameters)
+
+
+@path("/staticfile")
+class ShadowedResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response("shadowed")
+
+
+@path("/plugins/:id")
+class PluginResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response("plugin")
+
+
+@path("/users/:id")
+class AdminUserResource(Resource):
+    def get(self, request: Request) -> Response:
+        return Response("admin")
+
+
+class RestItAppRoutingTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.health_resource = HealthResource()
+        self.user_resource = UserResource()
+        self.static_directory_resource = StaticDirectoryResource("/static", "/some/path")
+        self.restit_app = RestItApp(
+            resources=[self.health_resource, self.user_resource, ShadowedResource(), self.static_directory_resource]
+        )
+        self.restit_app._init()
+
+    def test_static_route(self):
+        self.assertEqual((self.health_resource, {}), self.restit_app._find_resource_for_url("/health"))
+        self.assertEqual((self.health_resource, {}), self.restit_app._find_resource_for_url("/health"))
+
+        self.assertEqual(
+            {
+                "route_kinds": {"static": 2, "dynamic": 0, "not_found": 0},
+                "route_cache": {"hits": 0, "misses": 0, "evictions": 0},
+            },
+            self.restit_app.routing_statistics.to_dict(),
+        )
+
+    def test_dynamic_route(self):
+        self.assertEqual((self.user_resource, {"id": 1}), self.restit_app._find_resource_for_url("/users/1"))
+        self.assertEqual((self.user_resource, {"id": 1}), self.restit_app._find_resource_for_url("/users/1"))
+        self.assertEqual((None, None), self.restit_app._find_resource_for_url("/users/hans"))
+
+        self.assertEqual(
+            {
+                "route_kinds": {"static": 0, "dynamic": 2, "not_found": 1},
+                "route_cache": {"hits": 1, "misses": 2, "evictions": 0},
+            },
+            self.restit_app.routing_statistics.to_dict(),
+        )
+
+    def test_static_route_keeps_precedence_of_preceding_regex_request_mapping(self):
+        self.assertEqual(
+            (self.static_directory_resource, {"file_name": "file"}),
+            self.restit_app._find_resource_for_url("/staticfile"),
+        )
+        self.assertEqual(1, self.restit_app.routing_statistics.route_kinds["static"])
+
+    def test_register_resources_after_init(self):
+        self.assertEqual((None, None), self.restit_app._find_resource_for_url("/plugins/1"))
+        route_cache = self.restit_app.route_cache
+        self.assertEqual(1, len(route_cache))
+
+        plugin_resource = PluginResource()
+        self.restit_app.register_resources([plugin_resource])
+
+        self.assertIsNot(route_cache, self.restit_app.route_cache)
+        self.assertEqual(0, len(self.restit_app.route_cache))
+        self.assertEqual((plugin_resource, {"id": "1"}), self.restit_app._find_resource_for_url("/plugins/1"))
+        self.assertEqual((self.health_resource, {}), self.restit_app._find_resource_for_url("/health"))
+        self.assertEqual({"hits": 0, "misses": 2, "evictions": 0}, self.restit_app.route_cache.statistics.to_dict())
+
+    def test_register_resources_while_routing(self):
+        errors = []
+        registration_done = []
+
+        def route():
+            try:
+                while not registration_done:
+                    resource, path_params = self.restit_app._find_resource_for_url("/users/1")
+                    self.assertEqual((self.user_resource, {"id": 1}), (resource, path_params))
+            except Exception as error:
+                errors.append(error)
+
+        threads = [Thread(target=route) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        resources = []
+        for index in range(50):
+            resource = HealthResource()
+            resource.__request_mapping__ = f"/health/{index}"
+            resources.append(resource)
+            self.restit_app.register_resources([resource])
+        registration_done.append(True)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        for index, resource in enumerate(resources):
+            self.assertEqual((resource, {}), self.restit_app._find_resource_for_url(f"/health/{index}"))
+
+    def test_host_aware_routing(self):
+        admin_user_resource = AdminUserResource()
+        restit_app = RestItApp(
+            resources=[self.health_resource],
+            namespaces=[Namespace("/", [admin_user_resource], host="Admin.example.com")],
+        )
+        restit_app._init()
+
+        self.assertEqual(
+            (admin_user_resource, {"id": "1"}), restit_app._find_resource_for_url("/users/1", "admin.example.com")
+        )
+        self.assertEqual((None, None), restit_app._find_resource_for_url("/users/1", "www.example.com"))
+        self.assertEqual((None, None), restit_app._find_resource_for_url("/users/1"))
+        self.assertEqual((self.health_resource, {}), restit_app._find_resource_for_url("/health", "admin.example.com"))
+        self.assertEqual((self.health_resource, {}), restit_app._find_resource_for_url("/health", "www.example.com"))
+
+        restit_test_app = RestItTestApp.from_restit_app(restit_app)
+        self.assertEqual(200, restit_test_app.get("/users/1", headers={"Host": "admin.example.com:8080"}).status_code)
+        self.assertEqual(404, restit_test_app.get("/users/1", headers={"Host": "www.example.com"}).status_code)
+
+    def test_wrong_method_does_not_enter_handle_request(self):
+        handle_request_calls = []
+
+        class CountingResource(HealthResource):
+            def handle_request(self, request: Request, path_params: dict, handler_plan=None) -> Response:
+                handle_request_calls.append(request)
+                return super().handle_request(request, path_params, handler_plan)
+
+        restit_test_app = RestItTestApp(resources=[CountingResource()])
+
+        response = restit_test_app.post("/health")
+        self.assertEqual(405, response.status_code)
+        self.assertEqual("GET OPTIONS", response.headers["Allow"])
+        self.assertEqual([], handle_request_calls)
+
+        self.assertEqual(200, restit_test_app.get("/health").status_code)
+        self.assertEqual(1, len(handle_request_calls))
+
+    def test_handler_plan_is_looked_up_once(self):
+        handler_plan_lookups = []
+
+        class CountingResource(HealthResource):
+            def _get_handler_plan(self, method_name: str):
+                handler_plan_lookups.append(method_name)
+                return super()._get_handler_plan(method_name)
+
+        restit_test_app = RestItTestApp(resources=[CountingResource()])
+
+        self.assertEqual(200, restit_test_app.get("/health").status_code)
+        self.assertEqual(1, len(handler_plan_lookups))
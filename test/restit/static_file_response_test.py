@@ -1,7 +1,9 @@
+import os
+import tempfile
 import unittest
-from unittest.mock import patch, mock_open
+from wsgiref.util import setup_testing_defaults
 
-from restit import RestItTestApp, Resource, Response, Request
+from restit import RestItApp, RestItTestApp, Resource, Response, Request, StaticDirectoryResource
 from restit.decorator import path
 from restit.static_file_response import StaticFileResponse
 
@@ -13,22 +15,115 @@ class MyResource(Resource):
         return StaticFileResponse(file_path)
 
 
+class RecordingFileWrapper:
+    def __init__(self, file, block_size: int):
+        self.file = file
+        self.block_size = block_size
+
+    def __iter__(self):
+        return iter([self.file.read()])
+
+    def close(self):
+        self.file.close()
+
+
 class StaticFileResourceTestCase(unittest.TestCase):
     def setUp(self) -> None:
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory_path = self.temporary_directory.name
+        self._write_file("path.txt", b"Huhu from file")
+        self._write_file("path.html", b"<title>dummy html</title>")
+        self._write_file("data.bin", bytes(range(256)) * 1024)
         self.rest_test_app = RestItTestApp(resources=[MyResource()])
 
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def _write_file(self, file_name: str, content: bytes):
+        with open(os.path.join(self.directory_path, file_name), "wb") as fp:
+            fp.write(content)
+
+    def _call(self, restit_app: RestItApp, path_info: str, file_wrapper=None):
+        wsgi_environ = {"REQUEST_METHOD": "GET", "PATH_INFO": path_info}
+        setup_testing_defaults(wsgi_environ)
+        if file_wrapper is not None:
+            wsgi_environ["wsgi.file_wrapper"] = file_wrapper
+        start_response_arguments = []
+        body = restit_app(wsgi_environ, lambda status, headers: start_response_arguments.extend([status, headers]))
+        return start_response_arguments[0], dict(start_response_arguments[1]), body
+
     def test_text_file(self):
-        m = mock_open(read_data=b"Huhu from file")
-        with patch("restit.static_file_response.open", m):
-            response = self.rest_test_app.get("/static-response?", json={"file_path": "/some/file/path.txt"})
-            self.assertEqual(200, response.status_code)
-            self.assertEqual("text/plain", response.headers["Content-Type"])
-            self.assertEqual("Huhu from file", response.text)
+        file_path = os.path.join(self.directory_path, "path.txt")
+        response = self.rest_test_app.get("/static-response?", json={"file_path": file_path})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("text/plain", response.headers["Content-Type"])
+        self.assertEqual(14, response.headers["Content-Length"])
+        self.assertEqual("Huhu from file", response.text)
 
     def test_html_file(self):
-        m = mock_open(read_data=b"<title>dummy html</title>")
-        with patch("restit.static_file_response.open", m):
-            response = self.rest_test_app.get("/static-response?", json={"file_path": "/some/file/path.html"})
-            self.assertEqual(200, response.status_code)
-            self.assertEqual("text/html", response.headers["Content-Type"])
-            self.assertEqual("<title>dummy html</title>", response.text)
+        file_path = os.path.join(self.directory_path, "path.html")
+        response = self.rest_test_app.get("/static-response?", json={"file_path": file_path})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("text/html", response.headers["Content-Type"])
+        self.assertEqual("<title>dummy html</title>", response.text)
+
+    def test_file_is_not_negotiated(self):
+        file_path = os.path.join(self.directory_path, "path.html")
+        response = self.rest_test_app.get(
+            "/static-response?", json={"file_path": file_path}, headers={"Accept": "application/json"}
+        )
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("text/html", response.headers["Content-Type"])
+
+    def test_unknown_suffix_is_octet_stream(self):
+        self._write_file("file.unknown", b"data")
+        response = StaticFileResponse(os.path.join(self.directory_path, "file.unknown"))
+        self.assertEqual("application/octet-stream", response.headers["Content-Type"])
+
+    def test_file_is_handed_to_the_wsgi_file_wrapper(self):
+        restit_app = RestItApp(resources=[StaticDirectoryResource("/static", self.directory_path)])
+
+        status, headers, body = self._call(restit_app, "/static/data.bin", RecordingFileWrapper)
+
+        self.assertEqual("200 OK", status)
+        self.assertEqual("262144", headers["Content-Length"])
+        self.assertIsInstance(body, RecordingFileWrapper)
+        self.assertEqual(StaticFileResponse.BLOCK_SIZE, body.block_size)
+        self.assertEqual([bytes(range(256)) * 1024], list(body))
+        body.close()
+        self.assertTrue(body.file.closed)
+
+    def test_file_is_handed_to_a_function_file_wrapper(self):
+        # some servers, like uWSGI, provide the file wrapper as a function
+        def file_wrapper(file, block_size: int) -> RecordingFileWrapper:
+            return RecordingFileWrapper(file, block_size)
+
+        restit_app = RestItApp(resources=[StaticDirectoryResource("/static", self.directory_path)])
+
+        status, headers, body = self._call(restit_app, "/static/data.bin", file_wrapper)
+
+        self.assertEqual("200 OK", status)
+        self.assertIsInstance(body, RecordingFileWrapper)
+        self.assertEqual([bytes(range(256)) * 1024], list(body))
+        body.close()
+
+    def test_file_is_read_in_chunks_without_file_wrapper(self):
+        restit_app = RestItApp(resources=[StaticDirectoryResource("/static", self.directory_path)])
+
+        status, headers, body = self._call(restit_app, "/static/data.bin")
+
+        chunks = list(body)
+        body.close()
+        self.assertEqual("application/octet-stream", headers["Content-Type"])
+        self.assertEqual(4, len(chunks))
+        self.assertEqual(bytes(range(256)) * 1024, b"".join(chunks))
+
+    def test_static_directory_entry_file(self):
+        self._write_file("index.html", b"<html>index</html>")
+        rest_test_app = RestItTestApp(resources=[StaticDirectoryResource("/static", self.directory_path)])
+
+        response = rest_test_app.get("/static/")
+
+        self.assertEqual("text/html", response.headers["Content-Type"])
+        self.assertEqual(18, response.headers["Content-Length"])
+        self.assertEqual("<html>index</html>", response.text)
@@ -0,0 +1,44 @@
+import tracemalloc
+import unittest
+from wsgiref.util import setup_testing_defaults
+
+from restit import Request, Resource, RestItApp, StreamingResponse
+from restit.decorator import path
+
+_EXPORT_SIZE = 1024 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+_ROWS = b"".join(b"%08d,some exported value,42.0\n" % index for index in range(_CHUNK_SIZE // 32))
+
+
+def _generate_export():
+    for index in range(_EXPORT_SIZE // len(_ROWS)):
+        # a new chunk each time, like rows read from a database cursor
+        yield b"%d\n" % index + _ROWS
+
+
+@path("/export")
+class ExportResource(Resource):
+    def get(self, request: Request) -> StreamingResponse:
+        return StreamingResponse(_generate_export(), headers={"Content-Type": "text/csv"})
+
+
+class StreamingResponseMemoryTestCase(unittest.TestCase):
+    def test_streamed_export_is_not_held_in_memory(self):
+        restit_app = RestItApp(resources=[ExportResource()])
+        wsgi_environ = {"REQUEST_METHOD": "GET", "PATH_INFO": "/export"}
+        setup_testing_defaults(wsgi_environ)
+
+        tracemalloc.start()
+        try:
+            body = restit_app(wsgi_environ, lambda status, headers: None)
+            size = 0
+            for chunk in body:
+                size += len(chunk)
+            body.close()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertGreaterEqual(size, _EXPORT_SIZE - len(_ROWS))
+        # the buffered response would need more than 1 GiB
+        self.assertLess(peak, 4 * 1024 * 1024)
@@ -0,0 +1,86 @@
+import unittest
+from wsgiref.util import setup_testing_defaults
+
+from restit import Request, Resource, RestItApp, RestItTestApp, StreamingResponse
+from restit.decorator import path
+
+_events = []
+
+
+def _generate_rows(count: int):
+    try:
+        for index in range(count):
+            yield f"{index},row {index}\n"
+    finally:
+        _events.append("closed")
+
+
+@path("/export.csv")
+class CsvExportResource(Resource):
+    def get(self, request: Request) -> StreamingResponse:
+        return StreamingResponse(_generate_rows(3), headers={"Content-Type": "text/csv"})
+
+
+@path("/items")
+class ItemsResource(Resource):
+    def get(self, request: Request) -> StreamingResponse:
+        return StreamingResponse(({"id": index} for index in range(3)), item_type=dict)
+
+
+@path("/bytes")
+class BytesResource(Resource):
+    def get(self, request: Request) -> StreamingResponse:
+        return StreamingResponse(iter([b"\x00\x01", b"\x02"]))
+
+
+class StreamingResponseTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        _events.clear()
+        self.resources = [CsvExportResource(), ItemsResource(), BytesResource()]
+        self.restit_app = RestItApp(resources=self.resources)
+
+    def _call(self, path: str, accept: str = "*/*"):
+        wsgi_environ = {"REQUEST_METHOD": "GET", "PATH_INFO": path, "HTTP_ACCEPT": accept}
+        setup_testing_defaults(wsgi_environ)
+        start_response_arguments = []
+        body = self.restit_app(wsgi_environ, lambda status, headers: start_response_arguments.extend([status, headers]))
+        return start_response_arguments[0], dict(start_response_arguments[1]), body
+
+    def test_chunks_are_produced_while_iterating(self):
+        status, headers, body = self._call("/export.csv")
+
+        self.assertEqual("200 OK", status)
+        self.assertEqual("text/csv", headers["Content-Type"])
+        self.assertNotIn("Content-Length", headers)
+        self.assertEqual(b"0,row 0\n", next(body))
+        self.assertEqual([b"1,row 1\n", b"2,row 2\n"], list(body))
+        body.close()
+        self.assertEqual(["closed"], _events)
+
+    def test_client_disconnect_closes_the_generator(self):
+        _, _, body = self._call("/export.csv")
+
+        next(body)
+        self.assertEqual([], _events)
+        body.close()
+        self.assertEqual(["closed"], _events)
+
+    def test_items_are_serialized_one_by_one(self):
+        _, headers, body = self._call("/items", "application/json")
+
+        self.assertEqual("application/json", headers["Content-Type"])
+        self.assertEqual([b'{"id": 0}\n', b'{"id": 1}\n', b'{"id": 2}\n'], list(body))
+
+    def test_bytes_default_to_octet_stream(self):
+        _, headers, body = self._call("/bytes")
+
+        self.assertEqual("application/octet-stream", headers["Content-Type"])
+        self.assertEqual([b"\x00\x01", b"\x02"], list(body))
+
+    def test_restit_test_app_reads_the_streamed_body(self):
+        response = RestItTestApp(resources=self.resources).get("/export.csv")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("0,row 0\n1,row 1\n2,row 2\n", response.text)
+        self.assertNotIn("Content-Length", response.headers)
+        self.assertEqual(["closed"], _events)
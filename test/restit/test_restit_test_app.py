@@ -166,6 +166,15 @@ class RestitTestAppTestCase(unittest.TestCase):
         self.assertEqual(405, self.resit_test_app.patch("/no_methods").status_code)
         self.assertEqual(204, self.resit_test_app.options("/no_methods").status_code)
 
+    def test_method_not_allowed_allow_header(self):
+        response = self.resit_test_app.post("/miau/10")
+        self.assertEqual(405, response.status_code)
+        self.assertEqual("GET OPTIONS", response.headers["Allow"])
+
+        response = self.resit_test_app._get_response_for_method("/no_methods", None, None, None, "PROPFIND")
+        self.assertEqual(405, response.status_code)
+        self.assertEqual("OPTIONS", response.headers["Allow"])
+
     def test_raise_if_enabled(self):
         self.resit_test_app.raise_exceptions = True
         with self.assertRaises(MethodNotAllowed):
@@ -182,7 +191,9 @@ class RestitTestAppTestCase(unittest.TestCase):
             self.assertEqual(405, self.resit_test_app.patch("/no_methods").status_code)
 
     def test_pass_headers(self):
-        response = self.resit_test_app.get("/pass_headers", headers={"Accept-Charset": "utf-8"})
+        response = self.resit_test_app.get(
+            "/pass_headers", headers={"Accept-Charset": "utf-8", "Content-Encoding": "gzip, deflate"}
+        )
         self.assertEqual(200, response.status_code)
         self.assertEqual(
             {